@@ -7,20 +7,14 @@ import time
 from lib_displays.vk16k33display import VK16K33Display
 from sensor_pack_2.bus_service import I2cAdapter
 from lib_displays.vk16k33mod import VK16K33
+from lib_displays.marquee_mod import Marquee
+from lib_displays.alphabet_mod import get_alphabet
 
-# используемый язык
+# используемый язык ('en', 'ru'). Несколько языков одновременно: VK16K33Display(controller, ('ru', 'en'))
 lang = 'en'
 
-_alpha_letters = None
-
-if 'en' == lang:
-    # english letters
-    from lib_displays.en_lang_14_seg import eng_to_14segments
-    _alpha_letters = eng_to_14segments
-if 'ru' == lang:
-    # русские буквы
-    from lib_displays.ru_lang_14_seg import ru_to_14segments
-    _alpha_letters = ru_to_14segments
+# таблицы алфавита загружаются только для выбранного языка
+_alpha_letters = get_alphabet(lang)
 
 wait_func = time.sleep_ms
 
@@ -62,4 +56,9 @@ if __name__ == "__main__":
         cnt+=1
         wait_func(3000)
 
+    display_controller.blink(0)
+    # бегущая строка: текст кодируется один раз, затем по нему сдвигается окно
+    marquee = Marquee(display, demo_source_14seg, step=1, period_ms=250)
+    marquee.run(cycles=1)
+
     display.clear()
\ No newline at end of file
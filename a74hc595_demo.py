@@ -36,7 +36,7 @@ def run():
     for _ in range(10_000):
         digits = get_rnd_4digit()
         print(digits)
-        display.show_by_pos(str(digits))
+        display.show_int(digits)
         time.sleep_ms(3_000)
 
 
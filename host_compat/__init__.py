@@ -0,0 +1,95 @@
+"""Запуск lib_displays и sensor_pack_2 под CPython (Linux, Windows) без изменений.
+Подставляет модули machine, micropython, framebuf и добавляет в модули time и gc функции MicroPython.
+
+Использование (до импорта модулей проекта):
+    import host_compat
+    host_compat.install()
+Под MicroPython install ничего не делает."""
+
+# MIT license
+
+import sys
+import time
+import gc
+
+# период счетчиков time.ticks_*, как в MicroPython
+TICKS_PERIOD = 1 << 30
+_TICKS_HALF = TICKS_PERIOD >> 1
+
+_installed = False
+
+
+def ticks_diff(ticks1: int, ticks2: int) -> int:
+    """Разность моментов времени ticks1 - ticks2 с учетом переполнения счетчика"""
+    return ((ticks1 - ticks2 + _TICKS_HALF) % TICKS_PERIOD) - _TICKS_HALF
+
+
+def ticks_add(ticks: int, delta: int) -> int:
+    """Момент времени ticks + delta с учетом переполнения счетчика"""
+    return (ticks + delta) % TICKS_PERIOD
+
+
+def ticks_us() -> int:
+    return time.perf_counter_ns() // 1_000 % TICKS_PERIOD
+
+
+def ticks_ms() -> int:
+    return time.perf_counter_ns() // 1_000_000 % TICKS_PERIOD
+
+
+def ticks_cpu() -> int:
+    return time.perf_counter_ns() % TICKS_PERIOD
+
+
+def _sleep_ms(ms: int):
+    time.sleep(ms / 1_000)
+
+
+def _sleep_us(us: int):
+    time.sleep(us / 1_000_000)
+
+
+def _no_sleep(value: int):
+    pass
+
+
+def _mem_alloc() -> int:
+    """Объем памяти, выделенной интерпретатором (tracemalloc). В отличие от MicroPython, освобожденная память
+    вычитается сразу, даже при отключенном сборщике мусора, поэтому временные объекты не учитываются."""
+    import tracemalloc
+    if not tracemalloc.is_tracing():
+        tracemalloc.start()
+    return tracemalloc.get_traced_memory()[0]
+
+
+def _mem_free() -> int:
+    return 1 << 20
+
+
+def install(real_sleep: bool = True):
+    """Подставляет модули machine, micropython, framebuf и дополняет модули time и gc.
+    :param real_sleep: если Ложь, то time.sleep_ms и time.sleep_us возвращаются немедленно
+    (нагрузочные испытания, тысячи дисплеев)."""
+    global _installed
+    if "micropython" == sys.implementation.name:
+        return
+    from host_compat import machine, micropython, framebuf
+    sys.modules.setdefault("machine", machine)
+    sys.modules.setdefault("micropython", micropython)
+    sys.modules.setdefault("framebuf", framebuf)
+    time.ticks_us = ticks_us
+    time.ticks_ms = ticks_ms
+    time.ticks_cpu = ticks_cpu
+    time.ticks_diff = ticks_diff
+    time.ticks_add = ticks_add
+    time.sleep_ms = _sleep_ms if real_sleep else _no_sleep
+    time.sleep_us = _sleep_us if real_sleep else _no_sleep
+    if not hasattr(gc, "mem_alloc"):
+        gc.mem_alloc = _mem_alloc
+        gc.mem_free = _mem_free
+    _installed = True
+
+
+def is_installed() -> bool:
+    """Возвращает Истина, если install была вызвана под CPython"""
+    return _installed
@@ -0,0 +1,104 @@
+"""Замена модуля framebuf для CPython. Только монохромные форматы (MONO_VLSB, MONO_HLSB, MONO_HMSB)
+и основные методы рисования. Метод text не поддерживается (нет встроенного шрифта)."""
+
+# MIT license
+
+MONO_VLSB = 0
+MONO_HLSB = 3
+MONO_HMSB = 4
+MVLSB = MONO_VLSB
+
+
+class FrameBuffer:
+    """Монохромный буфер кадра поверх объекта buf, поддерживающего протокол буфера"""
+
+    def __init__(self, buf, width: int, height: int, fmt: int, stride: int = None):
+        if fmt not in (MONO_VLSB, MONO_HLSB, MONO_HMSB):
+            raise ValueError(f"Формат не поддерживается: {fmt}")
+        self._buf = memoryview(buf).cast("B")
+        self._width = width
+        self._height = height
+        self._format = fmt
+        self._stride = width if stride is None else stride
+
+    def _locate(self, x: int, y: int) -> tuple:
+        """Возвращает индекс байта и маску бита точки x, y"""
+        fmt = self._format
+        if MONO_VLSB == fmt:
+            return (y >> 3) * self._stride + x, 1 << (y & 7)
+        index = (y * self._stride + x) >> 3
+        bit = x & 7
+        if MONO_HLSB == fmt:
+            return index, 0x80 >> bit
+        return index, 1 << bit
+
+    def pixel(self, x: int, y: int, c: int = None):
+        if not (0 <= x < self._width and 0 <= y < self._height):
+            return None
+        index, mask = self._locate(x, y)
+        buf = self._buf
+        if c is None:
+            return 1 if buf[index] & mask else 0
+        if c:
+            buf[index] |= mask
+        else:
+            buf[index] &= ~mask & 0xFF
+
+    def fill_rect(self, x: int, y: int, w: int, h: int, c: int):
+        for yy in range(max(y, 0), min(y + h, self._height)):
+            for xx in range(max(x, 0), min(x + w, self._width)):
+                self.pixel(xx, yy, c)
+
+    def fill(self, c: int):
+        self.fill_rect(0, 0, self._width, self._height, c)
+
+    def hline(self, x: int, y: int, w: int, c: int):
+        self.fill_rect(x, y, w, 1, c)
+
+    def vline(self, x: int, y: int, h: int, c: int):
+        self.fill_rect(x, y, 1, h, c)
+
+    def rect(self, x: int, y: int, w: int, h: int, c: int, f: bool = False):
+        if f:
+            self.fill_rect(x, y, w, h, c)
+            return
+        self.hline(x, y, w, c)
+        self.hline(x, y + h - 1, w, c)
+        self.vline(x, y, h, c)
+        self.vline(x + w - 1, y, h, c)
+
+    def line(self, x1: int, y1: int, x2: int, y2: int, c: int):
+        dx, dy = abs(x2 - x1), -abs(y2 - y1)
+        sx = 1 if x1 < x2 else -1
+        sy = 1 if y1 < y2 else -1
+        err = dx + dy
+        while True:
+            self.pixel(x1, y1, c)
+            if x1 == x2 and y1 == y2:
+                break
+            e2 = 2 * err
+            if e2 >= dy:
+                err += dy
+                x1 += sx
+            if e2 <= dx:
+                err += dx
+                y1 += sy
+
+    def scroll(self, xstep: int, ystep: int):
+        w, h = self._width, self._height
+        pixels = [[self.pixel(x, y) for x in range(w)] for y in range(h)]
+        for y in range(h):
+            for x in range(w):
+                sx, sy = x - xstep, y - ystep
+                if 0 <= sx < w and 0 <= sy < h:
+                    self.pixel(x, y, pixels[sy][sx])
+
+    def blit(self, fbuf, x: int, y: int, key: int = -1):
+        for yy in range(fbuf._height):
+            for xx in range(fbuf._width):
+                c = fbuf.pixel(xx, yy)
+                if c != key:
+                    self.pixel(x + xx, y + yy, c)
+
+    def text(self, s: str, x: int, y: int, c: int = 1):
+        raise NotImplementedError("framebuf.text: встроенного шрифта нет")
@@ -0,0 +1,264 @@
+"""Замена модуля machine для CPython. Шины не передают данные, а считают транзакции и байты и, если record Истина,
+записывают переданные данные в журнал log. Чтение возвращает нули или данные, заданные методом set_rx.
+Байты считаются одинаково для всех шин: все байты после байта адреса устройства I2C (для writeto_mem - вместе
+с адресом памяти). Шины с record в Ложь не выделяют память при записи, поэтому модуль используется и на плате
+с MicroPython, для счета обмена в seg_bench."""
+
+# MIT license
+
+
+class _Recorder:
+    """Счетчик и журнал обмена"""
+
+    def __init__(self, record: bool = True):
+        # если Истина, то переданные данные записываются в журнал
+        self.record = record
+        self.log = []
+        self.transactions = 0
+        self.bytes = 0
+
+    def _count(self, n_bytes: int) -> bool:
+        """Учитывает транзакцию из n_bytes байт. Возвращает Истина, если ее данные нужно записать в журнал"""
+        self.transactions += 1
+        self.bytes += n_bytes
+        return self.record
+
+    def reset(self):
+        """Обнуляет счетчики и журнал"""
+        self.log = []
+        self.transactions = 0
+        self.bytes = 0
+
+
+class Pin:
+    """Вывод МК. Запоминает значение и, если record Истина, записывает все установленные значения в журнал log."""
+    IN = 0
+    OUT = 1
+    OPEN_DRAIN = 2
+    PULL_UP = 1
+    PULL_DOWN = 2
+    IRQ_FALLING = 4
+    IRQ_RISING = 8
+
+    def __init__(self, id=None, mode: int = -1, pull: int = -1, *, value=None, record: bool = True, **kwargs):
+        self.id = id
+        self.record = record
+        self.log = []
+        self._value = 0 if value is None else int(bool(value))
+
+    def init(self, mode: int = -1, pull: int = -1, *, value=None, **kwargs):
+        if value is not None:
+            self.value(value)
+
+    def value(self, val=None):
+        if val is None:
+            return self._value
+        self._value = int(bool(val))
+        if self.record:
+            self.log.append(self._value)
+
+    def __call__(self, val=None):
+        return self.value(val)
+
+    def on(self):
+        self.value(1)
+
+    def off(self):
+        self.value(0)
+
+    def irq(self, handler=None, trigger: int = 0, **kwargs):
+        return None
+
+    def __repr__(self):
+        return f"Pin({self.id})"
+
+
+class _RxSource:
+    """Источник принимаемых данных: повторяющийся шаблон, по умолчанию нули"""
+
+    def __init__(self):
+        self._rx = b"\x00"
+
+    def set_rx(self, data: bytes):
+        """Задает данные, которые возвращаются при чтении (повторяются по кругу)"""
+        self._rx = bytes(data) if data else b"\x00"
+
+    def _fill(self, buf):
+        rx = self._rx
+        for i in range(len(buf)):
+            buf[i] = rx[i % len(rx)]
+        return buf
+
+
+class I2C(_Recorder, _RxSource):
+    """Шина I2C. Журнал: (адрес, переданные байты); для writeto_mem байты начинаются с адреса регистра."""
+
+    def __init__(self, id=None, *, scl=None, sda=None, freq: int = 400_000, timeout: int = 50_000,
+                 record: bool = True):
+        _Recorder.__init__(self, record)
+        _RxSource.__init__(self)
+        self.id = id
+        self.freq = freq
+
+    def scan(self) -> list:
+        return sorted({entry[0] for entry in self.log})
+
+    def writeto(self, addr: int, buf, stop: bool = True) -> int:
+        if self._count(len(buf)):
+            self.log.append((addr, bytes(buf)))
+        return 1
+
+    def writevto(self, addr: int, vector, stop: bool = True) -> int:
+        n_bytes = 0
+        for buf in vector:
+            n_bytes += len(buf)
+        if self._count(n_bytes):
+            self.log.append((addr, b"".join(bytes(buf) for buf in vector)))
+        return 1
+
+    def writeto_mem(self, addr: int, memaddr: int, buf, *, addrsize: int = 8):
+        if self._count(addrsize // 8 + len(buf)):
+            self.log.append((addr, bytes((memaddr & 0xFF,)) + bytes(buf)))
+
+    def readfrom(self, addr: int, nbytes: int, stop: bool = True) -> bytes:
+        self.transactions += 1
+        return bytes(self._fill(bytearray(nbytes)))
+
+    def readfrom_into(self, addr: int, buf, stop: bool = True):
+        self.transactions += 1
+        self._fill(buf)
+
+    def readfrom_mem(self, addr: int, memaddr: int, nbytes: int, *, addrsize: int = 8) -> bytes:
+        self.transactions += 1
+        return bytes(self._fill(bytearray(nbytes)))
+
+    def readfrom_mem_into(self, addr: int, memaddr: int, buf, *, addrsize: int = 8):
+        self.transactions += 1
+        self._fill(buf)
+
+
+SoftI2C = I2C
+
+
+class SPI(_Recorder, _RxSource):
+    """Шина SPI. Журнал: переданные байты"""
+    MSB = 0
+    LSB = 1
+
+    def __init__(self, id=None, baudrate: int = 1_000_000, *, polarity: int = 0, phase: int = 0, bits: int = 8,
+                 firstbit: int = 0, sck=None, mosi=None, miso=None, record: bool = True, **kwargs):
+        _Recorder.__init__(self, record)
+        _RxSource.__init__(self)
+        self.id = id
+        self.baudrate = baudrate
+
+    def init(self, baudrate: int = None, **kwargs):
+        if baudrate is not None:
+            self.baudrate = baudrate
+
+    def deinit(self):
+        pass
+
+    def write(self, buf):
+        if self._count(len(buf)):
+            self.log.append(bytes(buf))
+
+    def read(self, nbytes: int, write: int = 0x00) -> bytes:
+        self.transactions += 1
+        return bytes(self._fill(bytearray(nbytes)))
+
+    def readinto(self, buf, write: int = 0x00):
+        self.transactions += 1
+        self._fill(buf)
+
+    def write_readinto(self, write_buf, read_buf):
+        if self._count(len(write_buf)):
+            self.log.append(bytes(write_buf))
+        self._fill(read_buf)
+
+
+SoftSPI = SPI
+
+
+class UART(_Recorder, _RxSource):
+    """Последовательный порт. Журнал: переданные байты"""
+
+    def __init__(self, id=None, baudrate: int = 9600, bits: int = 8, parity=None, stop: int = 1, *,
+                 record: bool = True, **kwargs):
+        _Recorder.__init__(self, record)
+        _RxSource.__init__(self)
+        self.id = id
+        self.baudrate = baudrate
+
+    def init(self, baudrate: int = None, **kwargs):
+        if baudrate is not None:
+            self.baudrate = baudrate
+
+    def deinit(self):
+        pass
+
+    def write(self, buf) -> int:
+        if self._count(len(buf)):
+            self.log.append(bytes(buf))
+        return len(buf)
+
+    def any(self) -> int:
+        return 0
+
+    def read(self, nbytes: int = None):
+        return None
+
+    def flush(self):
+        pass
+
+
+class Timer:
+    """Таймер. Обработчик прерывания не вызывается сам, его вызывает метод fire."""
+    ONE_SHOT = 0
+    PERIODIC = 1
+
+    def __init__(self, id=-1, **kwargs):
+        self.id = id
+        self.callback = None
+        self.freq = None
+        self.mode = None
+        if kwargs:
+            self.init(**kwargs)
+
+    def init(self, *, mode: int = PERIODIC, freq: float = None, period: int = None, callback=None, **kwargs):
+        self.mode = mode
+        self.freq = freq if freq is not None else (1000 / period if period else None)
+        self.callback = callback
+
+    def deinit(self):
+        self.callback = None
+
+    def fire(self, count: int = 1):
+        """Вызывает обработчик прерывания count раз"""
+        for _ in range(count):
+            callback = self.callback
+            if callback is None:
+                break
+            callback(self)
+            if Timer.ONE_SHOT == self.mode:
+                self.callback = None
+
+
+def freq(value: int = None) -> int:
+    return 160_000_000
+
+
+def unique_id() -> bytes:
+    return b"\x00host\x00"
+
+
+def reset():
+    raise SystemExit
+
+
+def disable_irq() -> int:
+    return 0
+
+
+def enable_irq(state: int = 0):
+    pass
@@ -0,0 +1,52 @@
+"""Замена модуля micropython для CPython. Декораторы генераторов кода ничего не делают."""
+
+# MIT license
+
+
+def const(value):
+    """Возвращает value"""
+    return value
+
+
+def native(func):
+    """Возвращает func без изменений"""
+    return func
+
+
+def viper(func):
+    """Возвращает func без изменений. Типы viper (ptr8, ptr16, ptr32) НЕ определены, поэтому модули определяют
+    функции viper только в MicroPython (sys.implementation.name) и под CPython используют запасной вариант на Python."""
+    return func
+
+
+def asm_thumb(func):
+    """Возвращает func без изменений"""
+    return func
+
+
+def alloc_emergency_exception_buf(size: int):
+    """Ничего не делает"""
+
+
+def schedule(func, arg):
+    """Вызывает func(arg) немедленно"""
+    func(arg)
+    return True
+
+
+def opt_level(level: int = None):
+    """Возвращает 0"""
+    return 0
+
+
+def mem_info(verbose: bool = False):
+    """Ничего не делает"""
+
+
+def heap_lock():
+    """Ничего не делает"""
+
+
+def heap_unlock():
+    """Ничего не делает. Возвращает 0"""
+    return 0
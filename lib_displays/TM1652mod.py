@@ -36,6 +36,16 @@ def _reverse4bits(n : int) -> int:
 
 
 class TM1652(ICharDisplayController):
+    """Программное представление TM1652. Управляется одной линией (UART, 8 бит данных, бит четности, стоп бит).
+    Между командами TM1652 требуется пауза, ее продолжительность вычисляется по скорости порта и длине команды.
+    По умолчанию команда ожидает окончания паузы и передается сразу: изображение обновляется к возврату из метода
+    без периодических вызовов poll (прежнее поведение).
+    Если включен режим отложенной передачи (deferred), то команды не ждут окончания паузы: если пауза еще не истекла,
+    то команда откладывается, причем отложенные коды символов (set_all) и отложенная яркость/включение
+    (set_brightness, set_shutdown) хранятся по одной, последняя заменяет предыдущую. Отложенные команды передаются
+    в порядке поступления, при следующих вызовах методов, методом poll (вызывайте его периодически)
+    или flush_pending (блокирующее ожидание). Режим отложенной передачи включает AsyncCharDisplay, который вызывает poll
+    в ожидании готовности."""
     CMD_SET_DIGITS = micropython.const(0x08)
     # установка яркости
     CMD_SET_BRIGHTNESS = micropython.const(0x18)
@@ -43,14 +53,24 @@ class TM1652(ICharDisplayController):
     CMD_RESET_AFTER_PWR_ON = micropython.const(0x01)
     BRIGHTNESS_ON_BIT = micropython.const(0x10)
     CMD_OFF_DISPLAY = micropython.const(0xEF)
+    # флаги отложенных команд
+    _PENDING_DIGITS = micropython.const(0x01)
+    _PENDING_BRIGHTNESS = micropython.const(0x02)
 
-    def __init__(self, uart: UART, delay_ms: int = 4):
+    def __init__(self, uart: UART, delay_ms: int = 4, baudrate: int = 19200, frame_bits: int = 11,
+                 deferred: bool = False):
         """
         :param uart: настроенный последовательный порт RS-232
-        :param delay_ms: задержка в мс., после операции записи в порт self._uart, необходима для правильной работы TM1652
+        :param delay_ms: пауза в мс., после окончания передачи команды в порт self._uart, необходима для правильной работы TM1652
+        :param baudrate: скорость порта uart в бод
+        :param frame_bits: количество бит на один байт в линии: старт бит, 8 бит данных, бит четности, стоп бит
+        :param deferred: если Истина, то команды, поступившие во время паузы, откладываются (смотри описание класса)
         """
+        check_value(baudrate, range(1, 1_000_001), f"Скорость порта вне диапазона: {baudrate}")
         self._uart = uart
         self._delay = delay_ms
+        # время передачи одного байта по линии в мкс, с округлением вверх
+        self._byte_time_us = (frame_bits * 1_000_000 + baudrate - 1) // baudrate
         # количество знакомест дисплея в ширину
         self._columns = None
         # количество знакомест дисплея в высоту
@@ -59,12 +79,82 @@ class TM1652(ICharDisplayController):
         self._brightness = 3
         self._digit_buffer = bytearray(5)  # буфер для чисел времени
         self._bright_buffer = bytearray(2)  # буфер для пересылки яркости
-        #
-        self._send_cmd(bytearray((TM1652.CMD_RESET_AFTER_PWR_ON,)))
+        # теневая копия регистра яркости/включения: последнее переданное значение. None - неизвестно
+        self._bright_reg = None
+        # момент времени (time.ticks_us), после которого TM1652 готов принять следующую команду
+        self._ready_at = time.ticks_us()
+        # флаги отложенных команд (_PENDING_DIGITS, _PENDING_BRIGHTNESS)
+        self._pending = 0
+        # флаг отложенной команды, поступившей первой
+        self._pending_first = 0
+        # режим отложенной передачи
+        self._deferred = deferred
 
-    def _send_cmd(self, buf: bytes):
+    def is_deferred(self) -> bool:
+        """Возвращает Истина, если команды, поступившие во время паузы, откладываются."""
+        return self._deferred
+
+    def set_deferred(self, value: bool):
+        """Включает/выключает режим отложенной передачи. При выключении отложенные команды передаются."""
+        self._deferred = value
+        if not value:
+            self.flush_pending()
+
+    def get_busy_us(self) -> int:
+        """Возвращает время в мкс, через которое TM1652 будет готов принять следующую команду. 0 - готов."""
+        remains = time.ticks_diff(self._ready_at, time.ticks_us())
+        return remains if remains > 0 else 0
+
+    def get_gap_us(self, length: int) -> int:
+        """Возвращает минимальный интервал в мкс между началом передачи команды длиной length байт и началом
+        передачи следующей команды: время передачи по линии плюс пауза delay_ms."""
+        return length * self._byte_time_us + 1000 * self._delay
+
+    def _write_now(self, buf: bytes):
+        """Передает buf в порт и вычисляет момент готовности к следующей команде."""
         self._uart.write(buf)
-        time.sleep_ms(self._delay)
+        self._ready_at = time.ticks_add(time.ticks_us(), self.get_gap_us(len(buf)))
+
+    def _send_cmd(self, buf: bytes):
+        """Передает команду в порт, не откладывая ее. Отложенные команды передаются перед ней.
+        Если пауза после предыдущей команды еще не истекла, то ее окончание ожидается."""
+        self.flush_pending()
+        busy = self.get_busy_us()
+        if busy:
+            time.sleep_us(busy)
+        self._write_now(buf)
+
+    def poll(self) -> bool:
+        """Передает одну отложенную команду (в порядке поступления), если пауза после предыдущей команды истекла.
+        Возвращает Истина, если остались отложенные команды."""
+        pending = self._pending
+        if pending and 0 == self.get_busy_us():
+            flag = self._pending_first if pending & self._pending_first else pending
+            if TM1652._PENDING_DIGITS == flag:
+                self._write_now(self._digit_buffer)
+            else:
+                flag = TM1652._PENDING_BRIGHTNESS
+                self._write_now(self._bright_buffer)
+                self._bright_reg = self._bright_buffer[1]
+            pending &= ~flag
+            self._pending = self._pending_first = pending
+        return 0 != pending
+
+    def flush_pending(self):
+        """Передает все отложенные команды, ожидая окончания пауз между ними."""
+        while self.poll():
+            time.sleep_us(self.get_busy_us())
+
+    def _enqueue(self, flag: int):
+        """Помечает команду как отложенную и передает ее: в режиме отложенной передачи - только если TM1652 готов,
+        иначе - ожидая окончания паузы."""
+        if not self._pending:
+            self._pending_first = flag
+        self._pending |= flag
+        if self._deferred:
+            self.poll()
+        else:
+            self.flush_pending()
 
     def _fast_write(self, buf: bytes):
         """Записывает(быстро) в порт сырые данные из buf, где buf:bytearray длиной 5(ПЯТЬ) байт.
@@ -75,25 +165,51 @@ class TM1652(ICharDisplayController):
         self._send_cmd(buf)
 
     def set_all(self, char_codes: bytes):
-        """для контроллеров, не поддерживающих запись в отдельные позиции."""
+        """для контроллеров, не поддерживающих запись в отдельные позиции.
+        Если TM1652 не готов, то команда откладывается (смотри описание класса)."""
         buf = self._digit_buffer
+        if len(buf) - 1 != len(char_codes):
+            raise ValueError(f"Длина char_codes должна равняться {len(buf) - 1} байтам!")
         buf[0] = TM1652.CMD_SET_DIGITS
         buf[1:] = char_codes
-        self._fast_write(buf)
+        self._enqueue(TM1652._PENDING_DIGITS)
+
+    def fill(self, char_code: int):
+        """Записывает код символа char_code во все знакоместа. Смотри set_all."""
+        buf = self._digit_buffer
+        buf[0] = TM1652.CMD_SET_DIGITS
+        for i in range(1, len(buf)):
+            buf[i] = char_code
+        self._enqueue(TM1652._PENDING_DIGITS)
 
     def _set_shutdown_brightness(self, destination: bytearray, shutdown: bool, brightness: int):
-        """Общий код для методов: set_shutdown, set_brightness"""
-        buf = destination
-        buf[0] = TM1652.CMD_SET_BRIGHTNESS  # команда управления дисплеем и яркостью
+        """Общий код для методов: set_shutdown, set_brightness.
+        Если значение регистра совпадает с переданным ранее, то команда не передается, а отложенная команда отменяется."""
         if shutdown:
             # ВЫКЛючить дисплей - сбросить бит включения (бит 4 = 0)
-            buf[1] = TM1652.CMD_OFF_DISPLAY & brightness
+            reg = TM1652.CMD_OFF_DISPLAY & brightness
         else:
             # ВКЛючить дисплей с яркостью brightness
-            buf[1] = TM1652.BRIGHTNESS_ON_BIT | (_reverse4bits(brightness) & 0x0F)
-        #
-        self._send_cmd(buf)
+            reg = TM1652.BRIGHTNESS_ON_BIT | (_reverse4bits(brightness) & 0x0F)
         self._brightness = brightness
+        if reg == self._bright_reg:
+            self._pending &= ~TM1652._PENDING_BRIGHTNESS
+            self._pending_first = self._pending
+            return
+        buf = destination
+        buf[0] = TM1652.CMD_SET_BRIGHTNESS  # команда управления дисплеем и яркостью
+        buf[1] = reg
+        self._enqueue(TM1652._PENDING_BRIGHTNESS)
+
+    # IDisplayController
+    def resync(self):
+        """Повторно передает значение регистра яркости/включения, если оно было установлено ранее."""
+        reg = self._bright_reg
+        if reg is not None and not self._pending & TM1652._PENDING_BRIGHTNESS:
+            buf = self._bright_buffer
+            buf[0] = TM1652.CMD_SET_BRIGHTNESS
+            buf[1] = reg
+            self._enqueue(TM1652._PENDING_BRIGHTNESS)
 
     def get_brightness(self) -> int:
         """Возвращает значение установленной ранее яркости"""
@@ -119,18 +235,23 @@ class TM1652(ICharDisplayController):
         self._set_shutdown_brightness(buf, value, self.get_brightness())
 
     def init(self, columns: int, rows: int, value: int = 0):
-        """Первоначальная настройка дисплея. Вызывать сразу после конструктора!"""
+        """Первоначальная настройка дисплея. Вызывать сразу после конструктора! Команда сброса передается только здесь."""
         if columns <= 0 or rows <= 0:
             raise ValueError(f"Неверное значение строк: {rows} или столбцов: {columns}!")
         self._columns = columns
-        self._rows = columns
+        self._rows = rows
         #
         self._send_cmd(bytearray((TM1652.CMD_RESET_AFTER_PWR_ON,)))  # команда включения, документация TM1652
-        #
+        self._bright_reg = None
+        # последовательные команды яркости/включения объединяются в одну
+        deferred = self._deferred
+        self._deferred = True
         self.set_shutdown(True)  # ВЫКлючаю дисплей
         self.set_brightness(7 // 2)
         # self.clear()
         self.set_shutdown(False) # ВКлючаю дисплей
+        self._deferred = deferred
+        self.flush_pending()
 
     def get_columns(self) -> int:
         """Возвращает кол-во столбцов элементов дисплея."""
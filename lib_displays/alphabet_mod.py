@@ -0,0 +1,97 @@
+"""Компактные таблицы алфавитов 14-ти сегментного индикатора (VK16K33Display)."""
+
+# micropython
+# MIT license
+
+from micropython import const
+
+# значение в таблице для символа, который алфавит не отображает
+code_undefined = const(0xFFFF)
+
+# загруженные алфавиты: код языка -> Alphabet
+_alphabets = {}
+
+
+class Alphabet:
+    """Алфавит: 16-ти битные коды сегментов символов, хранящиеся в таблицах bytes.
+    Таблица описывает непрерывный диапазон кодов Unicode: (код первого символа, bytes) и содержит по два байта
+    (little endian) на символ; code_undefined - символ алфавитом не отображается.
+    Бит n кода сегментов соответствует сегменту с номером n в строке VK16K33Display._valid_seg_names.
+    В модуле, замороженном во flash (frozen), таблицы bytes не занимают память в куче, в отличие от словарей
+    строк с именами сегментов (en_lang_14_seg.py, ru_lang_14_seg.py)."""
+
+    def __init__(self, name: str, ranges: tuple):
+        """
+        :param name - имя алфавита (код языка);
+        :param ranges - таблицы: последовательность пар (код первого символа, bytes)."""
+        for first, codes in ranges:
+            if first < 0 or len(codes) & 1:
+                raise ValueError(f"Неверная таблица алфавита {name}: 0x{first:x}")
+        self._name = name
+        self._ranges = ranges
+
+    def get_name(self) -> str:
+        """Возвращает имя алфавита"""
+        return self._name
+
+    def get_code(self, char: str) -> int:
+        """Возвращает код сегментов символа char (строка длиной 1) или None, если алфавит его не отображает."""
+        cp = ord(char)
+        for first, codes in self._ranges:
+            index = 2 * (cp - first)
+            if 0 <= index < len(codes):
+                code = codes[index] | codes[index + 1] << 8
+                if code_undefined != code:
+                    return code
+                return None
+        return None
+
+    def chars(self):
+        """Генератор символов, которые отображает алфавит."""
+        for first, codes in self._ranges:
+            for index in range(0, len(codes), 2):
+                if code_undefined != codes[index] | codes[index + 1] << 8:
+                    yield chr(first + index // 2)
+
+
+def make_ranges(letters: dict, seg_names: str, max_gap: int = 16) -> tuple:
+    """Преобразует словарь: символ -> строка имен сегментов в таблицы для Alphabet.
+    Используется для создания модулей таблиц (например en_lang_14_seg_table.py из en_lang_14_seg.py).
+    :param letters - словарь символов;
+    :param seg_names - имена сегментов в порядке номеров битов (VK16K33Display._valid_seg_names);
+    :param max_gap - наибольшее количество неотображаемых символов между символами одной таблицы."""
+    codes = {}
+    for char, segments in letters.items():
+        code = 0
+        for name in segments:
+            code |= 1 << seg_names.index(name)
+        codes[ord(char)] = code
+    ranges = []
+    cps = sorted(codes)
+    start = 0
+    for i in range(1, len(cps) + 1):
+        if i < len(cps) and cps[i] - cps[i - 1] <= max_gap:
+            continue
+        first = cps[start]
+        table = bytearray()
+        for cp in range(first, cps[i - 1] + 1):
+            code = codes.get(cp, code_undefined)
+            table.append(code & 0xFF)
+            table.append(code >> 8)
+        ranges.append((first, bytes(table)))
+        start = i
+    return tuple(ranges)
+
+
+def get_alphabet(lang: str) -> Alphabet:
+    """Возвращает алфавит языка lang ('en', 'ru'). Модуль таблиц языка (lib_displays.<lang>_lang_14_seg_table)
+    загружается при первом обращении, поэтому память занимают только используемые алфавиты."""
+    alphabet = _alphabets.get(lang)
+    if alphabet is None:
+        try:
+            module = __import__(f"lib_displays.{lang}_lang_14_seg_table", None, None, ("ranges",))
+        except ImportError:
+            raise ValueError(f"Нет алфавита для языка: {lang}")
+        alphabet = Alphabet(lang, module.ranges)
+        _alphabets[lang] = alphabet
+    return alphabet
@@ -0,0 +1,130 @@
+"""Модуль покадровой анимации для символьных дисплеев."""
+
+# micropython
+# MIT license
+
+from micropython import const
+from lib_displays.char_display_mod import CharDisplay
+from lib_displays.playback_mod import Playback
+
+# режимы воспроизведения
+ANIM_LOOP = const(0)        # по кругу: 0, 1, ..., n-1, 0, 1, ...
+ANIM_PING_PONG = const(1)   # туда и обратно: 0, 1, ..., n-1, n-2, ..., 1, 0, 1, ...
+ANIM_ONE_SHOT = const(2)    # один раз: 0, 1, ..., n-1
+
+
+class Animation(Playback):
+    """Покадровая анимация (индикатор ожидания, полоса загрузки, привлечение внимания).
+    Кадры один раз преобразуются в плотно упакованный буфер сырых кодов символов (по ширине дисплея на кадр),
+    воспроизведение выводит кадр из буфера (CharDisplay.show_raw), поэтому на шину передаются только
+    изменившиеся знакоместа. Общая с Marquee основа Playback (step, update, run, is_done ...),
+    поэтому анимацию можно воспроизводить и методами AsyncCharDisplay.scroll, start_scroll."""
+
+    def __init__(self, display: CharDisplay, frames, period_ms: int = 100, mode: int = ANIM_LOOP):
+        """
+        :param display: символьный дисплей, на который выводится анимация;
+        :param frames: последовательность кадров. Кадр - текст (str, bytes; десятичная точка после символа
+        не занимает отдельного знакоместа) или последовательность строк с именами включенных сегментов,
+        по одной строке на знакоместо, слева направо (например ('a', 'b', 'c', 'd')).
+        Знакоместа, не заданные кадром, гасятся;
+        :param period_ms: период кадра в мс, для методов update и run (смотри Playback);
+        :param mode: режим воспроизведения: ANIM_LOOP, ANIM_PING_PONG, ANIM_ONE_SHOT.
+        """
+        if period_ms < 0 or mode not in (ANIM_LOOP, ANIM_PING_PONG, ANIM_ONE_SHOT):
+            raise ValueError(f"Неверное значение period_ms: {period_ms} или mode: {mode}")
+        super().__init__(display, period_ms)
+        self._mode = mode
+        # сырые коды всех кадров, подряд
+        self._codes = None
+        # количество кадров
+        self._count = 0
+        # индекс текущего кадра и направление (1 или -1)
+        self._index = 0
+        self._dir = 1
+        # Истина, если однократное воспроизведение завершено
+        self._done = False
+        self.set_frames(frames)
+
+    def set_frames(self, frames):
+        """Преобразует кадры в буфер сырых кодов символов и возвращает воспроизведение в начало."""
+        disp = self._display
+        cols = disp.get_columns()
+        count = len(frames)
+        if 0 == count:
+            raise ValueError("Нет кадров!")
+        codes = disp.make_buffer(count * cols)
+        blank = disp.get_char_code(' ')
+        to_raw = disp.segments_to_raw
+        base = 0
+        for frame in frames:
+            for i in range(base, base + cols):
+                codes[i] = blank
+            if isinstance(frame, (str, bytes, bytearray)):
+                disp.encode(frame, codes, base, 1, cols)
+            else:
+                if len(frame) > cols:
+                    raise ValueError(f"Количество знакомест кадра больше {cols}!")
+                index = base
+                for segments in frame:
+                    codes[index] = to_raw(segments)
+                    index += 1
+            base += cols
+        self._codes = memoryview(codes)
+        self._count = count
+        self.reset()
+
+    def get_frame_count(self) -> int:
+        """Возвращает количество кадров"""
+        return self._count
+
+    def get_steps_per_pass(self) -> int:
+        """Возвращает количество шагов за один проход анимации"""
+        cnt = self._count
+        if ANIM_PING_PONG == self._mode and cnt > 1:
+            return 2 * (cnt - 1)
+        return cnt
+
+    def get_position(self) -> int:
+        """Возвращает индекс кадра, который будет выведен следующим шагом"""
+        return self._index
+
+    def is_done(self) -> bool:
+        """Возвращает Истина, если однократное (ANIM_ONE_SHOT) воспроизведение завершено."""
+        return self._done
+
+    def reset(self):
+        """Возвращает воспроизведение в начало."""
+        super().reset()
+        self._index = 0
+        self._dir = 1
+        self._done = False
+
+    def show_frame(self, index: int):
+        """Выводит на дисплей кадр с индексом index, не изменяя состояние воспроизведения."""
+        cols = self._display.get_columns()
+        self._display.show_raw(self._codes, 0, index * cols, cols)
+
+    def step(self) -> bool:
+        """Выводит на дисплей текущий кадр и переходит к следующему.
+        Возвращает Ложь, если однократное воспроизведение завершено."""
+        if self._done:
+            return False
+        index = self._index
+        self.show_frame(index)
+        cnt, mode = self._count, self._mode
+        if ANIM_LOOP == mode:
+            index += 1
+            if index >= cnt:
+                index = 0
+        elif ANIM_PING_PONG == mode:
+            if cnt > 1:
+                if not 0 <= index + self._dir < cnt:
+                    self._dir = -self._dir
+                index += self._dir
+        else:
+            index += 1
+            if index >= cnt:
+                index = cnt - 1
+                self._done = True
+        self._index = index
+        return True
@@ -0,0 +1,200 @@
+"""Асинхронная (asyncio/uasyncio) обертка символьного дисплея."""
+
+# micropython
+# MIT license
+
+try:
+    import uasyncio as asyncio
+except ImportError:
+    import asyncio
+
+from lib_displays.char_display_mod import CharDisplay
+from lib_displays.playback_mod import Playback
+
+if hasattr(asyncio, "sleep_ms"):
+    _sleep_ms = asyncio.sleep_ms
+else:
+    # CPython
+    def _sleep_ms(ms: int):
+        return asyncio.sleep(ms / 1000)
+
+# период мигания в мс по значению blink_freq (смотри VK16K33.blink)
+_blink_periods_ms = (0, 500, 1_000, 2_000)
+
+
+class AsyncCharDisplay:
+    """Асинхронная обертка символьного дисплея. Вместо блокирующего ожидания готовности контроллера
+    (пауза между командами) уступает управление циклу событий, что позволяет одному MCU обслуживать
+    датчики, сеть и несколько дисплеев одновременно."""
+
+    def __init__(self, display: CharDisplay):
+        """
+        :param display: символьный дисплей, после вызова его метода init.
+        """
+        self._display = display
+        self._controller = controller = display.get_controller()
+        # Команды контроллеров с паузой между командами (TM1652) не ждут ее окончания, а откладываются
+        # и передаются poll в wait_ready.
+        if hasattr(controller, "set_deferred"):
+            controller.set_deferred(True)
+        # фоновые задачи
+        self._tasks = []
+        # задача программного мигания
+        self._blink_task = None
+
+    @property
+    def display(self) -> CharDisplay:
+        """Возвращает обернутый символьный дисплей"""
+        return self._display
+
+    async def wait_ready(self):
+        """Ждет передачи отложенных команд и готовности контроллера к приему следующей команды,
+        уступая управление другим задачам."""
+        controller = self._controller
+        controller.poll()
+        busy = controller.get_busy_us()
+        while busy > 0:
+            await _sleep_ms((busy + 999) // 1000)
+            controller.poll()
+            busy = controller.get_busy_us()
+
+    async def show_by_pos(self, chars: str, x: int = 0, y: int = 0):
+        """Асинхронный вариант CharDisplay.show_by_pos"""
+        await self.wait_ready()
+        self._display.show_by_pos(chars, x, y)
+
+    async def show_raw(self, codes, x: int = 0, start: int = 0, count: int = None):
+        """Асинхронный вариант CharDisplay.show_raw"""
+        await self.wait_ready()
+        self._display.show_raw(codes, x, start, count)
+
+    async def show_fixed(self, value: int, decimals: int, x: int = 0, width: int = None,
+                         leading_zero: bool = False, overflow: str = '-') -> bool:
+        """Асинхронный вариант CharDisplay.show_fixed"""
+        await self.wait_ready()
+        return self._display.show_fixed(value, decimals, x, width, leading_zero, overflow)
+
+    async def show_int(self, value: int, x: int = 0, width: int = None, leading_zero: bool = False,
+                       overflow: str = '-') -> bool:
+        """Асинхронный вариант CharDisplay.show_int"""
+        await self.wait_ready()
+        return self._display.show_int(value, x, width, leading_zero, overflow)
+
+    async def show_float(self, value: float, decimals: int, x: int = 0, width: int = None,
+                         leading_zero: bool = False, overflow: str = '-') -> bool:
+        """Асинхронный вариант CharDisplay.show_float"""
+        await self.wait_ready()
+        return self._display.show_float(value, decimals, x, width, leading_zero, overflow)
+
+    async def clear(self):
+        """Асинхронный вариант CharDisplay.clear"""
+        await self.wait_ready()
+        self._display.clear()
+
+    async def set_brightness(self, value: int):
+        """Асинхронный вариант set_brightness контроллера"""
+        await self.wait_ready()
+        self._controller.set_brightness(value)
+
+    async def set_shutdown(self, value: bool):
+        """Асинхронный вариант set_shutdown контроллера"""
+        await self.wait_ready()
+        self._controller.set_shutdown(value)
+
+    async def blink(self, blink_freq: int):
+        """Управляет морганием дисплея.
+        Если контроллер умеет мигать сам (метод blink), то используется он, иначе запускается фоновая задача,
+        включающая и выключающая дисплей (set_shutdown).
+        :param blink_freq — частота моргания
+            0 - моргание отключено
+            1 - моргание 2 Гц
+            2 - моргание 1 Гц
+            3 - моргание 0.5 Гц"""
+        if blink_freq not in range(len(_blink_periods_ms)):
+            raise ValueError(f"Значение blink_freq: {blink_freq} вне диапазона!")
+        await self._stop_blink()
+        if hasattr(self._controller, "blink"):
+            await self.wait_ready()
+            self._controller.blink(blink_freq)
+            return
+        if blink_freq:
+            self._blink_task = asyncio.create_task(self._soft_blink(_blink_periods_ms[blink_freq] // 2))
+
+    async def _stop_blink(self):
+        task = self._blink_task
+        if task is None:
+            return
+        self._blink_task = None
+        task.cancel()
+        try:
+            await task
+        except asyncio.CancelledError:
+            pass
+        await self.set_shutdown(False)
+
+    async def _soft_blink(self, half_period_ms: int):
+        """Программное мигание"""
+        shutdown = False
+        while True:
+            shutdown = not shutdown
+            await self.set_shutdown(shutdown)
+            await _sleep_ms(half_period_ms)
+
+    async def scroll(self, marquee: Playback, cycles: int = 1, period_ms: int = None):
+        """Асинхронная прокрутка бегущей строки (или воспроизведение анимации, смотри Playback) marquee cycles раз.
+        :param period_ms: период шага в мс. Если None, то используется период, заданный в marquee."""
+        if period_ms is None:
+            period_ms = marquee.get_period_ms()
+        steps = cycles * marquee.get_steps_per_pass()
+        if 0 == steps:
+            # нечего прокручивать (пустая лента): только уступает управление другим задачам
+            await _sleep_ms(period_ms)
+            return
+        for _ in range(steps):
+            await self.wait_ready()
+            if not marquee.step():
+                break
+            await _sleep_ms(period_ms)
+
+    def start_refresh(self, func, period_ms: int):
+        """Запускает фоновую задачу обновления дисплея, которая вызывает func(display) каждые period_ms мс.
+        display - обернутый символьный дисплей. Если func возвращает Ложь (но не None), то задача завершается.
+        Возвращает задачу."""
+        task = asyncio.create_task(self._refresh(func, period_ms))
+        self._tasks.append(task)
+        return task
+
+    async def _refresh(self, func, period_ms: int):
+        display = self._display
+        while True:
+            await self.wait_ready()
+            if False is func(display):
+                break
+            await _sleep_ms(period_ms)
+
+    def start_scroll(self, marquee: Playback, period_ms: int = None):
+        """Запускает фоновую задачу бесконечной прокрутки бегущей строки. Возвращает задачу."""
+        task = asyncio.create_task(self._scroll_forever(marquee, period_ms))
+        self._tasks.append(task)
+        return task
+
+    async def _scroll_forever(self, marquee: Playback, period_ms: int):
+        while True:
+            await self.scroll(marquee, 1, period_ms)
+            if marquee.is_done():
+                break
+            # каждый проход уступает управление, даже если период равен нулю
+            await _sleep_ms(0)
+
+    async def stop(self):
+        """Останавливает все фоновые задачи, включая программное мигание."""
+        tasks = self._tasks
+        self._tasks = []
+        for task in tasks:
+            task.cancel()
+        for task in tasks:
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+        await self._stop_blink()
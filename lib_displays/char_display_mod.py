@@ -1,6 +1,8 @@
 from collections import namedtuple
+from array import array
 from lib_displays.display_controller_mod import ICharDisplayController
 # from sensor_pack_2.base_sensor import check_value
+import sys
 import micropython
 
 # свойства символьного дисплея
@@ -8,6 +10,11 @@ base_display_prop = namedtuple("base_display_prop", "columns rows reverse_index_
 # прямоугольная область
 rect_area = namedtuple("rect_area", "x0 y0 x1 y1")
 
+# Истина, если функции с декоратором viper компилируются эмиттером viper (MicroPython). Декоратор обрабатывается
+# компилятором MicroPython, а не является атрибутом модуля micropython. Под CPython модуль micropython подставляется
+# пакетом host_compat и его декоратор viper ничего не делает, поэтому проверяется реализация Python.
+_viper = "micropython" == sys.implementation.name
+
 '''
 Расположение сегментов 7-сегментного дисплея, управляемого микросхемой TM1652,
 в текстовом виде с именами сегментов выглядит так:
@@ -47,11 +54,17 @@ class BaseCharDisplay:
         self._inverse_logic = False
         # поддерживает ли класс частичное обновление (когда часть знакомест обновляется, а часть нет)?
         self._partial_update = False
+        # поддерживает ли контроллер запись соседних знакомест одной транзакцией (метод set_span контроллера)?
+        self._span_update = False
         # Порядок выдачи индексов знакомест или кодов символов на шину
         # прямой порядок, это когда крайне левому знакоместу дисплея соответствует нулевой индекс или нулевой байт в буфере.
         # Иначе, это когда крайне правому знакоместу дисплея соответствует нулевой индекс или нулевой байт в буфере.
         self._reverse_index_order = False
 
+    def get_controller(self) -> ICharDisplayController:
+        """Возвращает контроллер дисплея"""
+        return self._controller
+
     def is_reverse_index(self) -> bool:
         """порядок выдачи индексов знакомест или кодов символов на шину (для дисплеев, не поддерживающих частичное обновление).
         Прямой порядок, это когда крайне левому знакоместу дисплея соответствует нулевой индекс или нулевой байт в буфере.
@@ -70,6 +83,15 @@ class BaseCharDisplay:
         """Устанавливает значение поля _partial_update. Смотри is_partial_update."""
         self._partial_update = value
 
+    def is_span_update(self) -> bool:
+        """Возвращает признак поддержки контроллером записи соседних знакомест одной транзакцией на шине (set_span).
+        Имеет смысл только при поддержке частичного обновления."""
+        return self._span_update
+
+    def set_span_update(self, value: bool):
+        """Устанавливает значение поля _span_update. Смотри is_span_update."""
+        self._span_update = value
+
     def is_inverse_logic(self) -> bool:
         """если Ложь, то сегмент включается единицей, иначе сегмент включается нулем!"""
         return self._inverse_logic
@@ -140,10 +162,102 @@ class BaseCharDisplay:
 # A, b, C, d, E, F, G, H, I, J, L, n, o, P, U
 # Другие символы: дефис "-", иногда точка (DP) для десятичных чисел
 
+# Ядра кодирования строки в кадр. Проходят строку (str в кодировке ASCII, bytes, bytearray) один раз,
+# присоединяют десятичную точку к предыдущему символу и записывают коды из плоской таблицы table прямо в буфер dst.
+# table - 256 кодов: 0..127 - коды ASCII символов, 128..255 - коды тех же символов с десятичной точкой.
+# Возвращают количество записанных знакомест или -1, если встречен не ASCII символ (тогда используется код на Python).
+if _viper:
+    @micropython.viper
+    def _encode_to_8(src: ptr8, src_len: int, table: ptr16, dst: ptr8, index: int, step: int, count: int) -> int:
+        i = 0
+        written = 0
+        while i < src_len and written < count:
+            c = src[i]
+            if c > 127:
+                return -1
+            i += 1
+            if i < src_len and src[i] == 46:   # '.'
+                c += 128
+                i += 1
+            dst[index] = table[c]
+            index += step
+            written += 1
+        return written
+
+    @micropython.viper
+    def _encode_to_16(src: ptr8, src_len: int, table: ptr16, dst: ptr16, index: int, step: int, count: int) -> int:
+        i = 0
+        written = 0
+        while i < src_len and written < count:
+            c = src[i]
+            if c > 127:
+                return -1
+            i += 1
+            if i < src_len and src[i] == 46:   # '.'
+                c += 128
+                i += 1
+            dst[index] = table[c]
+            index += step
+            written += 1
+        return written
+else:
+    # эмиттер viper недоступен (например, CPython). Используется код на Python.
+    _encode_to_8 = _encode_to_16 = None
+
+
+# степени десяти для show_float
+_pow10 = (1, 10, 100, 1_000, 10_000, 100_000, 1_000_000, 10_000_000, 100_000_000, 1_000_000_000)
+
 
 class CharDisplay(BaseCharDisplay):
     """Символьный дисплей"""
 
+    # имя сегмента десятичной точки
+    dp_seg_name = 'p'
+    # разрядность кода символа в битах (8 для 7-ми сегментных индикаторов, 16 для 14-ти сегментных)
+    code_bits = 8
+    # Содержит все цифры и их сегменты. Цифры 0 - 9
+    _seg_map_digits = {
+        '0': "abcdef",
+        '1': "bc",
+        '2': "abged",
+        '3': "abgcd",
+        '4': "fgbc",
+        '5': "afgcd",
+        '6': "afgcde",
+        '7': "abc",
+        '8': "abcdefg",
+        '9': "abcdfg",
+    }
+    # содержит все отображаемые буквы и некоторые другие символы
+    _seg_map_letters = {
+        'A': 'abcefg',
+        'b': 'cdefg',
+        'C': 'adef',
+        'c': 'deg',
+        'd': 'bcdeg',
+        'E': 'agdef',
+        'F': 'aefg',
+        'G': 'acdef',
+        'H': 'bcefg',
+        'J': 'bcd',
+        'L': 'def',
+        'n': 'ceg',
+        'o': 'cdeg',
+        'r': 'eg',
+        'P': 'abefg',
+        'U': 'bcdef',
+        '-': 'g',
+        '.': dp_seg_name,  # сегмент DP - десятичная точка
+        '_': 'd',
+        '=': 'gd',
+        ' ': '',
+        '|': 'ef',
+        '[': 'defa',
+        ']': 'abcd',
+        '°': 'abgf',  # попытка отобразись символ градуса на скудных семи сегментах
+    }  # _seg_map_letters = {
+
     @staticmethod
     @micropython.viper
     def _get_power_of_two(n: int) -> int:
@@ -222,6 +336,190 @@ class CharDisplay(BaseCharDisplay):
         """Инициализация"""
         super().__init__(controller=controller)
         # self.set_non_printable('adg')
+        # маска кода символа, по разрядности кода
+        self._code_mask = (1 << self.code_bits) - 1
+        # Скомпилированная таблица кодов символов: символ -> сырой код для записи в знакоместо.
+        # None, если таблица еще не скомпилирована или должна быть перекомпилирована (смотри compile_glyphs).
+        self._glyphs = None
+        # символ -> сырой код символа с включенной десятичной точкой
+        self._glyphs_dp = None
+        # сырой код неотображаемого символа (без и с десятичной точкой)
+        self._np_code = 0
+        self._np_code_dp = 0
+        # Плоская таблица кодов ASCII символов для ядра кодирования: 0..127 - без, 128..255 - с десятичной точкой.
+        self._ascii_codes = array('H', bytes(512))
+        # ядро кодирования строки в кадр, по разрядности кода символа
+        self._encode_kernel = _encode_to_8 if self.code_bits <= 8 else _encode_to_16
+        # Кадр: сырые коды символов всех знакомест, в порядке индексов знакомест на шине.
+        # Заполняется методами вывода, передается контроллеру методом flush.
+        self._frame = self._new_frame()
+        self._frame_mv = memoryview(self._frame)
+        # Теневая копия кадра: последние переданные контроллеру коды символов.
+        self._shadow = self._new_frame()
+        # если Ложь, то содержимое теневой копии не соответствует дисплею и следующий flush передаст весь кадр
+        self._shadow_valid = False
+        # если Истина, то методы вывода сразу передают кадр контроллеру (flush), иначе передачу выполняет
+        # владелец дисплея, вызывая flush (например менеджер общей шины)
+        self._auto_flush = True
+
+    def _new_frame(self):
+        """Возвращает буфер для сырых кодов всех знакомест дисплея."""
+        return self.make_buffer(self.get_columns())
+
+    def make_buffer(self, count: int):
+        """Возвращает буфер для count сырых кодов символов. Тип элемента зависит от разрядности кода символа:
+        bytearray для 8-ми битных кодов, array('H') для 16-ти битных."""
+        if self.code_bits <= 8:
+            return bytearray(count)
+        return array('H', bytes(2 * count))
+
+    def set_buf(self, index: int, value: int):
+        """Записывает сырой код символа value в кадр по индексу знакоместа index. Возвращает кадр."""
+        buf = self._frame
+        buf[index] = value
+        return buf
+
+    def is_auto_flush(self) -> bool:
+        """Возвращает Истина, если методы вывода сразу передают кадр контроллеру (flush)."""
+        return self._auto_flush
+
+    def set_auto_flush(self, value: bool):
+        """Устанавливает значение поля _auto_flush. Смотри is_auto_flush.
+        Если value Ложь, то методы вывода только изменяют кадр, а передачу выполняет вызов flush."""
+        self._auto_flush = value
+
+    def is_dirty(self) -> bool:
+        """Возвращает Истина, если кадр отличается от переданного контроллеру и его необходимо передать (flush)."""
+        return not self._shadow_valid or self._frame != self._shadow
+
+    def get_flush_size(self) -> tuple:
+        """Возвращает количество передач контроллеру (вызовов set_span, set_char или set_all) и количество
+        знакомест, которые передаст следующий вызов flush. Например, для оценки времени передачи по шине."""
+        frame, shadow = self._frame, self._shadow
+        cnt = len(frame)
+        if not self._shadow_valid:
+            # весь кадр: одним участком или по знакоместам
+            return (cnt if self.is_partial_update() and not self.is_span_update() else 1), cnt
+        if frame == shadow:
+            return 0, 0
+        if not self.is_partial_update():
+            return 1, cnt
+        spans = 0
+        chars = 0
+        prev = False
+        for index in range(cnt):
+            changed = frame[index] != shadow[index]
+            if changed:
+                chars += 1
+                if not prev:
+                    spans += 1
+            prev = changed
+        return (spans if self.is_span_update() else chars), chars
+
+    def _frame_changed(self):
+        """Вызывается методами вывода после изменения кадра."""
+        if self._auto_flush:
+            self.flush()
+
+    def invalidate(self):
+        """Объявляет теневую копию кадра недействительной.
+        Следующий вызов flush передаст контроллеру весь кадр, даже если он не изменился."""
+        self._shadow_valid = False
+
+    def resync(self):
+        """Восстанавливает состояние дисплея (например после пропадания его питания): повторно передает
+        управляющие регистры контроллера (resync контроллера) и весь кадр."""
+        self._controller.resync()
+        self.invalidate()
+        self.flush()
+
+    def flush(self):
+        """Передает контроллеру только изменившиеся, с момента предыдущей передачи, знакоместа кадра.
+        Если кадр не изменился, то обращения к шине не происходит."""
+        frame, shadow = self._frame, self._shadow
+        valid = self._shadow_valid
+        if valid and frame == shadow:
+            return  # нечего передавать
+        if self.is_partial_update():
+            if self.is_span_update():
+                self._flush_spans(valid)
+            else:
+                set_char = self._controller.set_char
+                for index in range(len(frame)):
+                    code = frame[index]
+                    if not valid or code != shadow[index]:
+                        set_char(code, index, 0)
+                        shadow[index] = code
+        else:
+            self._controller.set_all(frame)
+            shadow[:] = frame
+        self._shadow_valid = True
+
+    def fill(self, code: int):
+        """Записывает сырой код символа code во все знакоместа. Контроллеру передается одна команда заполнения
+        (fill контроллера), а не коды отдельных знакомест."""
+        frame, shadow = self._frame, self._shadow
+        for index in range(len(frame)):
+            frame[index] = code
+        if not self._auto_flush or (self._shadow_valid and frame == shadow):
+            return
+        self._controller.fill(code)
+        shadow[:] = frame
+        self._shadow_valid = True
+
+    def clear(self):
+        """Очищает весь дисплей от символов (заполняет кодом пробела)"""
+        self.fill(self.get_char_code(' '))
+
+    def set_inverse_logic(self, value: bool):
+        """если Ложь, то сегмент включается единицей, иначе сегмент включается нулем!"""
+        super().set_inverse_logic(value)
+        self._glyphs = None
+
+    def set_non_printable(self, seg_names: str):
+        """Устанавливает сырое значение сегментов символа, заменяющий собой символ,
+        который невозможно узнаваемо(!) напечатать в знакоместе."""
+        super().set_non_printable(seg_names)
+        self._glyphs = None
+
+    def get_symbol_maps(self) -> tuple:
+        """Возвращает кортеж словарей: символ -> строка имен сегментов, которые должны быть включены для его отображения.
+        Из этих словарей компилируется таблица кодов символов. Для переопределения в классах-наследниках."""
+        return self._seg_map_digits, self._seg_map_letters
+
+    def compile_glyphs(self):
+        """Компилирует таблицу сырых кодов символов с учетом расположения битов сегментов (get_segment_nbit),
+        логики включения сегментов (is_inverse_logic) и десятичной точки.
+        После компиляции отображение символа сводится к одному поиску в словаре.
+        Вызывается из init классов-наследников. Изменение логики или неотображаемого символа требует перекомпиляции,
+        которая выполняется автоматически при следующем выводе на дисплей."""
+        to_raw = self.segments_to_raw
+        dp = self.dp_seg_name
+        glyphs = dict()
+        glyphs_dp = dict()
+        for _map in self.get_symbol_maps():
+            for char, segments in _map.items():
+                glyphs[char] = to_raw(segments)
+                glyphs_dp[char] = to_raw(segments + dp)
+        np = self.get_non_printable()
+        self._np_code = np_code = to_raw(np)
+        self._np_code_dp = np_code_dp = to_raw(np + dp)
+        ascii_codes = self._ascii_codes
+        for c in range(128):
+            char = chr(c)
+            ascii_codes[c] = glyphs.get(char, np_code)
+            ascii_codes[128 + c] = glyphs_dp.get(char, np_code_dp)
+        self._glyphs_dp = glyphs_dp
+        self._glyphs = glyphs
+
+    def get_char_code(self, char: str, decimal_point: bool = False) -> int:
+        """Возвращает сырой код символа char (строка длиной 1) из скомпилированной таблицы кодов.
+        Если decimal_point Истина, то в коде включена десятичная точка."""
+        if self._glyphs is None:
+            self.compile_glyphs()
+        if decimal_point:
+            return self._glyphs_dp.get(char, self._np_code_dp)
+        return self._glyphs.get(char, self._np_code)
 
     def get_segment_nbit(self, seg_name: str) -> int:
         """Возвращает номер бита, соответствующий сегменту с именем seg_name. Имя сегмента имеет длину один символ!
@@ -246,7 +544,7 @@ class CharDisplay(BaseCharDisplay):
             ret_val |= self._get_segment_value(segm_name)
         # В зависимости от схемы включения сегментного индикатора (общий анод или общий катод)
         # Общий анод - сегмент включается нулем. Общий катод - сегмент включается единицей.
-        return ~ret_val if i_logic else ret_val
+        return self._code_mask & ~ret_val if i_logic else ret_val
 
     def get_segments_of_symbol(self, char_with_dp: str) -> str:
             """Возвращает строку из имен сегментов, которые должны быть включены для отображения символа char.
@@ -255,48 +553,9 @@ class CharDisplay(BaseCharDisplay):
             что означает, что символ не отображается этим дисплеем!
             Для переопределения в классах-наследниках.
             """
-            dp_seg_name = 'p'
-            # Содержит все цифры и их сегменты. Цифры 0 - 9
-            seg_map_digits = {
-                '0': "abcdef",
-                '1': "bc",
-                '2': "abged",
-                '3': "abgcd",
-                '4': "fgbc",
-                '5': "afgcd",
-                '6': "afgcde",
-                '7': "abc",
-                '8': "abcdefg",
-                '9': "abcdfg",
-            }
-            # содержит все отображаемые буквы и некоторые другие символы
-            segment_map_letters = {
-                'A': 'abcefg',
-                'b': 'cdefg',
-                'C': 'adef',
-                'c': 'deg',
-                'd': 'bcdeg',
-                'E': 'agdef',
-                'F': 'aefg',
-                'G': 'acdef',
-                'H': 'bcefg',
-                'J': 'bcd',
-                'L': 'def',
-                'n': 'ceg',
-                'o': 'cdeg',
-                'r': 'eg',
-                'P': 'abefg',
-                'U': 'bcdef',
-                '-': 'g',
-                '.': dp_seg_name,  # сегмент DP - десятичная точка
-                '_': 'd',
-                '=': 'gd',
-                ' ': '',
-                '|': 'ef',
-                '[': 'defa',
-                ']': 'abcd',
-                '°': 'abgf',  # попытка отобразись символ градуса на скудных семи сегментах
-            }  # segment_map_letters = {
+            dp_seg_name = self.dp_seg_name
+            seg_map_digits = self._seg_map_digits
+            segment_map_letters = self._seg_map_letters
 
             if not isinstance(char_with_dp, str) or 0 == len(char_with_dp) or len(char_with_dp) > 2:
                 raise ValueError("Ожидается строка длиной 1 или 2.")
@@ -314,35 +573,199 @@ class CharDisplay(BaseCharDisplay):
                 retval = retval + dp_seg_name  # добавляю десятичную точку
             return retval
 
+    def _flush_spans(self, shadow_valid: bool):
+        """Объединяет соседние изменившиеся знакоместа в непрерывные участки и передает каждый участок
+        контроллеру одной транзакцией (set_span)."""
+        frame, shadow = self._frame, self._shadow
+        set_span = self._controller.set_span
+        frame_mv = self._frame_mv
+        cnt = len(frame)
+        index = 0
+        while index < cnt:
+            if shadow_valid and frame[index] == shadow[index]:
+                index += 1
+                continue
+            start = index
+            while index < cnt and (not shadow_valid or frame[index] != shadow[index]):
+                shadow[index] = frame[index]
+                index += 1
+            set_span(frame_mv[start:index], start, 0)
+
+    def encode(self, chars, dest, index: int = 0, step: int = 1, count: int = None) -> int:
+        """Преобразует символы из chars в сырые коды и записывает их в dest, начиная с индекса index, с шагом step.
+        Десятичная точка ('.') после символа присоединяется к нему и не занимает отдельного знакоместа.
+        :param chars - строка (str) или bytes, bytearray с ASCII символами;
+        :param dest - буфер для кодов, того же типа, что и кадр дисплея (bytearray или array('H'));
+        :param index - индекс первого кода в dest;
+        :param step - шаг индекса (1 или -1);
+        :param count - наибольшее количество записываемых кодов. Если None, то до конца (начала) dest.
+        :return: количество записанных кодов."""
+        if count is None:
+            count = len(dest) - index if step > 0 else index + 1
+        if count <= 0:
+            return 0
+        if self._glyphs is None:
+            self.compile_glyphs()
+        kernel = self._encode_kernel
+        if kernel is not None:
+            written = kernel(chars, len(chars), self._ascii_codes, dest, index, step, count)
+            if written >= 0:
+                return written
+        # код на Python: строка с не ASCII символами или эмиттер viper недоступен
+        is_str = isinstance(chars, str)
+        dp = '.' if is_str else 46  # код '.'
+        glyphs, glyphs_dp = self._glyphs, self._glyphs_dp
+        ascii_codes = self._ascii_codes
+        np_code, np_code_dp = self._np_code, self._np_code_dp
+        src_len = len(chars)
+        i = 0
+        written = 0
+        while i < src_len and written < count:
+            char = chars[i]
+            i += 1
+            with_dp = i < src_len and dp == chars[i]
+            if with_dp:
+                i += 1
+            if is_str:
+                code = glyphs_dp.get(char, np_code_dp) if with_dp else glyphs.get(char, np_code)
+            elif char < 128:
+                code = ascii_codes[128 + char] if with_dp else ascii_codes[char]
+            else:
+                code = np_code_dp if with_dp else np_code
+            dest[index] = code
+            index += step
+            written += 1
+        return written
+
+    def show_raw(self, codes, x: int = 0, start: int = 0, count: int = None):
+        """Выводит на дисплей сырые коды символов codes[start:start + count], слева направо, начиная с позиции x.
+        Коды не копируются во временный буфер, на шину передаются только изменившиеся знакоместа (смотри flush, is_auto_flush).
+        :param codes - последовательность сырых кодов (bytearray, array('H'), memoryview), например полученная encode;
+        :param x - позиция первого символа по горизонтали слева на право;
+        :param start - индекс первого кода в codes;
+        :param count - количество кодов. Если None, то до конца codes или правого края дисплея."""
+        cols = self.get_columns()
+        if x is None or x < 0:
+            x = 0
+        avail = len(codes) - start
+        if count is None or count > avail:
+            count = avail
+        if count > cols - x:
+            count = cols - x
+        frame = self._frame
+        if self.is_reverse_index():
+            index = cols - 1 - x
+            for i in range(start, start + count):
+                frame[index] = codes[i]
+                index -= 1
+        else:
+            index = x
+            for i in range(start, start + count):
+                frame[index] = codes[i]
+                index += 1
+        self._frame_changed()
+
     def show_by_pos(self, chars: str, x: int = 0, y: int = 0):
         """Выводит на дисплей коды символов из chars.
+        На шину передаются только изменившиеся знакоместа (смотри flush).
         :param chars - отображаемая на дисплее строка (кол-во символов указывается в конструкторе);
         :param x - полиция символа по горизонтали слева на право. Первая(крайне левая) позиция имеет значение 0.
         :param y - не используется!
         """
-        l_buf = None
-        gen = CharDisplay.gen_chars_with_dp
-        r = self.get_order_char_index(offset=x)
-        p_upd = self.is_partial_update()
-        # print(f"DBG:r: {r}")
-        it_indexes = iter(r)
-        for char_with_dp in gen(chars):
-            try:
-                # print(f"DBG:{char_with_dp}")
-                segments = self.get_segments_of_symbol(char_with_dp)
-                # Обработка исключения — относительно дорогая операция в плане времени.
-                index = next(it_indexes, None)  # None - для того, чтобы избежать выброса исключения!
-                # print(f"DBG:{index}")
-                if index is None:
-                    break
-                symb_code = self.segments_to_raw(segments)
-                if not p_upd:
-                    l_buf = self.set_buf(index, symb_code)
-                else:
-                    self._controller.set_char(symb_code, index, 0)
-            except StopIteration:
-                print(f"DBG:show_by_pos:StopIteration")
-                pass
-        # посылка готова к отправке
-        if not p_upd:
-            self._controller.set_all(l_buf)
\ No newline at end of file
+        if x is None or x < 0:
+            x = 0
+        count = self.get_columns() - x
+        if count > 0:
+            if self.is_reverse_index():
+                self.encode(chars, self._frame, count - 1, -1, count)
+            else:
+                self.encode(chars, self._frame, x, 1, count)
+        self._frame_changed()
+
+    def show_fixed(self, value: int, decimals: int, x: int = 0, width: int = None, leading_zero: bool = False,
+                   overflow: str = '-') -> bool:
+        """Выводит на дисплей число с фиксированной точкой value / 10**decimals, выровненное по правому краю поля.
+        Цифры вычисляются арифметически и сразу записываются в кадр кодами из скомпилированной таблицы,
+        без создания промежуточных строк.
+        :param value - целое число, например 31415 при decimals = 4 отображается как 3.1415;
+        :param decimals - количество цифр после десятичной точки (0 - целое число);
+        :param x - крайне левая позиция поля;
+        :param width - ширина поля в знакоместах. Если None, то до правого края дисплея;
+        :param leading_zero - если Истина, то незначащие нули слева выводятся, иначе знакоместа гасятся;
+        :param overflow - символ, которым заполняется поле, если число в него не помещается.
+        :return: Ложь, если число не поместилось в поле (переполнение), иначе Истина."""
+        cols = self.get_columns()
+        if x is None or x < 0:
+            x = 0
+        if width is None:
+            width = cols - x
+        if width <= 0 or x + width > cols:
+            raise ValueError(f"Неверное поле: x={x}, width={width}")
+        if decimals < 0:
+            raise ValueError(f"Неверное количество цифр после точки: {decimals}")
+        if self._glyphs is None:
+            self.compile_glyphs()
+        codes = self._ascii_codes
+        frame = self._frame
+        rev = self.is_reverse_index()
+        last = cols - 1
+        neg = value < 0
+        if neg:
+            value = -value
+        # заполнение поля справа налево
+        pos = x + width - 1
+        n_digits = 0
+        while pos >= x:
+            if 0 == value and n_digits > decimals and not leading_zero:
+                break
+            if 0 == value and leading_zero and neg and pos == x:
+                break   # место для знака
+            digit = value % 10
+            value //= 10
+            # десятичная точка горит в знакоместе младшей цифры целой части
+            frame[last - pos if rev else pos] = codes[176 + digit if decimals and n_digits == decimals else 48 + digit]
+            n_digits += 1
+            pos -= 1
+        ok = 0 == value and n_digits > decimals
+        if ok and neg:
+            if pos < x:
+                ok = False
+            else:
+                frame[last - pos if rev else pos] = codes[45]    # '-'
+                pos -= 1
+        if ok:
+            blank = codes[32]   # ' '
+            while pos >= x:
+                frame[last - pos if rev else pos] = blank
+                pos -= 1
+        else:
+            ovf = self.get_char_code(overflow)
+            for pos in range(x, x + width):
+                frame[last - pos if rev else pos] = ovf
+        self._frame_changed()
+        return ok
+
+    def show_int(self, value: int, x: int = 0, width: int = None, leading_zero: bool = False,
+                 overflow: str = '-') -> bool:
+        """Выводит на дисплей целое число value, выровненное по правому краю поля. Смотри show_fixed."""
+        return self.show_fixed(value, 0, x, width, leading_zero, overflow)
+
+    def show_float(self, value: float, decimals: int, x: int = 0, width: int = None, leading_zero: bool = False,
+                   overflow: str = '-') -> bool:
+        """Выводит на дисплей число value, округленное до decimals (0..9) цифр после десятичной точки. Смотри show_fixed."""
+        if not 0 <= decimals < len(_pow10):
+            raise ValueError(f"Неверное количество цифр после точки: {decimals}")
+        try:
+            scaled = int(value * _pow10[decimals] + (0.5 if value >= 0 else -0.5))
+        except (OverflowError, ValueError):     # inf, nan
+            # заведомо не помещающееся в поле значение
+            scaled = _pow10[-1] * _pow10[-1]
+        return self.show_fixed(scaled, decimals, x, width, leading_zero, overflow)
+
+    def marquee(self, text: [str, bytes], step: int = 1, period_ms: int = 300, wrap: bool = True, gap: int = None):
+        """Возвращает бегущую строку (Marquee) с текстом text для этого дисплея. Прокрутка выполняется методами
+        бегущей строки: run (блокирующий), update (неблокирующий) или AsyncCharDisplay.scroll.
+        Параметры смотри Marquee.__init__."""
+        # импорт здесь: модуль бегущей строки импортирует этот модуль
+        from lib_displays.marquee_mod import Marquee
+        return Marquee(self, text, step, period_ms, wrap, gap)
@@ -27,6 +27,26 @@ class IDisplayController:
         """Возвращает количество строк элементов дисплея"""
         raise NotImplemented
 
+    def get_busy_us(self) -> int:
+        """Возвращает время в мкс, через которое контроллер будет готов принять следующую команду. 0 - готов.
+        Контроллеры, требующие паузы между командами, должны переопределить этот метод.
+        Используется асинхронными обертками, чтобы уступать управление вместо блокирующего ожидания."""
+        return 0
+
+    def poll(self) -> bool:
+        """Передает отложенные команды, если контроллер готов их принять.
+        Возвращает Истина, если остались отложенные команды. Для контроллеров, откладывающих команды."""
+        return False
+
+    def flush_pending(self):
+        """Передает все отложенные команды, ожидая готовности контроллера. Для контроллеров, откладывающих команды."""
+        pass
+
+    def resync(self):
+        """Повторно передает значения всех управляющих регистров, известные контроллеру (например после пропадания
+        питания дисплея). Контроллеры не передают значение регистра, если оно не изменилось, поэтому без resync
+        содержимое регистров после сбоя не восстанавливается. Для контроллеров с управляющими регистрами."""
+        pass
 
 
 class ICharDisplayController(IDisplayController):
@@ -43,6 +63,16 @@ class ICharDisplayController(IDisplayController):
         """для контроллеров, не поддерживающих запись в отдельные позиции."""
         raise NotImplemented
 
+    def set_span(self, char_codes, x: int, y: int):
+        """Записывает коды символов из char_codes в соседние знакоместа, начиная с позиции x, y, одной транзакцией на шине.
+        Для контроллеров, поддерживающих пакетную запись с автоматическим увеличением адреса."""
+        raise NotImplemented
+
+    def fill(self, char_code: int):
+        """Записывает код символа char_code во все знакоместа самым быстрым для контроллера способом.
+        Используется методами fill и clear символьного дисплея."""
+        raise NotImplemented
+
     def set_brightness(self, value: int):
         """Устанавливает яркость всех элементов одновременно."""
         raise NotImplemented
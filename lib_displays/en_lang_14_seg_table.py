@@ -0,0 +1,20 @@
+"""Таблицы алфавита английского языка для 14-ти сегментного индикатора на базе VK16K33 (смотри alphabet_mod.Alphabet)."""
+# Созданы из словаря модуля en_lang_14_seg.py функцией alphabet_mod.make_ranges.
+# Два байта (little endian) на символ, 0xFFFF - символ не отображается.
+
+# micropython
+# MIT license
+
+ranges = (
+    # 'A'..'z'
+    (0x0041,
+     b"\x86\x0c\x79\x24\x39\x00\x30\x09\x79\x00\x71\x00\xbd\x00\xf6\x00"
+     b"\x09\x12\x1e\x00\x70\x24\x38\x00\x36\x05\x36\x21\x3f\x00\xf3\x00"
+     b"\x3f\x20\xf3\x20\x8d\x01\x01\x12\x3e\x00\x30\x0c\x36\x28\x00\x2d"
+     b"\x00\x15\x09\x0c\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff"
+     b"\xff\xff\xfc\x00\xd8\x00\xde\x00\xff\xff\xff\xff\xff\xff\xf4\x00"
+     b"\xc8\x10\x0c\x00\x00\x36\x00\x12\xd4\x10\x50\x10\xdc\x00\x70\x01"
+     b"\xff\xff\x50\x00\xff\xff\x78\x00\x1c\x00\x10\x08\x14\x28\xff\xff"
+     b"\xff\xff\x48\x08",
+     ),
+)
@@ -0,0 +1,85 @@
+"""Модуль бегущей строки для символьных дисплеев."""
+
+# micropython
+# MIT license
+
+from lib_displays.char_display_mod import CharDisplay
+from lib_displays.playback_mod import Playback
+
+
+class Marquee(Playback):
+    """Бегущая строка. Текст один раз преобразуется в ленту сырых кодов символов,
+    затем по ленте сдвигается окно шириной в дисплей. Каждый шаг стоит только времени передачи по шине."""
+
+    def __init__(self, display: CharDisplay, text: [str, bytes], step: int = 1, period_ms: int = 300,
+                 wrap: bool = True, gap: int = None):
+        """
+        :param display: символьный дисплей, на который выводится бегущая строка;
+        :param text: отображаемый текст (десятичная точка после символа не занимает отдельного знакоместа);
+        :param step: сдвиг окна за один шаг, в знакоместах;
+        :param period_ms: период шага в мс, для методов update и run (смотри Playback);
+        :param wrap: если Истина, то текст прокручивается по кругу, иначе один раз;
+        :param gap: количество пустых знакомест перед текстом (и между повторениями текста). None - ширина дисплея.
+        """
+        if step <= 0 or period_ms < 0:
+            raise ValueError(f"Неверное значение step: {step} или period_ms: {period_ms}")
+        super().__init__(display, period_ms)
+        self._step = step
+        self._wrap = wrap
+        self._gap = display.get_columns() if gap is None else gap
+        # лента сырых кодов символов
+        self._strip = None
+        # длина цикла прокрутки в знакоместах (пустые знакоместа + текст)
+        self._cycle = 0
+        # положение окна в ленте
+        self._pos = 0
+        self.set_text(text)
+
+    def set_text(self, text: [str, bytes]):
+        """Преобразует текст в ленту сырых кодов символов и возвращает окно в начало."""
+        disp = self._display
+        cols = disp.get_columns()
+        gap = self._gap
+        # длина ленты с запасом: каждый символ текста занимает не больше одного знакоместа
+        strip = disp.make_buffer(gap + len(text) + cols)
+        n = disp.encode(text, strip, gap)
+        blank = disp.get_char_code(' ')
+        for i in range(gap):
+            strip[i] = blank
+        cycle = gap + n
+        # хвост ленты, чтобы окно никогда не выходило за ее пределы
+        for i in range(cycle, cycle + cols):
+            strip[i] = strip[i - cycle] if self._wrap else blank
+        self._strip = memoryview(strip)
+        self._cycle = cycle
+        self.reset()
+
+    def get_steps_per_pass(self) -> int:
+        """Возвращает количество шагов за один проход окна по ленте"""
+        # количество положений окна за один проход по ленте
+        positions = self._cycle if self._wrap else self._cycle + 1
+        return (positions + self._step - 1) // self._step
+
+    def get_position(self) -> int:
+        """Возвращает положение окна в ленте"""
+        return self._pos
+
+    def is_done(self) -> bool:
+        """Возвращает Истина, если однократная (wrap в Ложь) прокрутка завершена."""
+        return not self._wrap and self._pos > self._cycle
+
+    def reset(self):
+        """Возвращает окно в начало ленты."""
+        super().reset()
+        self._pos = 0
+
+    def step(self) -> bool:
+        """Выводит на дисплей текущее окно и сдвигает его. Возвращает Ложь, если однократная прокрутка завершена."""
+        if self.is_done():
+            return False
+        self._display.show_raw(self._strip, 0, self._pos, self._display.get_columns())
+        self._pos += self._step
+        if self._wrap and self._pos >= self._cycle:
+            # по кругу; пустая лента (cycle == 0) - окно на месте
+            self._pos = self._pos % self._cycle if self._cycle else 0
+        return True
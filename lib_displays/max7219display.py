@@ -1,6 +1,9 @@
 """Модуль для работы с индикаторами, состоящими из сегментов(!). MAX7219"""
 
+import sys
+import micropython
 from lib_displays.char_display_mod import CharDisplay
+from lib_displays.max7219mod import MAX7219
 # from lib_displays.display_controller_mod import ICharDisplayController
 
 '''Таблица битовых масок для основных символов для семисегментника с MAX7219.
@@ -25,16 +28,147 @@ from lib_displays.char_display_mod import CharDisplay
       —D—
             • DP'''
 
+'''B-код MAX7219 (декодирование знакоместа микросхемой): значение 0..15 в младших битах регистра знакоместа,
+десятичная точка - в бите 7:
+    0..9 - цифры, 10 - '-', 11 - 'E', 12 - 'H', 13 - 'L', 14 - 'P', 15 - пусто (пробел).'''
+
+# признак кода символа в кадре: младший байт - значение B-кода, а не сегменты
+code_b_flag = 0x100
+
+# Ядро вычисления маски B-кода: бит n установлен, если код знакоместа n кадра frame (16-ти битные коды) содержит
+# признак code_b_flag. Не более 8 знакомест. Определяется только в MicroPython (эмиттер viper).
+if "micropython" == sys.implementation.name:
+    @micropython.viper
+    def _code_b_mask(frame: ptr16, cnt: int) -> int:
+        mask = 0
+        bit = 1
+        i = 0
+        while i < cnt:
+            if frame[i] & 0x100:
+                mask |= bit
+            bit <<= 1
+            i += 1
+        return mask
+else:
+    # эмиттер viper недоступен (например, CPython). Используется код на Python.
+    _code_b_mask = None
+
+
 class MAX7219Display(CharDisplay):
-    """Символьный дисплей, на основе MAX7219. 1..8 символов в один ряд/строку."""
+    """Символьный дисплей, на основе MAX7219. 1..8 символов в один ряд/строку.
+    С контроллером MAX7219Chain (каскад из N микросхем) - 1..8*N символов в один ряд/строку.
+    Если включен B-код (code_b), то знакоместа с символами B-кода (цифры, '-', 'E', 'H', 'L', 'P', пробел)
+    декодируются микросхемой, остальные знакоместа - нет. Режим декодирования (set_decode контроллера)
+    вычисляется при передаче кадра и передается только при его изменении."""
+
+    # номера битов сегментов в коде символа
+    _seg_bits = {'g': 0, 'f': 1, 'e': 2, 'd': 3, 'c': 4, 'b': 5, 'a': 6, 'p': 7}
+    # символы B-кода, в порядке их значений
+    _code_b_chars = "0123456789-EHLP "
+
+    def __init__(self, controller: MAX7219, code_b: bool = True):
+        """
+        :param controller - контроллер MAX7219 или MAX7219Chain;
+        :param code_b - если Истина, то символы B-кода декодируются микросхемой (аппаратно)."""
+        if code_b:
+            # 16-ти битный кадр: бит 8 (code_b_flag) - признак значения B-кода
+            self.code_bits = 16
+        self._code_b = code_b
+        # сырые коды (сегменты) символов B-кода, по значению. Для знакомест каскада с отключенным декодированием
+        self._code_b_raw = bytearray(16)
+        super().__init__(controller=controller)
+        # Коды сегментов MAX7219 - 8-ми битные при любой разрядности кадра. Инвертированные (set_inverse_logic) коды
+        # не должны содержать старших битов, иначе они совпадут с признаком code_b_flag.
+        self._code_mask = 0xFF
+
+    def is_code_b(self) -> bool:
+        """Возвращает Истина, если символы B-кода декодируются микросхемой"""
+        return self._code_b
+
+    def compile_glyphs(self):
+        """Компилирует таблицу кодов символов (смотри CharDisplay.compile_glyphs).
+        Если включен B-код, то коды символов B-кода заменяются значениями B-кода с признаком code_b_flag.
+        Декодер B-кода микросхемы включает сегменты единицей, поэтому при инверсной логике (is_inverse_logic)
+        B-код не используется и все символы кодируются программно."""
+        super().compile_glyphs()
+        if not self._code_b or self.is_inverse_logic():
+            return
+        glyphs, glyphs_dp = self._glyphs, self._glyphs_dp
+        ascii_codes = self._ascii_codes
+        raw = self._code_b_raw
+        for value, char in enumerate(MAX7219Display._code_b_chars):
+            raw[value] = glyphs.get(char, self._np_code) & 0xFF
+            code = code_b_flag | value
+            glyphs[char] = code
+            glyphs_dp[char] = code | 0x80
+            c = ord(char)
+            ascii_codes[c] = code
+            ascii_codes[128 + c] = code | 0x80
+
+    def _update_decode(self):
+        """Вычисляет режим декодирования по кадру и передает его контроллеру, если он изменился.
+        Бит знакоместа установлен, если все существующие знакоместа каскада с этим номером в микросхеме содержат B-код.
+        В знакоместах, B-код которых не декодируется (каскад), значение B-кода заменяется сегментами."""
+        frame = self._frame
+        cnt = len(frame)
+        if cnt <= 8:
+            if _code_b_mask is not None:
+                mask = _code_b_mask(frame, cnt)
+            else:
+                mask = 0
+                bit = 1
+                for code in frame:
+                    if code & code_b_flag:
+                        mask |= bit
+                    bit <<= 1
+        else:
+            # Знакоместа с одинаковым номером во всех микросхемах каскада. Учитываются только существующие знакоместа:
+            # у последней микросхемы каскада их может быть меньше восьми.
+            mask = 0xFF
+            for i in range(cnt):
+                if not frame[i] & code_b_flag:
+                    mask &= ~(1 << (i & 7))
+            raw = self._code_b_raw
+            for i in range(cnt):
+                code = frame[i]
+                if code & code_b_flag and not mask & (1 << (i & 7)):
+                    frame[i] = raw[code & 0x0F] | (code & 0x80)
+        # Знакоместа, режим декодирования которых изменился, передаются следующим flush и без объявления теневой копии
+        # недействительной: признак code_b_flag их кодов в кадре отличается от признака в теневой копии.
+        controller = self._controller
+        if mask != controller.get_decode():
+            controller.set_decode(mask)
+
+    def flush(self):
+        """Передает контроллеру изменившиеся знакоместа кадра (смотри CharDisplay.flush).
+        Если включен B-код, то предварительно обновляется режим декодирования."""
+        if self._code_b and not (self._shadow_valid and self._frame == self._shadow):
+            self._update_decode()
+        super().flush()
+
+    def fill(self, code: int):
+        """Записывает сырой код символа code во все знакоместа (смотри CharDisplay.fill).
+        Если после обновления режима декодирования код части знакомест заменен сегментами (каскад),
+        то кадр передается по знакоместам (flush), а не командой заполнения контроллера."""
+        if self._code_b and self._auto_flush:
+            frame = self._frame
+            for index in range(len(frame)):
+                frame[index] = code
+            self._update_decode()
+            for value in frame:
+                if value != code:
+                    self.flush()
+                    return
+        super().fill(code)
 
     def get_segment_nbit(self, seg_name: str) -> int:
         """Возвращает номер бита, соответствующий сегменту с именем seg_name. Имя сегмента имеет длину один символ!"""
-        seg_map = {'g': 0, 'f': 1, 'e': 2, 'd': 3, 'c': 4, 'b': 5, 'a': 6, 'p': 7}
-        return  seg_map[seg_name]
+        return MAX7219Display._seg_bits[seg_name]
 
     def init(self, value: int = 0):
         """Инициализация"""
         self.set_partial_update(True)
+        self.set_span_update(True)
         self.set_inverse_logic(False)
         self.set_reverse_index(True)
+        self.compile_glyphs()
@@ -23,6 +23,8 @@ class MAX7219(ICharDisplayController):
     cmd_scan_limit = const(11)  # предел сканирования. устанавливает количество отображаемых цифр, от 1 до 8.
     cmd_shutdown = const(12)    # включение/отключение дисплея
     cmd_display_test = const(15)    # включение/отключение режима проверки дисплея
+    # управляющие регистры в порядке их восстановления методом resync (выключение/включение последним)
+    _control_regs = (cmd_decode_mode, cmd_scan_limit, cmd_intensity, cmd_display_test, cmd_shutdown)
 
     def __init__(self, adapter: bus_service.SpiAdapter, chip_select: Pin):
         """
@@ -36,6 +38,19 @@ class MAX7219(ICharDisplayController):
         self._rows = None
         # для пересылки по шине
         self._packet = bytearray(2)
+        # пакеты всех восьми знакомест: адрес регистра знакоместа, код символа. Адреса записываются один раз
+        self._frame_packet = bytearray(16)
+        for digit in range(8):
+            self._frame_packet[2 * digit] = MAX7219.cmd_digit_0 + digit
+        # срезы пакетов знакомест, создаются один раз, чтобы не выделять память при выводе
+        _mv = memoryview(self._frame_packet)
+        self._digit_views = tuple(_mv[2 * digit:2 * digit + 2] for digit in range(8))
+        # транзакция на шине для вывода нескольких знакомест, создается один раз
+        self._transaction = adapter.transaction(chip_select)
+        # теневая копия управляющих регистров (индекс - адрес регистра)
+        self._regs = bytearray(16)
+        # биты адресов регистров, значения которых в теневой копии известны
+        self._regs_known = 0
 
     def _setup_bus(self):
         """Настройки для правильной передачи данных по шине."""
@@ -49,18 +64,54 @@ class MAX7219(ICharDisplayController):
         перед каждой записью в шину необходима её настройка!"""
         if setup_bus:
             self._setup_bus()
-        self._cs(0)
+        # выбором чипа управляет адаптер шины
         self._connector.write(buf)
-        self._cs(1)
+
+    def _write_digits(self, first: int, count: int):
+        """Передает пакеты знакомест first..first+count-1 из пакета кадра одной транзакцией на шине,
+        по одному импульсу выбора чипа (защелкивание) на знакоместо. count > 0."""
+        views = self._digit_views
+        with self._transaction as tr:
+            tr.write(views[first])
+            for digit in range(first + 1, first + count):
+                tr.latch()
+                tr.write(views[digit])
 
     def send_cmd(self, command: int, value: int):
         """Пересылает пакет данных устройству по шине."""
-        valid_rng = range(16)
-        check_value(command, valid_rng, f"Код 0x{value:x} команды вне диапазона {valid_rng}!")
+        if not 0 <= command < 16:
+            raise ValueError(f"Код 0x{command:x} команды вне диапазона 0..15!")
         _p = self._packet
         _p[0], _p[1] = command, value
         self._write(_p)
 
+    def _set_reg(self, command: int, value: int):
+        """Записывает значение value в управляющий регистр command, если оно отличается от записанного ранее."""
+        bit = 1 << command
+        if self._regs_known & bit and self._regs[command] == value:
+            return
+        self.send_cmd(command, value)
+        self._regs[command] = value
+        self._regs_known |= bit
+
+    # IDisplayController
+    def resync(self):
+        """Повторно передает значения всех записанных ранее управляющих регистров."""
+        regs, known = self._regs, self._regs_known
+        for command in MAX7219._control_regs:
+            if known & (1 << command):
+                self.send_cmd(command, regs[command])
+
+    def get_brightness(self) -> int:
+        """Возвращает значение установленной ранее яркости или None"""
+        if self._regs_known & (1 << MAX7219.cmd_intensity):
+            return self._regs[MAX7219.cmd_intensity]
+
+    def get_decode(self) -> int:
+        """Возвращает значение установленного ранее режима декодирования (смотри set_decode) или None"""
+        if self._regs_known & (1 << MAX7219.cmd_decode_mode):
+            return self._regs[MAX7219.cmd_decode_mode]
+
     # IDisplayController
     def get_columns(self) ->int:
         """Возвращает кол-во столбцов элементов дисплея."""
@@ -74,38 +125,84 @@ class MAX7219(ICharDisplayController):
     # IDisplayController
     def set_char(self, code: int, x: int, y: int):
         """
-        :param code - код, соответствующий отображению определенного символа на семисегментном индикаторе;
+        :param code - код, соответствующий отображению определенного символа на семисегментном индикаторе.
+        Передается младший байт кода, старшие биты (признаки дисплея, например B-кода) не учитываются;
         :param x - индекс положения, определяющий положение символа. 0..количество_столбцов-1;
         :param y - индекс положения, определяющий положение символа. 0..строк-1;"""
-        check_value(x, range(self.get_columns()), f"Неверная позиция символа с кодом 0x{code:x}")
-        self.send_cmd(MAX7219.cmd_digit_0 + x, code)
+        if not 0 <= x < self._columns:
+            raise ValueError(f"Неверная позиция символа с кодом 0x{code:x}")
+        _p = self._packet
+        _p[0], _p[1] = MAX7219.cmd_digit_0 + x, code & 0xFF
+        self._write(_p)
+
+    def set_span(self, char_codes, x: int, y: int = 0):
+        """Выводит коды символов из char_codes в соседние знакоместа, начиная с позиции x, одной транзакцией на шине.
+        :param char_codes - последовательность кодов символов;
+        :param x - позиция первого символа;
+        :param y - не используется!"""
+        cnt = len(char_codes)
+        if 0 == cnt:
+            return
+        if not 0 <= x <= self._columns - cnt:
+            raise ValueError(f"Неверная позиция первого символа: {x}")
+        _p = self._frame_packet
+        index = 2 * x + 1
+        for code in char_codes:
+            _p[index] = code & 0xFF
+            index += 2
+        self._write_digits(x, cnt)
+
+    def set_frame(self, char_codes):
+        """Выводит коды символов во все знакоместа (char_codes[0] - в нулевое) одной транзакцией на шине,
+        без проверки каждого кода. Длина char_codes должна быть равна количеству знакомест.
+        Самый быстрый способ обновить весь дисплей."""
+        cnt = self._columns
+        if len(char_codes) != cnt:
+            raise ValueError(f"Количество кодов символов не равно {cnt}!")
+        _p = self._frame_packet
+        for i in range(cnt):
+            _p[2 * i + 1] = char_codes[i] & 0xFF
+        self._write_digits(0, cnt)
+
+    def set_all(self, char_codes):
+        """Выводит коды символов во все знакоместа, начиная с нулевого."""
+        self.set_frame(char_codes)
+
+    def fill(self, char_code: int):
+        """Записывает код символа char_code во все знакоместа одной транзакцией на шине."""
+        cnt = self._columns
+        _p = self._frame_packet
+        char_code &= 0xFF
+        for i in range(1, 2 * cnt, 2):
+            _p[i] = char_code
+        self._write_digits(0, cnt)
 
     # IDisplayController
     def set_brightness(self, value: int):
         """Устанавливает яркость всех знакомест одновременно.
         :param value Значение в диапазоне 0..15"""
         check_value(value, range(16), f"Яркость вне диапазона: {value}")
-        self.send_cmd(MAX7219.cmd_intensity, value)
+        self._set_reg(MAX7219.cmd_intensity, value)
 
     # IDisplayController
     def _set_scan_limit(self, value: int):
         """Устанавливает количеством семисегментных (или светодиодных) индикаторов, которые обновляются микросхемой.
         Указывает, сколько из подключённых индикаторов следует отображать и обновлять. Определяет максимальный индекс активного индикатора."""
-        check_value(value, range(1, 9), f"Превышен предел сканирования: {value}")
-        self.send_cmd(MAX7219.cmd_scan_limit, value)
+        check_value(value, range(8), f"Превышен предел сканирования: {value}")
+        self._set_reg(MAX7219.cmd_scan_limit, value)
 
     # IDisplayController
     def set_shutdown(self, value: bool):
         """Включает/отключает дисплей.
         :param value Если Истина, то дисплей переводится в режим shutdown/выключено."""
-        self.send_cmd(MAX7219.cmd_shutdown, int(not value))
+        self._set_reg(MAX7219.cmd_shutdown, int(not value))
 
     # IDisplayController
     def set_display_test(self, value: bool):
         """Если value Истина, то дисплей переводится в режим проверки с включением всех сегментов!
         Внимание! В режиме проверки дисплея (все сегменты включены) до тех пор, пока регистр проверки дисплея не будет
         перенастроен для нормальной работы!"""
-        self.send_cmd(MAX7219.cmd_display_test, 1 if value else 0)
+        self._set_reg(MAX7219.cmd_display_test, 1 if value else 0)
 
     def set_decode(self, decode_bits: int):
         """Устанавливает режим декодирования знакоместа!
@@ -115,7 +212,7 @@ class MAX7219(ICharDisplayController):
         Если в бите номер 7, decode_bits, установлена 1, то седьмое знакоместо декодируется B - кодом. Иначе декодирование отключено!
         """
         check_value(decode_bits, range(0x100), f"Значение вне диапазона: {decode_bits}")
-        self.send_cmd(MAX7219.cmd_decode_mode, int(decode_bits))
+        self._set_reg(MAX7219.cmd_decode_mode, int(decode_bits))
 
     # IDisplayController
     def init(self, columns: int = 8, rows: int = 1, value: int = 0):
@@ -123,7 +220,9 @@ class MAX7219(ICharDisplayController):
         if columns <= 0 or rows <= 0:
             raise ValueError(f"Неверное значение строк: {rows} или столбцов: {columns}!")
         self._columns = columns
-        self._rows = columns
+        self._rows = rows
+        # состояние регистров после включения питания неизвестно
+        self._regs_known = 0
         #
         self.set_shutdown(True) # ВЫКлючаю дисплей
         self.set_decode(0x00)   # отключаю В-код
@@ -131,3 +230,133 @@ class MAX7219(ICharDisplayController):
         self.set_display_test(False)
         self.set_shutdown(False)    # ВКлючаю дисплей
 
+
+class MAX7219Chain(MAX7219):
+    """Каскад из count последовательно соединенных (выход DOUT к входу DIN следующей) MAX7219 с общим выводом
+    выбора чипа. Представляется одним широким дисплеем из 8 * count знакомест.
+    Микросхема с номером 0 подключена к MCU и отображает знакоместа 0..7, микросхема с номером 1 - знакоместа 8..15 и т. д.
+    За одну транзакцию (один импульс выбора чипа) по шине передается по одному 16-ти битному слову для каждой микросхемы,
+    поэтому обновление всех знакомест каскада требует 8 транзакций. Микросхемам, регистры которых не изменяются,
+    передается команда 'нет операции'."""
+
+    def __init__(self, adapter: bus_service.SpiAdapter, chip_select: Pin, count: int):
+        """
+        :param adapter - адаптер шины.
+        :param chip_select - вывод МК, управляющий выводами выбора чипа всех микросхем каскада.
+        :param count - количество микросхем в каскаде."""
+        check_value(count, range(1, 33), f"Неверное количество микросхем в каскаде: {count}")
+        super().__init__(adapter=adapter, chip_select=chip_select)
+        self._count = count
+        # пакет для всего каскада. Первым передается слово для последней микросхемы каскада!
+        self._chain_packet = bytearray(2 * count)
+
+    def get_chip_count(self) -> int:
+        """Возвращает количество микросхем в каскаде"""
+        return self._count
+
+    def _chip_offset(self, chip: int) -> int:
+        """Возвращает индекс первого байта слова микросхемы с номером chip в пакете каскада."""
+        return 2 * (self._count - 1 - chip)
+
+    def _clear_packet(self):
+        """Заполняет пакет каскада командой 'нет операции'."""
+        _p = self._chain_packet
+        for i in range(len(_p)):
+            _p[i] = MAX7219.cmd_nop
+
+    def send_cmd(self, command: int, value: int):
+        """Пересылает команду всем микросхемам каскада одной транзакцией."""
+        if not 0 <= command < 16:
+            raise ValueError(f"Код 0x{command:x} команды вне диапазона 0..15!")
+        _p = self._chain_packet
+        for i in range(0, len(_p), 2):
+            _p[i] = command
+            _p[i + 1] = value
+        self._write(_p)
+
+    # IDisplayController
+    def set_char(self, code: int, x: int, y: int):
+        """
+        :param code - код, соответствующий отображению определенного символа на семисегментном индикаторе;
+        :param x - индекс положения символа. 0..количество_столбцов-1;
+        :param y - не используется!"""
+        if not 0 <= x < self._columns:
+            raise ValueError(f"Неверная позиция символа с кодом 0x{code:x}")
+        self._clear_packet()
+        _p = self._chain_packet
+        offs = self._chip_offset(x // 8)
+        _p[offs] = MAX7219.cmd_digit_0 + x % 8
+        _p[offs + 1] = code & 0xFF
+        self._write(_p)
+
+    def set_span(self, char_codes, x: int, y: int = 0):
+        """Выводит коды символов из char_codes в соседние знакоместа каскада, начиная с позиции x.
+        Знакоместа с одинаковым номером во всех микросхемах передаются одной транзакцией,
+        поэтому транзакций не больше восьми."""
+        cnt = len(char_codes)
+        if 0 == cnt:
+            return
+        if not 0 <= x <= self._columns - cnt:
+            raise ValueError(f"Неверная позиция первого символа: {x}")
+        _p = self._chain_packet
+        stop = x + cnt
+        for digit in range(8):
+            used = False
+            for chip in range(self._count):
+                pos = 8 * chip + digit
+                offs = self._chip_offset(chip)
+                if x <= pos < stop:
+                    _p[offs] = MAX7219.cmd_digit_0 + digit
+                    _p[offs + 1] = char_codes[pos - x] & 0xFF
+                    used = True
+                else:
+                    _p[offs] = MAX7219.cmd_nop
+                    _p[offs + 1] = 0
+            if used:
+                self._write(_p)
+
+    def set_frame(self, char_codes):
+        """Выводит коды символов во все знакоместа каскада. Длина char_codes должна быть равна количеству знакомест."""
+        cnt = self._columns
+        if len(char_codes) != cnt:
+            raise ValueError(f"Количество кодов символов не равно {cnt}!")
+        self.set_span(char_codes, 0)
+
+    def fill(self, char_code: int):
+        """Записывает код символа char_code во все знакоместа. Знакоместо с одинаковым номером во всех микросхемах
+        записывается одной транзакцией, поэтому транзакций не больше восьми. Неиспользуемым знакоместам последней
+        микросхемы (количество знакомест не кратно восьми) передается команда 'нет операции': предел сканирования
+        у всех микросхем каскада одинаковый, и эти знакоместа тоже отображаются."""
+        columns = self._columns
+        code = char_code & 0xFF
+        _p = self._chain_packet
+        for digit in range(min(columns, 8)):
+            for chip in range(self._count):
+                offs = self._chip_offset(chip)
+                if 8 * chip + digit < columns:
+                    _p[offs] = MAX7219.cmd_digit_0 + digit
+                    _p[offs + 1] = code
+                else:
+                    _p[offs] = MAX7219.cmd_nop
+                    _p[offs + 1] = 0
+            self._write(_p)
+
+    # IDisplayController
+    def init(self, columns: int = None, rows: int = 1, value: int = 0):
+        """Первоначальная настройка каскада. Вызывать сразу после конструктора!
+        :param columns - количество знакомест. Если None, то 8 * количество микросхем."""
+        max_columns = 8 * self._count
+        if columns is None:
+            columns = max_columns
+        if columns <= 0 or columns > max_columns or rows <= 0:
+            raise ValueError(f"Неверное значение строк: {rows} или столбцов: {columns}!")
+        self._columns = columns
+        self._rows = rows
+        # состояние регистров после включения питания неизвестно
+        self._regs_known = 0
+        #
+        self.set_shutdown(True) # ВЫКлючаю дисплей
+        self.set_decode(0x00)   # отключаю В-код
+        self._set_scan_limit(min(columns, 8) - 1)
+        self.set_display_test(False)
+        self.set_shutdown(False)    # ВКлючаю дисплей
@@ -0,0 +1,59 @@
+"""Общая основа воспроизведения по шагам (бегущая строка, анимация) для символьных дисплеев."""
+
+# micropython
+# MIT license
+
+import time
+from lib_displays.char_display_mod import CharDisplay
+
+
+class Playback:
+    """Основа воспроизведения по шагам с периодом period_ms: неблокирующий (update) и блокирующий (run) варианты.
+    Наследники (Marquee, Animation) реализуют step, get_steps_per_pass и is_done."""
+
+    def __init__(self, display: CharDisplay, period_ms: int):
+        """
+        :param display: символьный дисплей, на который выводится изображение;
+        :param period_ms: период шага в мс, для методов update и run."""
+        self._display = display
+        self._period_ms = period_ms
+        # время последнего шага
+        self._last_ms = None
+
+    def get_period_ms(self) -> int:
+        """Возвращает период шага в мс"""
+        return self._period_ms
+
+    def get_steps_per_pass(self) -> int:
+        """Возвращает количество шагов за один проход. Для переопределения в классах-наследниках!"""
+        raise NotImplementedError
+
+    def is_done(self) -> bool:
+        """Возвращает Истина, если однократное воспроизведение завершено."""
+        return False
+
+    def reset(self):
+        """Возвращает воспроизведение в начало."""
+        self._last_ms = None
+
+    def step(self) -> bool:
+        """Выводит на дисплей текущее изображение и переходит к следующему.
+        Возвращает Ложь, если однократное воспроизведение завершено. Для переопределения в классах-наследниках!"""
+        raise NotImplementedError
+
+    def update(self) -> bool:
+        """Неблокирующий вариант: выполняет шаг, если с момента предыдущего шага прошло period_ms.
+        Вызывать часто, например из главного цикла. Возвращает Истина, если шаг был выполнен."""
+        now = time.ticks_ms()
+        last = self._last_ms
+        if last is not None and time.ticks_diff(now, last) < self._period_ms:
+            return False
+        self._last_ms = now
+        return self.step()
+
+    def run(self, cycles: int = 1):
+        """Блокирующий вариант: выполняет cycles проходов с периодом period_ms."""
+        for _ in range(cycles * self.get_steps_per_pass()):
+            if not self.step():
+                break
+            time.sleep_ms(self._period_ms)
@@ -0,0 +1,24 @@
+"""Таблицы алфавита русского языка для 14-ти сегментного индикатора на базе VK16K33 (смотри alphabet_mod.Alphabet)."""
+# Созданы из словаря модуля ru_lang_14_seg.py функцией alphabet_mod.make_ranges.
+# Два байта (little endian) на символ, 0xFFFF - символ не отображается.
+
+# micropython
+# MIT license
+
+ranges = (
+    # 'c'
+    (0x0063,
+     b"\xd8\x00",
+     ),
+    # 'А'..'ь'
+    (0x0410,
+     b"\x86\x0c\x71\x08\x0f\x12\x31\x00\xd6\x04\x79\x00\xc0\x3f\x49\x24"
+     b"\x36\x0c\xff\xff\x70\x24\x06\x0c\x36\x05\xf6\x00\x3f\x00\x37\x00"
+     b"\xf3\x00\x39\x00\x01\x12\x00\x0d\xe3\x12\x00\x2d\x38\x12\x86\x02"
+     b"\x3e\x12\x3e\x32\xff\xff\x76\x08\xff\xff\x49\x24\x76\x24\xe7\x08"
+     b"\xff\xff\xff\xff\xff\xff\x50\x00\xff\xff\xff\xff\xff\xff\xff\xff"
+     b"\xff\xff\xff\xff\xff\xff\x84\x08\xff\xff\xff\xff\xff\xff\xd4\x00"
+     b"\xff\xff\xff\xff\xc0\x12\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff"
+     b"\xff\xff\xff\xff\xff\xff\xff\xff\x70\x08",
+     ),
+)
@@ -29,22 +29,12 @@ from lib_displays.display_controller_mod import ICharDisplayController
 class ShiftReg8Display(CharDisplay):
     """Символьный дисплей, на основе 74HC595 с общим катодом. 1..N символов в один ряд/строку."""
 
-    def __init__(self, controller: ICharDisplayController):
-        super().__init__(controller=controller)
-        # для хранения пересылаемых кодов символов
-        self._buf = bytearray(controller.get_columns())
-
-    def set_buf(self, index: int, value: int) -> bytes:
-        """Записывает значение value в буфер по индексу index.
-        Для переопределения в классах-наследниках."""
-        buf = self._buf
-        buf[index] = value
-        return buf
+    # номера битов сегментов в коде символа
+    _seg_bits = {'g': 6, 'f': 5, 'e': 4, 'd': 3, 'c': 2, 'b': 1, 'a': 0, 'p': 7}
 
     def get_segment_nbit(self, seg_name: str) -> int:
         """Возвращает номер бита, соответствующий сегменту с именем seg_name. Имя сегмента имеет длину один символ!"""
-        seg_map = {'g': 6, 'f': 5, 'e': 4, 'd': 3, 'c': 2, 'b': 1, 'a': 0, 'p': 7}
-        return  seg_map[seg_name]
+        return ShiftReg8Display._seg_bits[seg_name]
 
     def init(self, value: int = 0):
         """Инициализация"""
@@ -53,3 +43,4 @@ class ShiftReg8Display(CharDisplay):
         self.set_partial_update(False)
         # выводится символ, сегменты A-G-D включены, если char не может быть отображен на индикаторе!
         # self.set_non_printable('adg')
+        self.compile_glyphs()
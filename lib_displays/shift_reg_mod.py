@@ -5,10 +5,10 @@
 # micropython
 # MIT license
 
-from machine import Pin
+from machine import Pin, Timer
 #from micropython import const
 from sensor_pack_2 import bus_service
-# from sensor_pack_2.base_sensor import DeviceEx #, check_value
+from sensor_pack_2.base_sensor import check_value
 from lib_displays.display_controller_mod import ICharDisplayController
 
 # Пример инициализация SPI (укажите свои пины!)
@@ -59,10 +59,269 @@ class SPLReg8(ICharDisplayController):
         """для контроллеров, не поддерживающих запись в отдельные позиции."""
         self._write(char_codes)
 
+    def fill(self, char_code: int):
+        """Записывает код символа char_code во все знакоместа, из буфера шаблона адаптера (write_const)."""
+        self._adapter.write_const(self._load_out, char_code, self.get_columns())
+
+    # IDisplayController
+    def init(self, columns: int = 4, rows: int = 1, value: int = 0):
+        """Первоначальная настройка дисплея. Вызывать сразу после конструктора!"""
+        if columns <= 0 or rows <= 0:
+            raise ValueError(f"Неверное значение строк: {rows} или столбцов: {columns}!")
+        self._columns = columns
+        self._rows = rows
+
+
+def _idle_select_code(select_codes: bytes, active_low: bool) -> int:
+    """Возвращает код регистра выбора, при котором ни одно знакоместо не выбрано, по кодам выбора знакомест.
+    Бит кода выбора находится в неактивном состоянии в большинстве кодов (один активный бит на знакоместо),
+    поэтому неактивное значение бита - значение большинства. Биты, одинаковые во всех кодах, сохраняются.
+    Для одного или двух знакомест большинства нет, и неактивное значение определяет active_low."""
+    cnt = len(select_codes)
+    if cnt < 3:
+        return 0xFF if active_low else 0x00
+    idle = 0
+    for bit in range(8):
+        mask = 1 << bit
+        ones = 0
+        for code in select_codes:
+            if code & mask:
+                ones += 1
+        if 2 * ones > cnt:
+            idle |= mask
+    return idle
+
+
+class SPLReg8Mux(ICharDisplayController):
+    """Программное представление дисплея с динамической индикацией на основе 74HC595.
+    Один регистр управляет сегментами всех знакомест, знакоместа выбираются по очереди вторым регистром, включенным
+    в цепочку с первым, или выводами MCU (digit_pins). Сканирование выполняется из обработчика прерывания таймера
+    (machine.Timer), без выделения памяти: кадры сканирования (код сегментов и код выбора знакоместа) для каждого
+    знакоместа вычисляются заранее, в методе set_all. Обработчик передает кадры прямо в шину (SPI.write) и формирует
+    импульс загрузки выводом load_out, минуя адаптер и его статистику обмена (BusStats выделяет память).
+    Каждое знакоместо включено в течение on_ticks из duty_steps прерываний своего интервала. Частота прерываний
+    равна refresh_hz * количество_знакомест * duty_steps. Увеличение частоты обновления и числа шагов уменьшает
+    мерцание и увеличивает нагрузку на CPU."""
+
+    def __init__(self, adapter: bus_service.SpiAdapter, load_out: Pin, digit_select_codes: bytes = None,
+                 digit_pins: tuple = None, digit_active_low: bool = False, segments_first: bool = True,
+                 refresh_hz: int = 100, duty_steps: int = 1):
+        """
+        :param adapter: адаптер шины (должен быть предварительно настроен, SpiAdapter(bus, data_mode = None))
+        :param load_out: вывод МК, управляющий выводом загрузки данных сдвигового регистра в выходной буфер
+        :param digit_select_codes: коды регистра выбора знакоместа, по одному на знакоместо, в порядке индексов знакомест.
+        ShiftReg8Display использует обратный порядок индексов (set_reverse_index), поэтому индекс 0 - крайнее правое знакоместо.
+        Если None, то 1 << индекс_знакоместа (с инверсией, если digit_active_low). Не используется, если задан digit_pins;
+        :param digit_pins: выводы МК, выбирающие знакоместа (вместо второго регистра), в порядке индексов знакомест;
+        :param digit_active_low: если Истина, то знакоместо выбирается нулем (индикаторы с общим катодом через транзистор и т. п.);
+        :param segments_first: если Истина, то код сегментов передается по шине первым (оказывается в дальнем регистре цепочки);
+        :param refresh_hz: частота обновления всего дисплея, Гц;
+        :param duty_steps: количество прерываний таймера на интервал одного знакоместа (разрешение скважности).
+        """
+        check_value(refresh_hz, range(1, 10_001), f"Частота обновления вне диапазона: {refresh_hz}")
+        check_value(duty_steps, range(1, 65), f"Количество шагов скважности вне диапазона: {duty_steps}")
+        self._adapter = adapter
+        self._load_out = load_out
+        self._select_codes = digit_select_codes
+        self._digit_pins = digit_pins
+        self._active_low = digit_active_low
+        self._segments_first = segments_first
+        self._refresh_hz = refresh_hz
+        self._duty_steps = duty_steps
+        # количество включенных шагов из duty_steps
+        self._on_ticks = duty_steps
+        # количество знакомест дисплея в ширину
+        self._columns = None
+        # количество знакомест дисплея в высоту
+        self._rows = None
+        # кадры сканирования и представления (memoryview) каждого из них, для передачи без выделения памяти
+        self._scan_frames = None
+        self._scan_views = None
+        # кадр, гасящий все знакоместа
+        self._blank_view = None
+        # индекс байта кода сегментов в кадре сканирования
+        self._seg_index = 0
+        # состояние сканирования
+        self._digit = 0
+        self._tick = 0
+        # таймер, от которого выполняется сканирование, и последний использованный таймер
+        self._timer = None
+        self._last_timer = None
+        # ссылка на обработчик прерывания таймера (создается один раз, чтобы не выделять память)
+        self._scan_ref = self._scan
+        # связанные методы шины и вывода загрузки для обработчика прерывания (создаются один раз)
+        self._bus_write = adapter.bus.write
+        self._load_value = load_out.value
+
+    def _write(self, buf):
+        """Запись сырых данных в регистры: передача по шине и импульс загрузки. Вызывается из обработчика прерывания,
+        поэтому адаптер шины (и его статистика обмена) не используется. Выделения памяти нет!"""
+        load = self._load_value
+        load(0)
+        self._bus_write(buf)
+        load(1)
+
+    # IDisplayController
+    def get_columns(self) -> int:
+        """Возвращает кол-во столбцов элементов дисплея."""
+        return self._columns
+
+    # IDisplayController
+    def get_rows(self) -> int:
+        """Возвращает кол-во строк элементов дисплея."""
+        return self._rows
+
+    def _digit_off(self, digit: int):
+        """Выключает вывод МК выбора знакоместа digit"""
+        self._digit_pins[digit].value(self._active_low)
+
+    def _digit_on(self, digit: int):
+        """Включает вывод МК выбора знакоместа digit"""
+        self._digit_pins[digit].value(not self._active_low)
+
+    def _scan(self, timer):
+        """Обработчик прерывания таймера. Выделения памяти нет!"""
+        tick = self._tick
+        digit = self._digit
+        pins = self._digit_pins
+        if 0 == tick:
+            # при нулевой яркости знакоместо не включается
+            lit = 0 != self._on_ticks
+            if pins:
+                self._digit_off(digit - 1 if digit else len(pins) - 1)
+                if lit:
+                    self._write(self._scan_views[digit])
+                    self._digit_on(digit)
+            else:
+                self._write(self._scan_views[digit] if lit else self._blank_view)
+        elif tick == self._on_ticks:
+            if pins:
+                self._digit_off(digit)
+            else:
+                self._write(self._blank_view)
+        tick += 1
+        if tick >= self._duty_steps:
+            tick = 0
+            digit += 1
+            if digit >= self._columns:
+                digit = 0
+            self._digit = digit
+        self._tick = tick
+
+    def set_all(self, char_codes: bytes):
+        """Обновляет коды сегментов в кадрах сканирования. Обмена по шине нет, его выполняет обработчик прерывания таймера."""
+        frames = self._scan_frames
+        index = self._seg_index
+        stride = 1 if self._digit_pins else 2
+        for code in char_codes:
+            frames[index] = code
+            index += stride
+
+    def fill(self, char_code: int):
+        """Записывает код символа char_code в кадры сканирования всех знакомест."""
+        frames = self._scan_frames
+        stride = 1 if self._digit_pins else 2
+        for index in range(self._seg_index, stride * self._columns, stride):
+            frames[index] = char_code
+
+    # IDisplayController
+    def set_brightness(self, value: int):
+        """Устанавливает яркость (количество включенных шагов из duty_steps) всех знакомест одновременно.
+        :param value: значение в диапазоне 0..duty_steps"""
+        check_value(value, range(self._duty_steps + 1), f"Яркость вне диапазона: {value}")
+        self._on_ticks = value
+
+    def get_duty(self) -> tuple:
+        """Возвращает скважность свечения знакоместа: (количество включенных шагов, количество шагов)."""
+        return self._on_ticks, self._duty_steps
+
+    def get_refresh_rate(self) -> int:
+        """Возвращает частоту обновления всего дисплея, Гц."""
+        return self._refresh_hz
+
+    def get_interrupt_rate(self) -> int:
+        """Возвращает частоту прерываний таймера, Гц. Определяет нагрузку на CPU."""
+        return self._refresh_hz * self._columns * self._duty_steps
+
+    def set_refresh_rate(self, refresh_hz: int, duty_steps: int = None):
+        """Изменяет частоту обновления дисплея и, если duty_steps не None, количество шагов скважности.
+        Если сканирование запущено, то таймер перезапускается."""
+        check_value(refresh_hz, range(1, 10_001), f"Частота обновления вне диапазона: {refresh_hz}")
+        if duty_steps is not None:
+            check_value(duty_steps, range(1, 65), f"Количество шагов скважности вне диапазона: {duty_steps}")
+            # яркость сохраняется пропорционально
+            self._on_ticks = self._on_ticks * duty_steps // self._duty_steps
+            self._duty_steps = duty_steps
+        self._refresh_hz = refresh_hz
+        timer = self._timer
+        if timer is not None:
+            self.start(timer)
+
+    def start(self, timer: Timer):
+        """Запускает сканирование от таймера timer (например Timer(0) на ESP32 или Timer() на RP2040)."""
+        self.stop()
+        self._tick = 0
+        self._digit = 0
+        self._timer = self._last_timer = timer
+        timer.init(freq=self.get_interrupt_rate(), mode=Timer.PERIODIC, callback=self._scan_ref)
+
+    def stop(self):
+        """Останавливает сканирование и гасит дисплей."""
+        timer = self._timer
+        if timer is None:
+            return
+        timer.deinit()
+        self._timer = None
+        pins = self._digit_pins
+        if pins:
+            for digit in range(len(pins)):
+                self._digit_off(digit)
+        else:
+            self._write(self._blank_view)
+
+    # IDisplayController
+    def set_shutdown(self, value: bool):
+        """Если value Истина, то сканирование останавливается и дисплей гаснет. Иначе сканирование возобновляется."""
+        if value:
+            self.stop()
+        elif self._last_timer is not None:
+            self.start(self._last_timer)
+
     # IDisplayController
     def init(self, columns: int = 4, rows: int = 1, value: int = 0):
         """Первоначальная настройка дисплея. Вызывать сразу после конструктора!"""
         if columns <= 0 or rows <= 0:
             raise ValueError(f"Неверное значение строк: {rows} или столбцов: {columns}!")
+        pins = self._digit_pins
+        if pins is not None and len(pins) != columns:
+            raise ValueError(f"Количество выводов выбора знакомест должно быть равно {columns}!")
         self._columns = columns
-        self._rows = columns
+        self._rows = rows
+        if pins:
+            # кадр сканирования - только код сегментов
+            frames = bytearray(columns + 1)
+            self._seg_index = 0
+            self._scan_views = [memoryview(frames)[i:i + 1] for i in range(columns)]
+            self._blank_view = memoryview(frames)[columns:]
+            for digit in range(columns):
+                self._digit_off(digit)
+        else:
+            # кадр сканирования - код сегментов и код выбора знакоместа
+            select_codes = self._select_codes
+            if select_codes is None:
+                select_codes = bytes((1 << i) & 0xFF for i in range(columns))
+                if self._active_low:
+                    select_codes = bytes(0xFF & ~c for c in select_codes)
+            if len(select_codes) != columns:
+                raise ValueError(f"Количество кодов выбора знакомест должно быть равно {columns}!")
+            frames = bytearray(2 * (columns + 1))
+            seg_index = 0 if self._segments_first else 1
+            self._seg_index = seg_index
+            for digit in range(columns):
+                frames[2 * digit + 1 - seg_index] = select_codes[digit]
+            # гасящий кадр: ни одно знакоместо не выбрано
+            frames[2 * columns + 1 - seg_index] = _idle_select_code(select_codes, self._active_low)
+            mv = memoryview(frames)
+            self._scan_views = [mv[2 * i:2 * i + 2] for i in range(columns)]
+            self._blank_view = mv[2 * columns:]
+        self._scan_frames = frames
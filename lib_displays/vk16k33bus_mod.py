@@ -0,0 +1,146 @@
+"""Менеджер нескольких дисплеев на основе VK16K33 на одной шине I2C."""
+
+# micropython
+# MIT license
+
+import time
+from sensor_pack_2 import bus_service
+from sensor_pack_2.base_sensor import check_value
+from lib_displays.vk16k33mod import VK16K33
+from lib_displays.vk16k33display import VK16K33Display
+
+
+class VK16K33Bus:
+    """Менеджер дисплеев VK16K33 (адреса 0x70..0x77) на одной шине I2C.
+    Дисплеи, созданные методом add, не обращаются к шине при выводе: методы вывода только изменяют кадр.
+    Изменившиеся кадры передаются методом flush, по очереди (по кругу). Передаются только изменившиеся знакоместа,
+    каждый непрерывный участок одной пакетной (burst) записью в память дисплея. Продолжительность одного вызова flush ограничивается бюджетом времени шины,
+    дисплеи, не уместившиеся в бюджет, передаются следующим вызовом flush первыми."""
+
+    def __init__(self, adapter: bus_service.I2cAdapter, budget_us: int = None, bus_freq: int = 400_000):
+        """
+        :param adapter: адаптер шины I2C, общий для всех дисплеев;
+        :param budget_us: бюджет времени шины в мкс на один вызов flush. None - без ограничения;
+        :param bus_freq: тактовая частота шины I2C в Гц, для оценки времени передачи кадра (estimate_us).
+        """
+        check_value(bus_freq, range(1_000, 5_000_001), f"Частота шины вне диапазона: {bus_freq}")
+        self._adapter = adapter
+        self._budget_us = budget_us
+        self._bus_freq = bus_freq
+        # зарегистрированные дисплеи, в порядке добавления, и их контроллеры
+        self._displays = []
+        self._controllers = []
+        # индекс дисплея, с которого начинается следующий проход flush
+        self._next = 0
+
+    def get_adapter(self) -> bus_service.I2cAdapter:
+        """Возвращает адаптер шины"""
+        return self._adapter
+
+    def get_budget_us(self) -> int:
+        """Возвращает бюджет времени шины в мкс на один вызов flush или None"""
+        return self._budget_us
+
+    def set_budget_us(self, value: int):
+        """Устанавливает бюджет времени шины в мкс на один вызов flush. None - без ограничения."""
+        if value is not None and value <= 0:
+            raise ValueError(f"Неверное значение бюджета: {value}")
+        self._budget_us = value
+
+    def add(self, address: int, alpha_letters, columns: int = 4, big_byte_order: bool = False) -> VK16K33Display:
+        """Создает и инициализирует контроллер VK16K33 с адресом address на общей шине и дисплей на его основе.
+        Возвращает дисплей. Вывод на дисплей не обращается к шине, передачу выполняет flush.
+        :param address: адрес на шине, 0x70..0x77;
+        :param alpha_letters: словарь букв, алфавит или код языка (смотри VK16K33Display);
+        :param columns: количество знакомест;
+        :param big_byte_order: порядок байт в слове (смотри VK16K33)."""
+        check_value(address, range(0x70, 0x78), f"Адрес 0x{address:x} вне диапазона 0x70..0x77")
+        if address in self.get_addresses():
+            raise ValueError(f"Дисплей с адресом 0x{address:x} уже добавлен!")
+        controller = VK16K33(adapter=self._adapter, address=address, big_byte_order=big_byte_order)
+        controller.init(columns=columns, rows=1)
+        display = VK16K33Display(controller, alpha_letters)
+        display.init()
+        display.set_auto_flush(False)
+        self._displays.append(display)
+        self._controllers.append(controller)
+        return display
+
+    def remove(self, display: VK16K33Display):
+        """Исключает дисплей из обслуживания. Вывод на него снова сразу обращается к шине."""
+        index = self._displays.index(display)
+        del self._displays[index]
+        del self._controllers[index]
+        display.set_auto_flush(True)
+        self._next = 0
+
+    def get_displays(self) -> tuple:
+        """Возвращает зарегистрированные дисплеи в порядке добавления"""
+        return tuple(self._displays)
+
+    def get_controllers(self) -> tuple:
+        """Возвращает контроллеры зарегистрированных дисплеев в порядке добавления"""
+        return tuple(self._controllers)
+
+    def get_addresses(self) -> tuple:
+        """Возвращает адреса на шине зарегистрированных дисплеев в порядке добавления"""
+        return tuple(controller.get_address() for controller in self._controllers)
+
+    def is_dirty(self) -> bool:
+        """Возвращает Истина, если хотя бы один кадр необходимо передать"""
+        for display in self._displays:
+            if display.is_dirty():
+                return True
+        return False
+
+    def estimate_us(self, display: VK16K33Display) -> int:
+        """Возвращает оценку времени передачи изменившихся знакомест дисплея (flush дисплея) по шине в мкс:
+        на каждый участок байт адреса устройства и байт адреса памяти, по два байта на знакоместо, по 9 тактов на байт."""
+        spans, chars = display.get_flush_size()
+        n_bytes = 2 * spans + 2 * chars
+        return (9 * n_bytes * 1_000_000 + self._bus_freq - 1) // self._bus_freq
+
+    def flush(self, budget_us: int = None) -> int:
+        """Передает изменившиеся кадры, по очереди, начиная с дисплея, следующего за последним переданным
+        в предыдущем вызове. Передача прекращается, если следующий кадр не укладывается в бюджет времени
+        (оценка estimate_us плюс затраченное время, но не меньше суммы оценок уже переданных кадров),
+        при этом хотя бы один кадр передается всегда.
+        :param budget_us: бюджет времени в мкс. Если None, то используется значение, заданное в конструкторе.
+        :return: количество переданных кадров."""
+        displays = self._displays
+        cnt = len(displays)
+        if 0 == cnt:
+            return 0
+        if budget_us is None:
+            budget_us = self._budget_us
+        start = time.ticks_us()
+        index = self._next
+        flushed = 0
+        # сумма оценок времени переданных кадров
+        estimated = 0
+        for _ in range(cnt):
+            display = displays[index]
+            if display.is_dirty():
+                cost = self.estimate_us(display)
+                if budget_us is not None and flushed:
+                    spent = max(estimated, time.ticks_diff(time.ticks_us(), start))
+                    if spent + cost > budget_us:
+                        break
+                display.flush()
+                estimated += cost
+                flushed += 1
+            index += 1
+            if index >= cnt:
+                index = 0
+        self._next = index
+        return flushed
+
+    def set_brightness(self, value: int):
+        """Устанавливает яркость всех дисплеев"""
+        for controller in self._controllers:
+            controller.set_brightness(value)
+
+    def set_shutdown(self, value: bool):
+        """Включает/выключает все дисплеи"""
+        for controller in self._controllers:
+            controller.set_shutdown(value)
@@ -1,6 +1,39 @@
 """Модуль для работы с индикаторами, состоящими из сегментов(!). VK16K33, HT1621"""
 from lib_displays.display_controller_mod import ICharDisplayController
 from lib_displays.char_display_mod import CharDisplay
+from lib_displays.alphabet_mod import Alphabet, get_alphabet
+
+
+class _AlphabetGlyphs:
+    """Таблица кодов символов скомпилированных глифов (смотри CharDisplay.compile_glyphs) с поиском букв
+    в таблицах алфавитов (Alphabet) вместо словаря. Поддерживает метод get словаря.
+    Буква ищется в источниках букв (алфавиты и словари) в порядке, заданном при создании дисплея: используется
+    первый источник, который ее отображает. Символы, которых нет ни в одном источнике (цифры, спецсимволы),
+    берутся из glyphs."""
+
+    def __init__(self, glyphs: dict, sources: tuple, dp_code: int, inverse: bool, code_mask: int):
+        """
+        :param glyphs - скомпилированные глифы: цифры, спецсимволы и буквы словарей;
+        :param sources - источники букв по порядку: пары (is_dict, source), где source - Alphabet или
+        dict (символ -> строка имен сегментов). Тип источника определяется один раз, при создании дисплея."""
+        self._glyphs = glyphs
+        self._sources = sources
+        self._dp_code = dp_code
+        self._inverse = inverse
+        self._code_mask = code_mask
+
+    def get(self, char: str, default: int = None) -> int:
+        for is_dict, source in self._sources:
+            if is_dict:
+                if char in source:
+                    # буквы словарей скомпилированы в glyphs
+                    return self._glyphs[char]
+                continue
+            code = source.get_code(char)
+            if code is not None:
+                code |= self._dp_code
+                return self._code_mask & ~code if self._inverse else code
+        return self._glyphs.get(char, default)
 
 
 class VK16K33Display(CharDisplay):
@@ -15,64 +48,121 @@ class VK16K33Display(CharDisplay):
     # p имя сегмента десятичной точки
     _valid_seg_names = "abcdef12hijmlkp"
     _seg_values_map = {c: i for i, c in enumerate(_valid_seg_names)}
+    # разрядность кода символа в битах
+    code_bits = 16
+    # содержит общие символы
+    _seg_map_digits = {
+        # Цифры 0 - 9
+        '0': "abcdefjm",
+        '1': "bcj",
+        '2': "ab2md",
+        '3': "abcd2",
+        '4': "f12bc",
+        '5': "ah2cd",
+        '6': "acdef12",
+        '7': "ajm12",
+        '8': "abcdef12",
+        '9': "abcdf12",
+    }
+    _spec_symbols = {
+        # спецсимволы и знаки препинания!
+        '.': CharDisplay.dp_seg_name,
+        ' ': "",
+        '+': "12il",
+        '-': "12",
+        '_': "d",
+        '=': "12d",
+        '|': "fe",
+        '/': "mj",
+        '\\': "hk",
+        '?': "12abe",
+        '[': "adef",
+        ']': "abcd",
+        '(': "jk",
+        ')': "hm",
+        '$': "af12cdil",
+        '%': "mj1fh2cl",
+        '^': "fh",
+        '°': "ahj"  # попытка отобразись символ градуса
+    }  # _spec_symbols = {
 
-    def __init__(self, controller: ICharDisplayController, alpha_letters: dict):
+    def __init__(self, controller: ICharDisplayController, alpha_letters):
         """
 
         :param controller: ссылка на класс, контроллер дисплея
-        :param alpha_letters: ссылка на словарь соответствия букв алфавита и сегментов, отображающих эту букву
+        :param alpha_letters: ссылка на словарь соответствия букв алфавита и сегментов, отображающих эту букву,
+        алфавит (alphabet_mod.Alphabet), код языка алфавита ('en', 'ru', смотри alphabet_mod.get_alphabet)
+        или последовательность из них (несколько языков одновременно; если буква есть в нескольких алфавитах
+        или словарях, то используется первый из них в порядке последовательности).
         """
-        if not isinstance(alpha_letters, dict):
-            raise ValueError(f"Неверный тип alpha_letters")
+        if isinstance(alpha_letters, (dict, Alphabet, str)):
+            alpha_letters = (alpha_letters,)
+        dicts = []
+        alphabets = []
+        sources = []
+        for item in alpha_letters:
+            if isinstance(item, str):
+                item = get_alphabet(item)
+            if isinstance(item, Alphabet):
+                alphabets.append(item)
+                sources.append((False, item))
+            elif isinstance(item, dict):
+                dicts.append(item)
+                sources.append((True, item))
+            else:
+                raise ValueError(f"Неверный тип alpha_letters")
+        letters = dicts[0] if 1 == len(dicts) else dict()
+        if len(dicts) > 1:
+            for item in dicts:
+                for char, segments in item.items():
+                    letters.setdefault(char, segments)
 
         super().__init__(controller=controller)
         # словарь хранит соответствия буквы алфавита и сегментов, ее отображающих
-        self._alpha_letters = alpha_letters
+        self._alpha_letters = letters
+        # алфавиты в виде таблиц кодов сегментов
+        self._alphabets = tuple(alphabets)
+        # источники букв в порядке alpha_letters: пары (is_dict, source), source - алфавит или словарь
+        self._alpha_sources = tuple(sources)
 
     def get_segment_nbit(self, seg_name: str) -> int:
         """Возвращает номер бита, соответствующий сегменту с именем seg_name. Имя сегмента имеет длину один символ!"""
         return  VK16K33Display._seg_values_map[seg_name]
 
+    def get_symbol_maps(self) -> tuple:
+        """Возвращает кортеж словарей: символ -> строка имен сегментов, которые должны быть включены для его отображения."""
+        return self._seg_map_digits, self._spec_symbols, self._alpha_letters
+
+    def get_alphabets(self) -> tuple:
+        """Возвращает алфавиты в виде таблиц кодов сегментов (alphabet_mod.Alphabet)"""
+        return self._alphabets
+
+    def compile_glyphs(self):
+        """Компилирует таблицу кодов символов (смотри CharDisplay.compile_glyphs).
+        Буквы алфавитов-таблиц не копируются в словарь: коды ASCII букв записываются в плоскую таблицу
+        кодов ASCII символов, остальные буквы ищутся в таблицах алфавитов."""
+        super().compile_glyphs()
+        alphabets = self._alphabets
+        if not alphabets:
+            return
+        inverse, code_mask = self.is_inverse_logic(), self._code_mask
+        dp_code = self._get_segment_value(self.dp_seg_name)
+        sources = self._alpha_sources
+        glyphs = _AlphabetGlyphs(self._glyphs, sources, 0, inverse, code_mask)
+        glyphs_dp = _AlphabetGlyphs(self._glyphs_dp, sources, dp_code, inverse, code_mask)
+        ascii_codes = self._ascii_codes
+        for alphabet in alphabets:
+            for char in alphabet.chars():
+                c = ord(char)
+                if c < 128:
+                    ascii_codes[c] = glyphs.get(char)
+                    ascii_codes[128 + c] = glyphs_dp.get(char)
+        self._glyphs = glyphs
+        self._glyphs_dp = glyphs_dp
+
     def get_segments_of_symbol(self, char_with_dp: str) -> str:
-        # содержит общие символы
-        seg_map_digits = {
-            # Цифры 0 - 9
-            '0': "abcdefjm",
-            '1': "bcj",
-            '2': "ab2md",
-            '3': "abcd2",
-            '4': "f12bc",
-            '5': "ah2cd",
-            '6': "acdef12",
-            '7': "ajm12",
-            '8': "abcdef12",
-            '9': "abcdf12",
-        }
-        dp_seg_name = 'p'
-
-        segment_map_letters =self._alpha_letters
-
-        spec_symbols = {
-            # спецсимволы и знаки препинания!
-            '.': dp_seg_name,
-            ' ': "",
-            '+': "12il",
-            '-': "12",
-            '_': "d",
-            '=': "12d",
-            '|': "fe",
-            '/': "mj",
-            '\\': "hk",
-            '?': "12abe",
-            '[': "adef",
-            ']': "abcd",
-            '(': "jk",
-            ')': "hm",
-            '$': "af12cdil",
-            '%': "mj1fh2cl",
-            '^': "fh",
-            '°': "ahj"  # попытка отобразись символ градуса
-        }  # spec_symbols = {
+        seg_map_digits = self._seg_map_digits
+        spec_symbols = self._spec_symbols
 
         if not isinstance(char_with_dp, str) or 0 == len(char_with_dp) or len(char_with_dp) > 2:
             raise ValueError("Ожидается строка длиной 1 или 2.")
@@ -87,8 +177,17 @@ class VK16K33Display(CharDisplay):
         if char.isdigit():  # цифра 0..9
             return seg_map_digits.get(char, self.get_non_printable())
 
-        if char.isalpha():  # буквы
-            return segment_map_letters.get(char, self.get_non_printable())
+        if char.isalpha():  # буквы, в порядке источников (как в таблице кодов, смотри _AlphabetGlyphs)
+            for is_dict, source in self._alpha_sources:
+                if is_dict:
+                    segments = source.get(char)
+                    if segments is not None:
+                        return segments
+                    continue
+                code = source.get_code(char)
+                if code is not None:
+                    return "".join(name for n, name in enumerate(VK16K33Display._valid_seg_names) if code >> n & 1)
+            return self.get_non_printable()
         # все остальные символы
         return spec_symbols.get(char, self.get_non_printable())
 
@@ -97,4 +196,6 @@ class VK16K33Display(CharDisplay):
         self.set_non_printable('12ad')
         self.set_inverse_logic(False)
         self.set_reverse_index(False)
-        self.set_partial_update(True)
\ No newline at end of file
+        self.set_partial_update(True)
+        self.set_span_update(True)
+        self.compile_glyphs()
\ No newline at end of file
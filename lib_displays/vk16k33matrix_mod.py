@@ -0,0 +1,146 @@
+"""Светодиодная матрица 16x8 или 8x8 на основе VK16K33 (HT16K33)."""
+
+# micropython
+# MIT license
+
+import framebuf
+from sensor_pack_2 import bus_service
+from sensor_pack_2.base_sensor import check_value
+from lib_displays.vk16k33mod import VK16K33
+
+
+class VK16K33Matrix(VK16K33):
+    """Светодиодная матрица на основе VK16K33. Изображение рисуется методами framebuf.FrameBuffer (get_framebuf):
+    точки, линии, прямоугольники, текст, столбцы диаграмм и т. д., а передается в дисплей методом show.
+    Буфер кадра является образом памяти дисплея (ram_size байт): строка y матрицы (выход COM y) занимает байты 2*y
+    и 2*y+1, точка x строки (выход ROW x) - бит x % 8 байта 2*y + x // 8. Это формат MONO_HMSB с шагом строки
+    16 точек, поэтому кадр передается без преобразования.
+    show передает только изменившиеся строки: одной пакетной (burst) записью, от первой до последней изменившейся строки.
+    Методы символьного дисплея (set_char, set_span, set_all, fill) записывают 16-ти битные слова (строки матрицы)
+    в буфер кадра и передают его методом show. Количество знакомест (get_columns) - количество слов памяти дисплея."""
+
+    def __init__(self, adapter: bus_service.I2cAdapter, address: int = 0x70, width: int = 16, height: int = 8):
+        """
+        :param adapter - адаптер шины I2C;
+        :param address - адрес на шине;
+        :param width - количество точек в строке матрицы (выходы ROW), 1..16;
+        :param height - количество строк матрицы (выходы COM), 1..8."""
+        check_value(width, range(1, 17), f"Неверная ширина матрицы: {width}")
+        check_value(height, range(1, 9), f"Неверная высота матрицы: {height}")
+        super().__init__(adapter=adapter, address=address)
+        self._width = width
+        self._height = height
+        # буфер кадра - образ памяти дисплея
+        self._ram = bytearray(VK16K33.ram_size)
+        self._ram_mv = memoryview(self._ram)
+        # теневая копия памяти дисплея: последний переданный кадр
+        self._shadow = bytearray(VK16K33.ram_size)
+        # если Ложь, то содержимое теневой копии не соответствует дисплею и следующий show передаст весь кадр
+        self._shadow_valid = False
+        self._fb = framebuf.FrameBuffer(self._ram, width, height, framebuf.MONO_HMSB, 16)
+
+    def get_framebuf(self) -> framebuf.FrameBuffer:
+        """Возвращает буфер кадра, для рисования методами framebuf.FrameBuffer. Цвет 1 - светодиод включен."""
+        return self._fb
+
+    def get_width(self) -> int:
+        """Возвращает количество точек в строке матрицы"""
+        return self._width
+
+    def get_height(self) -> int:
+        """Возвращает количество строк матрицы"""
+        return self._height
+
+    def get_dirty_rows(self) -> int:
+        """Возвращает битовую маску строк кадра, которые отличаются от переданных в дисплей (бит y - строка y)."""
+        if not self._shadow_valid:
+            return (1 << self._height) - 1
+        ram, shadow = self._ram, self._shadow
+        mask = 0
+        for y in range(self._height):
+            index = 2 * y
+            if ram[index] != shadow[index] or ram[index + 1] != shadow[index + 1]:
+                mask |= 1 << y
+        return mask
+
+    def is_dirty(self) -> bool:
+        """Возвращает Истина, если кадр отличается от переданного в дисплей и его необходимо передать (show)."""
+        return not self._shadow_valid or self._ram != self._shadow
+
+    def invalidate(self):
+        """Объявляет теневую копию недействительной. Следующий вызов show передаст весь кадр."""
+        self._shadow_valid = False
+
+    def show(self) -> bool:
+        """Передает в дисплей изменившиеся строки кадра одной пакетной записью в память дисплея.
+        Если кадр не изменился, то обращения к шине не происходит. Возвращает Истина, если кадр передавался."""
+        ram, shadow = self._ram, self._shadow
+        last = len(ram) - 1
+        first = 0
+        if self._shadow_valid:
+            if ram == shadow:
+                return False
+            while ram[first] == shadow[first]:
+                first += 1
+            while ram[last] == shadow[last]:
+                last -= 1
+            # строка передается целиком
+            first &= ~1
+            last |= 1
+        self._connector.write_buf_to_mem(first, self._ram_mv[first:last + 1])
+        shadow[:] = ram
+        self._shadow_valid = True
+        return True
+
+    def _put_codes(self, char_codes, x: int):
+        """Записывает 16-ти битные коды char_codes в буфер кадра, начиная со слова x."""
+        ram = self._ram
+        big = self._connector.is_big_byteorder()
+        put_code = VK16K33._put_code
+        index = 2 * x
+        for code in char_codes:
+            put_code(ram, index, code, big)
+            index += 2
+
+    def set_char(self, char_code: int, x: int, y: int = 0):
+        """Записывает 16-ти битный код char_code в слово x (строку x матрицы) буфера кадра и передает кадр (show).
+        :param y - не используется."""
+        valid_rng = range(self._columns)
+        check_value(x, valid_rng, f"Значение {x} должно быть в диапазоне: {valid_rng}")
+        self._put_codes((char_code,), x)
+        self.show()
+
+    def set_span(self, char_codes, x: int, y: int = 0):
+        """Записывает последовательность 16-ти битных кодов в соседние слова буфера кадра, начиная со слова x,
+        и передает кадр (show).
+        :param y - не используется."""
+        cnt = len(char_codes)
+        if 0 == cnt:
+            return
+        if x < 0 or x + cnt > self._columns:
+            raise ValueError(f"Знакоместа {x}..{x + cnt - 1} вне диапазона: {range(self._columns)}")
+        self._put_codes(char_codes, x)
+        self.show()
+
+    def fill(self, char_code: int):
+        """Заполняет весь буфер кадра кодом char_code и передает кадр (show)."""
+        self._put_codes((char_code,) * self._columns, 0)
+        self.show()
+
+    # IDisplayController
+    def resync(self):
+        """Повторно передает значения управляющих регистров и весь кадр."""
+        super().resync()
+        self.invalidate()
+        self.show()
+
+    # IDisplayController
+    def init(self, columns: int = None, rows: int = None, value: int = 0):
+        """Производит аппаратную инициализацию и передает в дисплей весь кадр.
+        :param columns - не используется, ширина матрицы задается в конструкторе;
+        :param rows - не используется, высота матрицы задается в конструкторе;
+        :param value - определяет тип инициализации."""
+        # память дисплея - восемь 16-ти битных слов (знакомест)
+        super().init(columns=VK16K33.ram_size // 2, rows=1, value=value)
+        self.invalidate()
+        self.show()
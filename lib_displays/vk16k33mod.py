@@ -20,8 +20,8 @@ class VK16K33(ICharDisplayController):
     # биты 1 и 2 управляют частотой мигания дисплея: 0 - мигание выключено,
     # 1 - мигание со скоростью 2 Гц; 2 - мигание со скоростью 1 Гц, 3 - мигание со скоростью 1/2 Гц
     cmd_display_setup = const(0x80)
-
-
+    # размер памяти дисплея в байтах
+    ram_size = const(16)
 
     def __init__(self, adapter: bus_service.I2cAdapter, address: int = 0x70, big_byte_order: bool = False):
         """
@@ -33,6 +33,12 @@ class VK16K33(ICharDisplayController):
         self._connector = DeviceEx(adapter=adapter, address=address, big_byte_order=big_byte_order)
         # для передачи позиции и кода символа в дисплей
         self._packet = bytearray(3)
+        # для пакетной (burst) записи в память дисплея: адрес первого байта и 16 байт памяти дисплея.
+        # VK16K33 автоматически увеличивает адрес памяти после записи каждого байта.
+        self._ram_packet = bytearray(1 + VK16K33.ram_size)
+        # посылки для вывода 0..8 знакомест: срезы пакета, создаются один раз, чтобы не выделять память при выводе
+        _mv = memoryview(self._ram_packet)
+        self._ram_views = tuple(_mv[:1 + 2 * cnt] for cnt in range(1 + VK16K33.ram_size // 2))
         # количество знакомест дисплея в ширину
         self._columns = None
         # количество знакомест дисплея в высоту
@@ -43,18 +49,38 @@ class VK16K33(ICharDisplayController):
         self._display_on = None
         # Если Истина, то осциллятор ВЫключен и дисплей НЕ работает (режим сна)!
         self._standby = None
+        # текущая яркость
+        self._brightness = None
+        # Значения полей _blink_freq, _display_on, _standby, _brightness - теневая копия управляющих регистров.
+        # None - значение неизвестно. Команда, не изменяющая значение регистра, не передается.
+
+    def get_address(self) -> int:
+        """Возвращает адрес на шине"""
+        return self._connector.address
 
     def _write(self, buf: bytes):
         """Запись в регистр VK16K33 с адресом addr значения value."""
-        if isinstance(buf, (bytes, bytearray)):
+        if isinstance(buf, (bytes, bytearray, memoryview)):
             self._connector.write(buf)
 
+    @staticmethod
+    def _put_code(buf, index: int, code: int, big: bool):
+        """Записывает 16-битный код символа code в buf, начиная с индекса index, в порядке байт big/little."""
+        if big:
+            buf[index] = (code >> 8) & 0xFF
+            buf[index + 1] = code & 0xFF
+        else:
+            buf[index] = code & 0xFF
+            buf[index + 1] = (code >> 8) & 0xFF
+
     def _set_standby(self, value: bool):
         """
         Включает или выключает режим standby.
         value в True - включить standby (бит S=0, осциллятор выключен)
         enable = False - выйти из standby (бит S=1, осциллятор включен)
         """
+        if value == self._standby:
+            return
         # бит 0x01 - бит S (0 - standby, 1 - normal)
         cmd = VK16K33.cmd_system_setup | (0x00 if value else 0x01)
         # Передача команды
@@ -72,27 +98,63 @@ class VK16K33(ICharDisplayController):
         check_value(x, valid_rng, f"Значение {y} должно быть в диапазоне: {valid_rng}")
 
         # Адрес памяти для символа: position * 2
-        # надо послать команду записи начинающуюся с адреса в памяти дисплея
-        # Разбиваем 16-битное значение на два байта (младший и старший)
-        # data = (char_code & 0xFF, (char_code >> 8) & 0xFF)
-
         # Запись команды - сначала указывается адрес памяти, затем данные
         # VK16K33 требует сначала написать адрес, затем данные (2 байта)
         buf = self._packet
         buf[0] = 2 * x # адрес первого байта знакоместа в памяти дисплея
-        bo = 'big' if self._connector.is_big_byteorder() else 'little'
-        #print(f"DBF:char_code: 0x{char_code:x}")
-        _loc_buf = char_code.to_bytes(2, bo)
-        buf[1] = _loc_buf[0]
-        buf[2] = _loc_buf[1]
+        VK16K33._put_code(buf, 1, char_code, self._connector.is_big_byteorder())
+        self._write(buf)
+
+    def set_span(self, char_codes, x: int, y: int = 0):
+        """
+        Выводит последовательность символов в соседние знакоместа, начиная с позиции x, одной транзакцией на шине.
+        VK16K33 автоматически увеличивает адрес памяти дисплея, поэтому все коды передаются одной посылкой.
+        :param char_codes: последовательность (array('H'), memoryview, list) 16-битных кодов сегментов символов
+        :param x: позиция первого символа
+        :param y: позиция символа по вертикали. Не используется!
+        """
+        cnt = len(char_codes)
+        if 0 == cnt:
+            return
+        if x < 0 or x + cnt > self._columns:
+            raise ValueError(f"Знакоместа {x}..{x + cnt - 1} вне диапазона: {range(self._columns)}")
+        buf = self._ram_packet
+        buf[0] = 2 * x  # адрес первого байта знакоместа в памяти дисплея
+        big = self._connector.is_big_byteorder()
+        put_code = VK16K33._put_code
+        index = 1
+        for code in char_codes:
+            put_code(buf, index, code, big)
+            index += 2
+        self._write(self._ram_views[cnt])
+
+    def set_all(self, char_codes):
+        """Выводит все символы дисплея одной транзакцией на шине, начиная с нулевого знакоместа."""
+        self.set_span(char_codes, 0)
+
+    def fill(self, char_code: int):
+        """Заполняет всю память дисплея (ram_size байт) кодом символа char_code одной транзакцией на шине."""
+        buf = self._ram_packet
+        buf[0] = 0  # адрес первого байта памяти дисплея
+        big = self._connector.is_big_byteorder()
+        put_code = VK16K33._put_code
+        for index in range(1, len(buf), 2):
+            put_code(buf, index, char_code, big)
         self._write(buf)
 
     def set_brightness(self, value: int):
         """Устанавливает яркость всех элементов одновременно."""
         valid_rng = range(0x10)
         check_value(value, valid_rng, f"Значение яркости: {value}, вне диапазона: {valid_rng}!")
+        if value == self._brightness:
+            return
         val = VK16K33.cmd_set_brightness | value
         self._write(bytes((val,)))
+        self._brightness = value
+
+    def get_brightness(self) -> int:
+        """Возвращает значение установленной ранее яркости или None"""
+        return self._brightness
 
     def _set_display_setup(self, display_on: bool=True, blink_freq: int=0):
         """Управляет режимом дисплея и морганием VK16K33.
@@ -104,6 +166,8 @@ class VK16K33(ICharDisplayController):
                 3 - моргание 0.5 Гц"""
         valid_rng_blink = range(4)
         check_value(blink_freq, valid_rng_blink, f"Значение blink_freq: {blink_freq} должно быть в диапазоне: {valid_rng_blink}!")
+        if display_on == self._display_on and blink_freq == self._blink_freq:
+            return
         # Бит включения дисплея D (0x04)
         on_bit = 0x01 if display_on else 0x00
         cmd = VK16K33.cmd_display_setup | blink_freq << 1 | on_bit
@@ -117,16 +181,31 @@ class VK16K33(ICharDisplayController):
         """Если value Истина, то дисплей переводится в режим shutdown/выключено"""
         self._set_standby(value=value)
 
+    # IDisplayController
+    def resync(self):
+        """Повторно передает значения всех установленных ранее управляющих регистров."""
+        standby, brightness = self._standby, self._brightness
+        display_on, blink_freq = self._display_on, self._blink_freq
+        self._standby = self._brightness = self._display_on = self._blink_freq = None
+        if standby is not None:
+            self._set_standby(standby)
+        if brightness is not None:
+            self.set_brightness(brightness)
+        if display_on is not None:
+            self._set_display_setup(display_on, blink_freq)
+
     def init(self, columns: int = 4, rows: int = 1, value: int = 0):
         """Производит аппаратную инициализацию.
         :param value - Определяет тип инициализации.
         :param columns - Количество столбцов, элементов дисплея;
         :param rows - количество строк, элементов дисплея;"""
-        if columns <= 0 or rows <= 0:
+        if columns <= 0 or rows <= 0 or columns > VK16K33.ram_size // 2:
             raise ValueError(f"Неверное значение строк: {rows} или столбцов: {columns}!")
         self._columns = columns
         # количество знакомест дисплея в высоту
         self._rows = rows
+        # состояние регистров после включения питания неизвестно
+        self._standby = self._brightness = self._display_on = self._blink_freq = None
         #
         self._set_standby(value=False)
         self._set_display_setup(display_on=True, blink_freq=0)
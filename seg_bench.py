@@ -0,0 +1,213 @@
+"""Измерение производительности символьных дисплеев без оборудования.
+Каждая пара дисплей/контроллер (MAX7219Display, VK16K33Display, WADigitalTube, ShiftReg8Display) работает с шиной,
+которая не передает данные, а только считает их (SPI, I2C, UART, Pin из host_compat.machine, без журнала).
+Для каждой пары выводятся: кадры в секунду, мкс на один вызов show_by_pos, байты и транзакции шины на кадр,
+выделение памяти в куче на кадр (байт, только в MicroPython с gc.mem_alloc).
+Результаты можно сохранить как базовые (файл seg_bench.json) и сравнивать с ними последующие запуски.
+
+Запуск на плате (пакет host_compat скопировать на плату): import seg_bench; seg_bench.run(save=False)
+Запуск с параметрами (unix порт MicroPython или CPython): micropython seg_bench.py [--save] [--frames N] [--baseline имя_файла]"""
+
+# micropython
+# MIT license
+
+import sys
+import gc
+import time
+import json
+
+if "micropython" != sys.implementation.name:
+    # CPython: модули machine, micropython и функции time.ticks_* и т. д.
+    import host_compat
+    host_compat.install(real_sleep=False)
+
+# счетные шины: не передают данные, а считают транзакции и байты (record=False - без журнала и выделения памяти)
+from host_compat.machine import SPI, I2C, UART, Pin
+from sensor_pack_2.bus_service import SpiAdapter, I2cAdapter
+from lib_displays.max7219mod import MAX7219
+from lib_displays.max7219display import MAX7219Display
+from lib_displays.vk16k33mod import VK16K33
+from lib_displays.vk16k33display import VK16K33Display
+from lib_displays.TM1652mod import TM1652
+from lib_displays.tm1652display import WADigitalTube
+from lib_displays.shift_reg_mod import SPLReg8
+from lib_displays.shift_reg_display import ShiftReg8Display
+from lib_displays.en_lang_14_seg import eng_to_14segments
+
+# файл базовых результатов
+baseline_file = "seg_bench.json"
+# допустимое ухудшение времени выполнения относительно базового значения, в процентах
+time_tolerance = 10
+# допустимое отличие остальных значений (на кадр) от базовых: половина шага округления результатов
+value_tolerance = 0.005
+# текст кадров. Кадры выводятся по кругу
+bench_texts = ("3.1415926", "HELP", "Err.o", "12-34-56", "AbCd", "0123", "1.2.3.4.", "    ", "-9.87", "dEAd")
+
+
+def make_benches() -> tuple:
+    """Создает пары дисплей/контроллер на счетных шинах. Возвращает кортеж (имя, дисплей, шина, контроллер)."""
+    spi = SPI(1, record=False)
+    controller = MAX7219(adapter=SpiAdapter(bus=spi), chip_select=Pin(5, value=1, record=False))
+    controller.init(columns=8, rows=1)
+    max_display = MAX7219Display(controller)
+    max_display.init()
+    max_bench = ("MAX7219Display", max_display, spi, controller)
+
+    i2c = I2C(0, record=False)
+    controller = VK16K33(adapter=I2cAdapter(bus=i2c), address=0x70)
+    controller.init(columns=4, rows=1)
+    vk_display = VK16K33Display(controller, eng_to_14segments)
+    vk_display.init()
+    vk_bench = ("VK16K33Display", vk_display, i2c, controller)
+
+    uart = UART(1, record=False)
+    # самая высокая скорость и отсутствие паузы: время ожидания готовности TM1652 минимально
+    controller = TM1652(uart, delay_ms=0, baudrate=1_000_000)
+    controller.init(columns=4, rows=1)
+    tm_display = WADigitalTube(controller)
+    tm_display.init()
+    tm_bench = ("WADigitalTube", tm_display, uart, controller)
+
+    spi = SPI(1, record=False)
+    controller = SPLReg8(adapter=SpiAdapter(bus=spi), load_out=Pin(5, value=1, record=False))
+    controller.init(columns=4, rows=1)
+    sr_display = ShiftReg8Display(controller)
+    sr_display.init()
+    sr_bench = ("ShiftReg8Display", sr_display, spi, controller)
+
+    return max_bench, vk_bench, tm_bench, sr_bench
+
+
+def _show_frames(display, controller, frames: int):
+    texts = bench_texts
+    cnt = len(texts)
+    for i in range(frames):
+        display.show_by_pos(texts[i % cnt])
+        # отложенные команды (TM1652) передаются в каждом кадре
+        controller.flush_pending()
+
+
+def bench_one(display, bus, controller, frames: int) -> dict:
+    """Выводит frames кадров на дисплей и возвращает результаты измерения времени и обмена по шине."""
+    # прогрев: первый вывод всех кадров (заполнение теневого буфера и т. д.)
+    _show_frames(display, controller, len(bench_texts))
+    bus.reset()
+    gc.collect()
+    start = time.ticks_us()
+    _show_frames(display, controller, frames)
+    elapsed = time.ticks_diff(time.ticks_us(), start)
+    if elapsed <= 0:
+        elapsed = 1
+    return {
+        "fps": round(1_000_000 * frames / elapsed, 1),
+        "us_per_frame": round(elapsed / frames, 2),
+        "bytes_per_frame": round(bus.bytes / frames, 2),
+        "transactions_per_frame": round(bus.transactions / frames, 2),
+    }
+
+
+def bench_alloc(display, controller, frames: int):
+    """Выводит frames кадров на дисплей и возвращает объем выделенной в куче памяти на кадр или None.
+    Измеряется только в MicroPython: gc.mem_alloc, добавляемая host_compat под CPython (tracemalloc), учитывает
+    выделения интерпретатора CPython и с кучей MicroPython не сопоставима."""
+    if "micropython" != sys.implementation.name:
+        return None
+    mem_alloc = getattr(gc, "mem_alloc", None)
+    if mem_alloc is None:
+        return None
+    _show_frames(display, controller, len(bench_texts))
+    gc.collect()
+    # сборщик мусора отключен, поэтому разность mem_alloc равна объему выделенной памяти
+    gc.disable()
+    try:
+        alloc_start = mem_alloc()
+        _show_frames(display, controller, frames)
+        alloc = mem_alloc() - alloc_start
+    finally:
+        gc.enable()
+    return round(alloc / frames, 1)
+
+
+def load_baseline(file_name: str) -> dict:
+    """Загружает базовые результаты. Если файла нет, то возвращает пустой словарь."""
+    try:
+        with open(file_name) as f:
+            return json.load(f)
+    except OSError:
+        return {}
+
+
+def save_baseline(file_name: str, results: dict):
+    """Сохраняет результаты как базовые."""
+    with open(file_name, "w") as f:
+        json.dump(results, f)
+
+
+def find_regressions(name: str, current: dict, baseline: dict) -> list:
+    """Сравнивает результаты одной пары с базовыми. Возвращает список строк с описанием ухудшений.
+    Время сравнивается с допуском time_tolerance процентов, обмен по шине и выделение памяти - с допуском
+    value_tolerance (значения округлены)."""
+    base = baseline.get(name)
+    if not base:
+        return []
+    out = []
+    old, new = base.get("us_per_frame"), current["us_per_frame"]
+    if old and new > old * (100 + time_tolerance) / 100:
+        out.append(f"{name}: us_per_frame {old} -> {new}")
+    for key in ("bytes_per_frame", "transactions_per_frame", "alloc_per_frame"):
+        old, new = base.get(key), current[key]
+        if old is not None and new is not None and new - old > value_tolerance:
+            out.append(f"{name}: {key} {old} -> {new}")
+    return out
+
+
+def run(frames: int = 1000, save: bool = False, file_name: str = baseline_file) -> list:
+    """Выполняет измерения, выводит результаты и сравнивает их с базовыми.
+    Если save Истина, то результаты сохраняются как базовые. Возвращает список ухудшений."""
+    results = {}
+    benches = make_benches()
+    for name, display, bus, controller in benches:
+        results[name] = bench_one(display, bus, controller, frames)
+    for name, display, bus, controller in benches:
+        results[name]["alloc_per_frame"] = bench_alloc(display, controller, frames)
+    print(f"{'display':<18}{'fps':>10}{'us/frame':>10}{'bytes':>8}{'trans':>8}{'alloc':>8}")
+    for name, res in results.items():
+        alloc = res["alloc_per_frame"]
+        print(f"{name:<18}{res['fps']:>10}{res['us_per_frame']:>10}{res['bytes_per_frame']:>8}"
+              f"{res['transactions_per_frame']:>8}{'n/a' if alloc is None else alloc:>8}")
+    regressions = []
+    baseline = load_baseline(file_name)
+    for name, res in results.items():
+        regressions.extend(find_regressions(name, res, baseline))
+    for line in regressions:
+        print(f"REGRESSION {line}")
+    if not baseline:
+        print(f"Базовых результатов нет ({file_name})")
+    elif not regressions:
+        print("Ухудшений нет")
+    if save:
+        save_baseline(file_name, results)
+        print(f"Результаты сохранены как базовые: {file_name}")
+    return regressions
+
+
+def _parse_args(argv: list) -> dict:
+    kwargs = {}
+    i = 0
+    while i < len(argv):
+        arg = argv[i]
+        if "--save" == arg:
+            kwargs["save"] = True
+        elif "--frames" == arg:
+            i += 1
+            kwargs["frames"] = int(argv[i])
+        elif "--baseline" == arg:
+            i += 1
+            kwargs["file_name"] = argv[i]
+        i += 1
+    return kwargs
+
+
+if __name__ == "__main__":
+    if run(**_parse_args(sys.argv[1:])):
+        sys.exit(1)
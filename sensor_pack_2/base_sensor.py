@@ -6,6 +6,27 @@ import micropython
 from sensor_pack_2 import bus_service
 from machine import Pin
 
+# struct.Struct (CPython) или None (в MicroPython его нет)
+_struct_cls = getattr(struct, "Struct", None)
+# Кэш форматов struct: символ порядка байт ('<', '>') -> {строка формата без порядка байт -> формат}.
+# Формат - экземпляр struct.Struct, если он есть (CPython). В MicroPython struct.Struct нет, поэтому кэш хранит только
+# полную строку формата: экономится лишь сборка строки, разбор формата выполняется при каждом вызове.
+_formats = {}
+
+
+def _get_format(bo: str, fmt_char: str):
+    """Возвращает формат из кэша _formats (создает его при первом обращении)."""
+    cache = _formats.get(bo)
+    if cache is None:
+        cache = _formats[bo] = {}
+    fmt = cache.get(fmt_char)
+    if fmt is None:
+        fmt = bo + fmt_char
+        if _struct_cls is not None:
+            fmt = _struct_cls(fmt)
+        cache[fmt_char] = fmt
+    return fmt
+
 
 @micropython.native
 def check_value(value: [int, None], valid_range: [range, tuple], error_msg: str) -> [int, None]:
@@ -64,22 +85,51 @@ class Device:
             return 'big', '>'
         return 'little', '<'
 
-    def pack(self, fmt_char: str, *values) -> bytes:
+    def _get_format(self, fmt_char: str, redefine_byte_order: str = None):
+        """Возвращает формат из кэша для порядка байт устройства или redefine_byte_order
+        ('big', 'little', '>', '<')."""
         if not fmt_char:
             raise ValueError("Invalid fmt_char parameter!")
-        bo = self._get_byteorder_as_str()[1]
-        return struct.pack(bo + fmt_char, values)
+        if redefine_byte_order is None:
+            bo = '>' if self.is_big_byteorder() else '<'
+        else:
+            bo = redefine_byte_order[0]
+            if 'b' == bo:
+                bo = '>'
+            elif 'l' == bo:
+                bo = '<'
+        return _get_format(bo, fmt_char)
+
+    def pack(self, fmt_char: str, *values) -> bytes:
+        fmt = self._get_format(fmt_char)
+        if _struct_cls is None:
+            return struct.pack(fmt, *values)
+        return fmt.pack(*values)
+
+    def pack_into(self, fmt_char: str, buffer, offset: int, *values):
+        """упаковка значений values в буфер buffer, начиная с индекса offset, без выделения памяти под результат."""
+        fmt = self._get_format(fmt_char)
+        if _struct_cls is None:
+            struct.pack_into(fmt, buffer, offset, *values)
+        else:
+            fmt.pack_into(buffer, offset, *values)
 
     def unpack(self, fmt_char: str, source: bytes, redefine_byte_order: str = None) -> tuple:
         """распаковка массива, считанного из датчика.
         Если redefine_byte_order != None, то bo (смотри ниже) = redefine_byte_order
         fmt_char: c, b, B, h, H, i, I, l, L, q, Q. pls see: https://docs.python.org/3/library/struct.html"""
-        if not fmt_char:
-            raise ValueError("Invalid fmt_char parameter!")
-        bo = self._get_byteorder_as_str()[1]
-        if redefine_byte_order is not None:
-            bo = redefine_byte_order[0]
-        return struct.unpack(bo + fmt_char, source)
+        fmt = self._get_format(fmt_char, redefine_byte_order)
+        if _struct_cls is None:
+            return struct.unpack(fmt, source)
+        return fmt.unpack(source)
+
+    def unpack_from(self, fmt_char: str, buffer, offset: int = 0, redefine_byte_order: str = None) -> tuple:
+        """распаковка из буфера buffer, начиная с индекса offset (без копирования среза буфера).
+        Позволяет разобрать пакет из нескольких полей, считанный из датчика одним чтением в заранее созданный буфер."""
+        fmt = self._get_format(fmt_char, redefine_byte_order)
+        if _struct_cls is None:
+            return struct.unpack_from(fmt, buffer, offset)
+        return fmt.unpack_from(buffer, offset)
 
     @micropython.native
     def is_big_byteorder(self) -> bool:
@@ -89,6 +139,11 @@ class Device:
 class DeviceEx(Device):
     """Класс - основа датчика. Добавил общие методы доступа к шине. 30.01.2024"""
 
+    def __init__(self, adapter: bus_service.BusAdapter, address: [int, Pin], big_byte_order: bool):
+        super().__init__(adapter=adapter, address=address, big_byte_order=big_byte_order)
+        # буфер для чтения 16-ти битных регистров (read_reg_16)
+        self._reg_16_buf = bytearray(2)
+
     def read_reg(self, reg_addr: int, bytes_count=2) -> bytes:
         """считывает из регистра датчика значение.
         bytes_count - размер значения в байтах.
@@ -104,10 +159,28 @@ class DeviceEx(Device):
         byte_order = self._get_byteorder_as_str()[0]
         return self.adapter.write_register(self.address, reg_addr, value, bytes_count, byte_order)
 
+    def read_reg_into(self, reg_addr: int, buf):
+        """Считывает из регистра датчика len(buf) байт в заранее созданный буфер buf. Возвращает buf.
+        Если наследник переопределил read_reg, то чтение выполняется им (с копированием в buf),
+        иначе - адаптером шины прямо в buf, без выделения памяти."""
+        if type(self).read_reg is DeviceEx.read_reg:
+            return self.adapter.read_buf_from_memory(self.address, reg_addr, buf, 1)
+        raw = self.read_reg(reg_addr, len(buf))
+        for i in range(len(buf)):
+            buf[i] = raw[i]
+        return buf
+
     def read_reg_16(self, address: int, signed: bool = False) -> int:
-        """Чтение регистра разрядностью 16 бит"""
-        _raw = self.read_reg(address, 2)
-        return self.unpack("h" if signed else "H", _raw)[0]
+        """Чтение регистра разрядностью 16 бит (смотри read_reg_into) в заранее созданный буфер.
+        Значение собирается из байтов буфера, без выделения памяти."""
+        buf = self.read_reg_into(address, self._reg_16_buf)
+        if self.is_big_byteorder():
+            val = buf[0] << 8 | buf[1]
+        else:
+            val = buf[1] << 8 | buf[0]
+        if signed and val & 0x8000:
+            val -= 0x10000
+        return val
 
     def write_reg_16(self, address: int, value: int):
         """Запись регистра разрядностью 16 бит"""
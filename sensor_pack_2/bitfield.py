@@ -17,12 +17,18 @@ def _bitmask(bit_rng: range) -> int:
     """возвращает битовую маску по занимаемым битам"""
     # if bit_rng.step < 0 or bit_rng.start <= bit_rng.stop:
     #    raise ValueError(f"_bitmask: {bit_rng.start}; {bit_rng.stop}; {bit_rng.step}")
-    return sum(map(lambda x: 2 ** x, bit_rng))
+    if 1 == bit_rng.step:
+        return ((1 << len(bit_rng)) - 1) << bit_rng.start
+    mask = 0
+    for bit in bit_rng:
+        mask |= 1 << bit
+    return mask
 
 
 class BitFields:
     """Хранилище информации о битовых полях с доступом по индексу.
-    _source - кортеж именованных кортежей, описывающих битовые поля;"""
+    _source - кортеж именованных кортежей, описывающих битовые поля;
+    Маски, сдвиги и индексы полей по именам вычисляются один раз, в конструкторе."""
     @staticmethod
     def _check(fields_info: tuple[bit_field_info, ...]):
         """Проверки на правильность информации!"""
@@ -35,6 +41,13 @@ class BitFields:
     def __init__(self, fields_info: tuple[bit_field_info, ...]):
         BitFields._check(fields_info)
         self._fields_info = fields_info
+        # маски и сдвиги (номер младшего бита) полей, в порядке полей
+        self._masks = tuple(_bitmask(fi.position) for fi in fields_info)
+        self._shifts = tuple(min(fi.position) for fi in fields_info)
+        # Истина для однобитовых полей, их значение возвращается как bool
+        self._flags = tuple(1 == len(fi.position) for fi in fields_info)
+        # имя поля -> индекс поля
+        self._indexes = {fi.name: index for index, fi in enumerate(fields_info)}
         self._idx = 0
         # имя битового поля, которое будет параметром у методов get_value/set_value
         self._active_field_name = fields_info[0].name
@@ -43,59 +56,81 @@ class BitFields:
 
     def _by_name(self, name: str) -> [bit_field_info, None]:
         """возвращает информацию о битовом поле по его имени (поле name именованного кортежа) или None"""
-        items = self._fields_info
-        for item in items:
-            if name == item.name:
-                return item
+        index = self._indexes.get(name)
+        if index is not None:
+            return self._fields_info[index]
 
-    def _get_field(self, key: [str, int, None]) -> [bit_field_info, None]:
-        """для внутреннего использования"""
-        fi = self._fields_info
-        _itm = None
+    def field_index(self, name: str) -> [int, None]:
+        """возвращает индекс битового поля по его имени или None. Индекс поля - индекс его значения в списке decode"""
+        return self._indexes.get(name)
+
+    def _index_of(self, key: [str, int, None]) -> [int, None]:
+        """для внутреннего использования. Возвращает индекс поля по имени, индексу или None (активное поле)"""
         if key is None:
-            _itm = self._by_name(self.field_name)
+            key = self.field_name
         if isinstance(key, int):
-            _itm = fi[key]
-        if isinstance(key, str):
-            _itm = self._by_name(key)
-        return _itm
+            return key
+        return self._indexes.get(key)
+
+    def _get_field(self, key: [str, int, None]) -> [bit_field_info, None]:
+        """для внутреннего использования"""
+        index = self._index_of(key)
+        if index is not None:
+            return self._fields_info[index]
 
     def get_field_value(self, field_name: str = None, validate: bool = False) -> [int, bool]:
         """возвращает значение битового поля, по его имени(self.field_name), из self.source."""
-        item = self._get_field(field_name)
-        if item is None:
+        index = self._index_of(field_name)
+        if index is None:
             raise ValueError(f"get_field_value. Поле с именем {field_name} не существует!")
-        pos = item.position
-        bitmask = _bitmask(pos)
-        val = (self.source & bitmask) >> pos.start  # выделение маской битового диапазона и его сдвиг вправо
-        if item.valid_values and validate:
+        # выделение маской битового диапазона и его сдвиг вправо
+        val = (self._source_val & self._masks[index]) >> self._shifts[index]
+        if validate and self._fields_info[index].valid_values:
             raise NotImplemented("Если вы решили проверить значение поля при его возвращении, то делайте это самостоятельно!!!")
-        if 1 == len(pos):
+        if self._flags[index]:
             return 0 != val     # bool
         return val              # int
 
+    def make_values(self) -> list:
+        """возвращает список для значений всех полей, для передачи в decode"""
+        return [0] * len(self._fields_info)
+
+    def decode(self, source: [int, None] = None, values: list = None) -> list:
+        """Извлекает значения всех битовых полей из source за один проход и записывает их в values (смотри make_values),
+        в порядке полей (индекс значения поля можно узнать методом field_index). Однобитовые поля имеют тип bool.
+        Если source is None, то значения извлекаются из self.source. Если values is None, то создается новый список.
+        Возвращает values."""
+        src = self._get_source(source)
+        if values is None:
+            values = self.make_values()
+        masks, shifts, flags = self._masks, self._shifts, self._flags
+        for index in range(len(masks)):
+            val = (src & masks[index]) >> shifts[index]
+            values[index] = 0 != val if flags[index] else val
+        return values
+
     def set_field_value(self, value: int, source: [int, None] = None, field: [str, int, None] = None,
                         validate: bool = True) -> int:
         """Записывает value в битовый диапазон, определяемый параметром field, в source.
         Возвращает значение с измененным битовым полем.
         Если field is None, то имя поля берется из свойства self._active_field_name.
         Если source is None, то значение поля, подлежащее изменению, изменяется в свойстве self._source_val"""
-        item = self._get_field(key=field)     #   *
-        rng = item.valid_values
+        index = self._index_of(field)     #   *
+        if index is None:
+            raise ValueError(f"set_field_value. Поле с именем {field} не существует!")
+        rng = self._fields_info[index].valid_values
         if rng and validate:
             check_value(value, rng, get_error_str(self.field_name, value, rng))
-        pos = item.position
-        bitmask = _bitmask(pos)
+        bitmask = self._masks[index]
         src = self._get_source(source) & ~bitmask  # чистка битового диапазона
-        src |= (value << pos.start) & bitmask  # установка битов в заданном диапазоне
+        src |= (value << self._shifts[index]) & bitmask  # установка битов в заданном диапазоне
         if source is None:
             self._source_val = src
         return src
 
     def __getitem__(self, key: [int, str]) -> [int, bool]:
         """возвращает значение битового поля из значения в self.source по его имени/индексу"""
-        _bfi = self._get_field(key)
-        return self.get_field_value(_bfi.name)
+        return self.get_field_value(key)
 
     def __setitem__(self, field_name: str, value: [int, bool]):
         """Волшебный метод, вызывает set_field_value.
@@ -103,7 +138,7 @@ class BitFields:
         self.set_field_value(value=value, source=None, field=field_name, validate=True)     #   *
 
     def _get_source(self, source: [int, None]) -> int:
-        return source if source else self._source_val
+        return self._source_val if source is None else source
 
     @property
     def source(self) -> int:
@@ -3,22 +3,171 @@
 # Copyright (c) 2022 Roman Shevchik   goctaprog@gmail.com
 """MicroPython модуль для работы с шинами ввода/вывода"""
 
-import math
+import time
 from machine import I2C, SPI, Pin
 
 
 def mpy_bl(value: int) -> int:
     """Возвращает место, занимаемое значением value в битах.
     Аналог int.bit_length(), которая есть в Python, но отсутствует в MicroPython!"""
-    if 0 == value:
-        return 0
-    return 1 + int(math.log2(abs(value)))
+    value = abs(value)
+    ret = 0
+    while value:
+        value >>= 1
+        ret += 1
+    return ret
+
+
+def _total_len(buffers) -> int:
+    """Возвращает суммарную длину буферов последовательности buffers"""
+    n_bytes = 0
+    for buf in buffers:
+        n_bytes += len(buf)
+    return n_bytes
+
+
+class BusStats:
+    """Статистика обмена по шине. Для каждого устройства (адрес на шине I2C или вывод выбора чипа SPI) считает
+    транзакции, байты данных (без адреса устройства и адреса регистра) и суммарное время транзакций,
+    а также распределение времени транзакций (гистограмма с фиксированным количеством интервалов).
+    Границы интервалов гистограммы: bin0_us, 2 * bin0_us, 4 * bin0_us, ... мкс. Последний интервал не ограничен сверху.
+    Все записи одной транзакции BusTransaction (BusAdapter.transaction) учитываются как одна транзакция."""
+
+    def __init__(self, bins: int = 8, bin0_us: int = 16):
+        if bins < 2 or bin0_us <= 0:
+            raise ValueError(f"Неверное значение bins: {bins} или bin0_us: {bin0_us}")
+        self._bins = bins
+        self._bin0_us = bin0_us
+        # устройство -> [транзакции, байты, суммарное время в мкс, гистограмма]
+        self._devices = {}
+
+    def add(self, device_addr: [int, Pin], n_bytes: int, start_us: int):
+        """Учитывает транзакцию с устройством device_addr длиной n_bytes байт, начавшуюся в момент start_us (time.ticks_us)."""
+        elapsed = time.ticks_diff(time.ticks_us(), start_us)
+        rec = self._devices.get(device_addr)
+        if rec is None:
+            rec = [0, 0, 0, [0] * self._bins]
+            self._devices[device_addr] = rec
+        rec[0] += 1
+        rec[1] += n_bytes
+        rec[2] += elapsed
+        # поиск интервала гистограммы
+        index, limit, last = 0, self._bin0_us, self._bins - 1
+        while index < last and elapsed >= limit:
+            limit <<= 1
+            index += 1
+        rec[3][index] += 1
+
+    def get_bin_limits(self) -> tuple:
+        """Возвращает верхние границы интервалов гистограммы в мкс (кроме последнего, неограниченного интервала)"""
+        return tuple(self._bin0_us << i for i in range(self._bins - 1))
+
+    def snapshot(self) -> dict:
+        """Возвращает копию статистики: {устройство: (транзакции, байты, суммарное время в мкс, гистограмма)}"""
+        return {key: (rec[0], rec[1], rec[2], tuple(rec[3])) for key, rec in self._devices.items()}
+
+    def reset(self):
+        """Обнуляет статистику"""
+        self._devices = {}
+
+    def print(self):
+        """Выводит статистику в компактном виде, одна строка на устройство"""
+        print(f"device: transactions, bytes, total us | histogram, upper limits us: {self.get_bin_limits()}")
+        for key, rec in self._devices.items():
+            device = f"0x{key:02x}" if isinstance(key, int) else str(key)
+            print(f"{device}: {rec[0]}, {rec[1]}, {rec[2]} | {rec[3]}")
+
+
+class BusTransaction:
+    """Контекстный менеджер для нескольких записей в устройство подряд (смотри BusAdapter.transaction):
+        with adapter.transaction(cs_pin) as tr:
+            tr.write(cmd)
+            tr.write_many((header, payload))
+            tr.latch()  # для устройств, защелкивающих данные по фронту CS (MAX7219, 74HC595)
+            tr.write(cmd)
+    Для SPI вывод выбора чипа и вывод режима данных устанавливаются один раз на всю транзакцию.
+    Для I2C каждая запись - отдельная транзакция на шине, как при вызове BusAdapter.write.
+    В статистике обмена (BusStats) вся транзакция учитывается один раз: суммарное количество байт и время от начала
+    до окончания транзакции.
+    Экземпляр можно сохранить и использовать повторно, чтобы не выделять память."""
+
+    def __init__(self, adapter, device_addr: [int, Pin]):
+        self._adapter = adapter
+        self._device_addr = device_addr
+        # момент начала текущей транзакции (BusAdapter._stats_begin) и количество байт ее данных
+        self._start = None
+        self._bytes = 0
+
+    def __enter__(self):
+        adapter = self._adapter
+        self._start = adapter._stats_begin()
+        self._bytes = 0
+        adapter._begin(self._device_addr)
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        adapter = self._adapter
+        adapter._end(self._device_addr)
+        adapter._stats_end(self._device_addr, self._bytes, self._start)
+        self._start = None
+        return False
+
+    def write(self, buf):
+        """Записывает в устройство все байты из буфера buf"""
+        self._adapter._write_in_transaction(self._device_addr, buf)
+        self._bytes += len(buf)
+
+    def write_many(self, buffers):
+        """Записывает в устройство все байты из буферов последовательности buffers, по порядку"""
+        write = self._adapter._write_in_transaction
+        addr = self._device_addr
+        for buf in buffers:
+            write(addr, buf)
+        self._bytes += _total_len(buffers)
+
+    def latch(self):
+        """Завершает текущую посылку (для SPI: импульс на выводе выбора чипа), не завершая транзакцию"""
+        self._adapter._latch(self._device_addr)
 
 
 class BusAdapter:
     """Посредник между шиной ввода/вывода и классом ввода/вывода устройства"""
+    # наибольший размер буфера шаблона метода write_const в байтах
+    fill_max = 64
+
     def __init__(self, bus: [I2C, SPI]):
         self.bus = bus
+        # буфер шаблона метода write_const (создается при первом вызове) и его значение
+        self._fill_buf = None
+        self._fill_val = None
+        # последний использованный срез буфера шаблона
+        self._fill_tail = None
+        # статистика обмена по шине (BusStats) или None, если статистика не собирается
+        self._stats = None
+
+    def get_stats(self):
+        """Возвращает статистику обмена по шине (BusStats) или None"""
+        return self._stats
+
+    def set_stats(self, stats):
+        """Включает сбор статистики обмена по шине в stats (BusStats). Если stats is None, то сбор статистики выключается.
+        Один экземпляр BusStats может использоваться несколькими адаптерами."""
+        self._stats = stats
+
+    def _stats_begin(self):
+        """Начало учитываемого в статистике обмена (get_stats) обращения к шине. Возвращает момент начала
+        (time.ticks_us) для _stats_end или None, если статистика не собирается. Все методы адаптеров и BusTransaction
+        учитывают обращения только этой парой методов. Выделения памяти нет."""
+        if self._stats is None:
+            return None
+        return time.ticks_us()
+
+    def _stats_end(self, device_addr: [int, Pin], n_bytes: int, start):
+        """Окончание обращения к шине, начатого _stats_begin: учитывает одну транзакцию длиной n_bytes байт.
+        Если start is None (статистика не собиралась в начале обращения), то ничего не делает."""
+        stats = self._stats
+        if start is not None and stats is not None:
+            stats.add(device_addr, n_bytes, start)
 
     def get_bus_type(self) -> type:
         """Возвращает тип шины"""
@@ -52,30 +201,60 @@ class BusAdapter:
         """Записывает в устройство на шине все байты из буфера buf"""
         raise NotImplementedError
 
+    def write_many(self, device_addr: [int, Pin], buffers):
+        """Записывает в устройство на шине все байты из буферов последовательности buffers одной посылкой
+        (один импульс выбора чипа SPI или одна транзакция I2C), без объединения буферов в один.
+        Например заголовок (команда, адрес) и срез (memoryview) буфера данных."""
+        raise NotImplementedError
+
+    def transaction(self, device_addr: [int, Pin]) -> BusTransaction:
+        """Возвращает контекстный менеджер для нескольких записей в устройство подряд. Смотри BusTransaction."""
+        return BusTransaction(self, device_addr)
+
+    def _begin(self, device_addr: [int, Pin]):
+        """Начало транзакции (BusTransaction)"""
+        pass
+
+    def _end(self, device_addr: [int, Pin]):
+        """Окончание транзакции (BusTransaction)"""
+        pass
+
+    def _latch(self, device_addr: [int, Pin]):
+        """Завершение посылки внутри транзакции (BusTransaction)"""
+        pass
+
+    def _write_in_transaction(self, device_addr: [int, Pin], buf):
+        """Запись внутри транзакции (BusTransaction). Статистику обмена учитывает BusTransaction, поэтому наследники,
+        собирающие статистику в write, переопределяют этот метод записью без ее учета."""
+        self.write(device_addr, buf)
+
     def write_const(self, device_addr: [int, Pin], val: int, count: int):
         """Отправляет пакет байт со значение val количеством count на шину.
         Часто, при работе с дисплеями или памятью, требуется заполнение экрана/области
         постоянным значением. Для этого и предназначен этот метод!
-        Вызов его для сравнительно медленных шин - плохая идея!"""
+        Вызов его для сравнительно медленных шин - плохая идея!
+        Пакет передается частями не длиннее fill_max байт из буфера шаблона, который создается один раз
+        и заполняется заново только при изменении val. Части передаются срезами memoryview, без копирования."""
         if 0 == count:
             return  # нет ничего
-        # bl = val.bit_length()     # bit_length() отсутствует в MicroPython
-        bl = mpy_bl(val)
-        if bl > 8:
-            raise ValueError(f"The value must take no more than 8 bits! Current: {bl}")
-        _max = 16
-        if count < _max:
-            _max = count
-        # вычисляю кол-во повторений тела цикла
-        repeats = count // _max  # количество итераций
-        b = bytearray([val for _ in range(_max)])
-        for _ in range(repeats):
-            self.write(device_addr, b)
-        # вычисляю остаток
-        remainder = count - _max * repeats
-        if remainder:
-            b = bytearray([val for _ in range(remainder)])
-            self.write(device_addr, b)
+        if not 0 <= val <= 0xFF:
+            raise ValueError(f"The value must take no more than 8 bits! Current: {mpy_bl(val)}")
+        mv = self._fill_buf
+        if mv is None:
+            mv = self._fill_buf = memoryview(bytearray(BusAdapter.fill_max))
+        if val != self._fill_val:
+            for i in range(len(mv)):
+                mv[i] = val
+            self._fill_val = val
+        _max = len(mv)
+        while count > _max:
+            self.write(device_addr, mv)
+            count -= _max
+        # срез последней части запоминается: повторные вызовы с тем же count не выделяют память
+        tail = self._fill_tail
+        if tail is None or len(tail) != count:
+            tail = self._fill_tail = mv[:count]
+        self.write(device_addr, tail)
 
     def read_buf_from_memory(self, device_addr: [int, Pin], mem_addr, buf, address_size: int):
         """Читает из устройства с адресом device_addr в буфер buf, начиная с адреса в устройстве mem_addr.
@@ -92,6 +271,8 @@ class I2cAdapter(BusAdapter):
     """Адаптер шины I2C"""
     def __init__(self, bus: I2C):
         super().__init__(bus)
+        # есть ли у шины метод записи нескольких буферов одной транзакцией
+        self._has_writevto = hasattr(bus, "writevto")
 
     def write_register(self, device_addr: int, reg_addr: int, value: [int, bytes, bytearray],
                        bytes_count: int, byte_order: str):
@@ -104,23 +285,59 @@ class I2cAdapter(BusAdapter):
         if isinstance(value, (bytes, bytearray)):
             buf = value
 
-        return self.bus.writeto_mem(device_addr, reg_addr, buf)
+        start = self._stats_begin()
+        try:
+            return self.bus.writeto_mem(device_addr, reg_addr, buf)
+        finally:
+            self._stats_end(device_addr, len(buf), start)
 
     def read_register(self, device_addr: int, reg_addr: int, bytes_count: int) -> bytes:
         """считывает из регистра датчика значение.
         bytes_count - размер значения в байтах"""
-        return self.bus.readfrom_mem(device_addr, reg_addr, bytes_count)
+        start = self._stats_begin()
+        try:
+            return self.bus.readfrom_mem(device_addr, reg_addr, bytes_count)
+        finally:
+            self._stats_end(device_addr, bytes_count, start)
 
     def read(self, device_addr: int, n_bytes: int) -> bytes:
-        return self.bus.readfrom(device_addr, n_bytes)
+        start = self._stats_begin()
+        try:
+            return self.bus.readfrom(device_addr, n_bytes)
+        finally:
+            self._stats_end(device_addr, n_bytes, start)
 
     def read_to_buf(self, device_addr: int, buf: bytearray) -> bytes:
         """Читает из устройства на шине с адресом device_addr в буфер buf количество байт, равное длине(len) буфера!"""
-        self.bus.readfrom_into(device_addr, buf)
-        return buf
-    
+        start = self._stats_begin()
+        try:
+            self.bus.readfrom_into(device_addr, buf)
+            return buf
+        finally:
+            self._stats_end(device_addr, len(buf), start)
+
     def write(self, device_addr: int, buf: bytes):
-        return self.bus.writeto(device_addr, buf)
+        start = self._stats_begin()
+        try:
+            return self.bus.writeto(device_addr, buf)
+        finally:
+            self._stats_end(device_addr, len(buf), start)
+
+    def write_many(self, device_addr: int, buffers):
+        """Записывает в устройство все байты из буферов buffers одной транзакцией I2C (I2C.writevto).
+        Если у шины нет метода writevto, то буферы объединяются. bytes.join в MicroPython принимает только bytes,
+        поэтому буферы bytearray и memoryview предварительно преобразуются."""
+        start = self._stats_begin()
+        try:
+            if self._has_writevto:
+                return self.bus.writevto(device_addr, buffers)
+            return self.bus.writeto(device_addr, b"".join(bytes(buf) for buf in buffers))
+        finally:
+            if start is not None:
+                self._stats_end(device_addr, _total_len(buffers), start)
+
+    def _write_in_transaction(self, device_addr: int, buf):
+        self.bus.writeto(device_addr, buf)
 
     def read_buf_from_memory(self, device_addr: int, mem_addr, buf, address_size: int = 1):
         """Читает из устройства с адресом device_addr в буфер buf, начиная с адреса в устройстве mem_addr.
@@ -128,14 +345,22 @@ class I2cAdapter(BusAdapter):
         address_size - определяет размер адреса в байтах. (в ESP8266 этот аргумент не распознается и размер адреса
         всегда равен 1 (8 бит)).
         Расширение возможностей базового класса."""
-        self.bus.readfrom_mem_into(device_addr, mem_addr, buf)
-        return buf
+        start = self._stats_begin()
+        try:
+            self.bus.readfrom_mem_into(device_addr, mem_addr, buf)
+            return buf
+        finally:
+            self._stats_end(device_addr, len(buf), start)
 
     def write_buf_to_memory(self, device_addr: int, mem_addr, buf):
         """Записывает в устройство с адресом device_addr все байты из буфера buf.
         Запись начинается с адреса в устройстве: mem_addr.
         Расширение возможностей базового класса."""
-        return self.bus.writeto_mem(device_addr, mem_addr, buf)
+        start = self._stats_begin()
+        try:
+            return self.bus.writeto_mem(device_addr, mem_addr, buf)
+        finally:
+            self._stats_end(device_addr, len(buf), start)
 
 
 class SpiAdapter(BusAdapter):
@@ -176,20 +401,24 @@ class SpiAdapter(BusAdapter):
     def read(self, device_addr: Pin, n_bytes: int) -> bytes:
         """Read a number of bytes specified by n_bytes while continuously writing the single byte given by write.
         Returns a bytes object with the data that was read."""
+        start = self._stats_begin()
         try:
             device_addr.value(0)
             return self.bus.read(n_bytes)
         finally:
             device_addr.value(1)
+            self._stats_end(device_addr, n_bytes, start)
 
     def read_to_buf(self, device_addr: Pin, buf) -> bytes:
         """Читает из устройства на шине с адресом device_addr в буфер buf количество байт, равное длине(len) буфера!"""
+        start = self._stats_begin()
         try:
             device_addr.value(0)
             self.bus.readinto(buf, 0x00)
             return buf
         finally:
             device_addr.value(1)
+            self._stats_end(device_addr, len(buf), start)
 
     def write(self, device_addr: Pin, buf: bytes):
         """Параметр data_packet представляет собой признак того, что посылка является данными (high) или командой (low).
@@ -197,13 +426,42 @@ class SpiAdapter(BusAdapter):
         Write the bytes contained in buf. Returns None.
         The data_packet parameter is an indication that the package is data (high) or command (low).
          For example, this is necessary when exchanging ILI9481."""
+        start = self._stats_begin()
         try:
-            device_addr.value(0)   # chip select
-            if self.use_data_mode_pin and self.data_mode_pin:
-                self.data_mode_pin.value(self.data_packet)
+            self._begin(device_addr)
             return self.bus.write(buf)
         finally:
             device_addr.value(1)
+            self._stats_end(device_addr, len(buf), start)
+
+    def write_many(self, device_addr: Pin, buffers):
+        """Записывает все байты из буферов buffers при одном импульсе выбора чипа, без объединения буферов.
+        Вывод режима данных устанавливается один раз."""
+        start = self._stats_begin()
+        try:
+            self._begin(device_addr)
+            write = self.bus.write
+            for buf in buffers:
+                write(buf)
+        finally:
+            device_addr.value(1)
+            if start is not None:
+                self._stats_end(device_addr, _total_len(buffers), start)
+
+    def _begin(self, device_addr: Pin):
+        device_addr.value(0)   # chip select
+        if self.use_data_mode_pin and self.data_mode_pin:
+            self.data_mode_pin.value(self.data_packet)
+
+    def _end(self, device_addr: Pin):
+        device_addr.value(1)
+
+    def _latch(self, device_addr: Pin):
+        device_addr.value(1)
+        device_addr.value(0)
+
+    def _write_in_transaction(self, device_addr: Pin, buf):
+        self.bus.write(buf)
 
     def write_and_read(self, device_addr: Pin, wr_buf: bytes, rd_buf: bytes):
         """Одновременная запись и чтение байт.
@@ -219,13 +477,13 @@ class SpiAdapter(BusAdapter):
         but both buffers must have the same length. Returns None.
         The data_packet parameter is an indication that the package is data (high) or command (low).
          For example, this is necessary when exchanging ILI9481."""
+        start = self._stats_begin()
         try:
-            device_addr.value(0)   # chip select
-            if self.use_data_mode_pin and self.data_mode_pin:
-                self.data_mode_pin.value(self.data_packet)
+            self._begin(device_addr)
             return self.bus.write_readinto(wr_buf, rd_buf)
         finally:
             device_addr.value(1)
+            self._stats_end(device_addr, len(wr_buf), start)
 
     def read_buf_from_memory(self, device_addr: Pin, mem_addr, buf, address_size: int):
         """Читает из устройства с адресом device_addr в буфер buf, начиная с адреса в устройстве mem_addr.
@@ -14,17 +14,82 @@ Copyright (c) 2022 Roman Shevchik
     Входная последовательность: 0x01 0x02 0x03
     CRC-8: 0x87
     Входная последовательность: 0 1 2 3 4 5 6 7 8 9
-    CRC-8: 0x52"""
+    CRC-8: 0x52
 
+ Вычисление табличное: таблица из 256 значений вычисляется один раз для каждого полинома и хранится в _tables.
+ Начальное значение и завершающий XOR на таблицу не влияют."""
 
-def crc8(sequence: bytes, polynomial: int, init_value: int = 0x00, final_xor = 0x00):
-    mask = 0xFF
-    crc = init_value & mask
+import sys
+import micropython
+
+# полином -> таблица CRC-8 (bytes длиной 256)
+_tables = {}
+
+# Ядро табличного вычисления. buf - bytes, bytearray или memoryview (срез без копирования).
+# Определяется только в MicroPython (эмиттер viper).
+if "micropython" == sys.implementation.name:
+    @micropython.viper
+    def _crc8_update(buf: ptr8, length: int, table: ptr8, crc: int) -> int:
+        i = 0
+        while i < length:
+            crc = table[crc ^ buf[i]]
+            i += 1
+        return crc
+else:
+    # эмиттер viper недоступен (например, CPython). Используется код на Python.
+    _crc8_update = None
+
+
+def get_table(polynomial: int) -> bytes:
+    """Возвращает таблицу CRC-8 для полинома polynomial (вычисляется при первом обращении)."""
+    polynomial &= 0xFF
+    table = _tables.get(polynomial)
+    if table is None:
+        buf = bytearray(256)
+        for value in range(256):
+            crc = value
+            for _ in range(8):
+                if crc & 0x80:
+                    crc = 0xFF & ((crc << 1) ^ polynomial)
+                else:
+                    crc = 0xFF & (crc << 1)
+            buf[value] = crc
+        table = bytes(buf)
+        _tables[polynomial] = table
+    return table
+
+
+def _update(crc: int, sequence, table: bytes) -> int:
+    """Продолжает вычисление CRC-8 crc по байтам из sequence. Возвращает CRC без завершающего XOR."""
+    if _crc8_update is not None and isinstance(sequence, (bytes, bytearray, memoryview)):
+        return _crc8_update(sequence, len(sequence), table, crc)
     for item in sequence:
-        crc ^= item & mask
-        for _ in range(8):
-            if crc & 0x80:
-                crc = mask & ((crc << 1) ^ polynomial)
-            else:
-                crc = mask & (crc << 1)
-    return crc ^ final_xor
+        crc = table[crc ^ (item & 0xFF)]
+    return crc
+
+
+def crc8(sequence: bytes, polynomial: int, init_value: int = 0x00, final_xor = 0x00):
+    """Возвращает CRC-8 последовательности байт sequence (bytes, bytearray, memoryview или последовательность int)."""
+    return _update(init_value & 0xFF, sequence, get_table(polynomial)) ^ final_xor
+
+
+class Crc8:
+    """Последовательное (по частям) вычисление CRC-8, например при приеме кадра датчика несколькими чтениями."""
+
+    def __init__(self, polynomial: int, init_value: int = 0x00, final_xor: int = 0x00):
+        self._table = get_table(polynomial)
+        self._init = init_value & 0xFF
+        self._final_xor = final_xor
+        self._crc = self._init
+
+    def reset(self):
+        """Возвращает вычисление в начало"""
+        self._crc = self._init
+
+    def update(self, sequence):
+        """Продолжает вычисление по байтам из sequence (bytes, bytearray, memoryview или последовательность int)"""
+        self._crc = _update(self._crc, sequence, self._table)
+
+    def get_value(self) -> int:
+        """Возвращает CRC-8 всех переданных методу update байт"""
+        return self._crc ^ self._final_xor
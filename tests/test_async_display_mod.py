@@ -0,0 +1,58 @@
+"""Тесты асинхронной обертки символьного дисплея (async_display_mod.py). Запуск под CPython: python -m pytest tests"""
+
+# MIT license
+
+import unittest
+import host_compat
+
+host_compat.install(real_sleep=False)
+
+import asyncio
+from machine import SPI, Pin
+from sensor_pack_2.bus_service import SpiAdapter
+from lib_displays.max7219mod import MAX7219
+from lib_displays.max7219display import MAX7219Display
+from lib_displays.async_display_mod import AsyncCharDisplay
+from lib_displays.marquee_mod import Marquee
+
+
+class TestAsyncCharDisplay(unittest.TestCase):
+
+    def setUp(self):
+        controller = MAX7219(SpiAdapter(SPI(1)), Pin(5))
+        controller.init(columns=4, rows=1)
+        self.display = MAX7219Display(controller, code_b=False)
+        self.display.init()
+        self.wrapper = AsyncCharDisplay(self.display)
+
+    def test_uses_public_controller(self):
+        self.assertIs(self.display.get_controller(), self.wrapper._controller)
+
+    def test_overflow_forwarded(self):
+        ok = asyncio.run(self.wrapper.show_int(123456, overflow='E'))
+        self.assertFalse(ok)
+        code = self.display.get_char_code('E')
+        self.assertEqual([code] * 4, list(self.display._frame))
+        ok = asyncio.run(self.wrapper.show_fixed(-1234, 1, overflow='H'))
+        self.assertFalse(ok)
+        self.assertEqual([self.display.get_char_code('H')] * 4, list(self.display._frame))
+        self.assertTrue(asyncio.run(self.wrapper.show_float(1.25, 2, overflow='H')))
+
+    def test_empty_marquee_does_not_block_loop(self):
+        marquee = Marquee(self.display, "", period_ms=0, gap=0)
+        self.assertEqual(0, marquee.get_steps_per_pass())
+
+        async def main():
+            self.wrapper.start_scroll(marquee)
+            ticks = 0
+            for _ in range(5):
+                await asyncio.sleep(0)
+                ticks += 1
+            await self.wrapper.stop()
+            return ticks
+
+        self.assertEqual(5, asyncio.run(asyncio.wait_for(main(), 2)))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,42 @@
+"""Тесты базовых классов датчиков (sensor_pack_2/base_sensor.py). Запуск под CPython: python -m pytest tests"""
+
+# MIT license
+
+import unittest
+import host_compat
+
+host_compat.install(real_sleep=False)
+
+from machine import I2C
+from sensor_pack_2.bus_service import I2cAdapter
+from sensor_pack_2.base_sensor import DeviceEx
+
+
+class _Registers(DeviceEx):
+    """Устройство, регистры которого читаются переопределенным read_reg"""
+
+    def read_reg(self, reg_addr: int, bytes_count=2) -> bytes:
+        return bytes((0xFF, 0xFE))
+
+
+class TestReadReg16(unittest.TestCase):
+
+    def test_uses_read_reg(self):
+        big = _Registers(I2cAdapter(bus=I2C(0)), 0x40, big_byte_order=True)
+        self.assertEqual(0xFFFE, big.read_reg_16(0))
+        self.assertEqual(-2, big.read_reg_16(0, signed=True))
+        little = _Registers(I2cAdapter(bus=I2C(0)), 0x40, big_byte_order=False)
+        self.assertEqual(0xFEFF, little.read_reg_16(0))
+
+    def test_reads_into_buffer(self):
+        i2c = I2C(0)
+        i2c.set_rx(b"\x12\x34")
+        device = DeviceEx(I2cAdapter(bus=i2c), 0x40, big_byte_order=True)
+        self.assertEqual(0x1234, device.read_reg_16(3))
+        i2c.set_rx(b"\xFF\xFE")
+        self.assertEqual(-2, device.read_reg_16(3, signed=True))
+        self.assertEqual(2, i2c.transactions)
+
+
+if __name__ == "__main__":
+    unittest.main()
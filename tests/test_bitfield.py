@@ -0,0 +1,74 @@
+"""Тесты битовых полей (bitfield.py). Запуск под CPython: python -m pytest tests"""
+
+# MIT license
+
+import unittest
+import host_compat
+
+host_compat.install(real_sleep=False)
+
+from sensor_pack_2.bitfield import bit_field_info, BitFields
+
+
+def make_fields() -> BitFields:
+    return BitFields((
+        bit_field_info(name="EN", position=range(0, 1), valid_values=None, description=None),
+        bit_field_info(name="MODE", position=range(1, 4), valid_values=range(8), description=None),
+        bit_field_info(name="HIGH", position=range(7, 3, -1), valid_values=None, description=None),
+        bit_field_info(name="FLAG", position=range(15, 16), valid_values=None, description=None),
+        bit_field_info(name="GAIN", position=range(8, 12), valid_values=range(10), description=None),
+    ))
+
+
+class TestBitFields(unittest.TestCase):
+
+    def test_decode_matches_get_field_value(self):
+        fields = make_fields()
+        values = fields.make_values()
+        for source in (0x0000, 0xFFFF, 0x8A5B, 0x1234, 0x7FF0):
+            fields.source = source
+            self.assertIs(values, fields.decode(source, values))
+            for fi in fields:
+                index = fields.field_index(fi.name)
+                self.assertEqual(fields.get_field_value(fi.name), values[index])
+                self.assertEqual(fields[fi.name], values[index])
+            self.assertEqual(values, fields.decode())
+
+    def test_one_bit_fields_are_bool(self):
+        fields = make_fields()
+        values = fields.decode(0x8001)
+        self.assertIs(True, values[fields.field_index("EN")])
+        self.assertIs(True, values[fields.field_index("FLAG")])
+        self.assertIsInstance(values[fields.field_index("MODE")], int)
+
+    def test_descending_range(self):
+        descending = make_fields()
+        ascending = BitFields((bit_field_info(name="HIGH", position=range(4, 8), valid_values=None, description=None),))
+        for source in (0x00, 0xF0, 0x50, 0xAF, 0x3C):
+            self.assertEqual(ascending.decode(source), [descending.decode(source)[2]])
+        # поле занимает биты 4..7, сдвиг по младшему биту поля
+        self.assertEqual(0x0A, descending.decode(0xA0)[2])
+        self.assertEqual(0xB0, descending.set_field_value(0x0B, 0x00, "HIGH"))
+
+    def test_set_field_value(self):
+        fields = make_fields()
+        self.assertEqual(0x0A, fields.set_field_value(5, 0x00, "MODE"))
+        self.assertEqual(0xFFF1, fields.set_field_value(0, 0xFFFF, "MODE"))
+        # значение шире поля обрезается маской
+        self.assertEqual(0x0F00, fields.set_field_value(0x1F, 0x00, "GAIN", validate=False))
+        with self.assertRaises(ValueError):
+            fields.set_field_value(10, 0x00, "GAIN")
+        fields.source = 0
+        fields["MODE"] = 3
+        self.assertEqual(0x06, fields.source)
+        self.assertEqual(3, fields["MODE"])
+
+    def test_unknown_field(self):
+        fields = make_fields()
+        self.assertIsNone(fields.field_index("NONE"))
+        with self.assertRaises(ValueError):
+            fields.get_field_value("NONE")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,102 @@
+"""Тесты адаптеров шин (sensor_pack_2/bus_service.py). Запуск под CPython: python -m pytest tests"""
+
+# MIT license
+
+import unittest
+import host_compat
+
+host_compat.install(real_sleep=False)
+
+from machine import I2C, SPI, Pin
+from sensor_pack_2.bus_service import I2cAdapter, SpiAdapter, BusStats
+
+
+class TestI2cWriteMany(unittest.TestCase):
+
+    def test_fallback_without_writevto(self):
+        i2c = I2C(0)
+        adapter = I2cAdapter(bus=i2c)
+        # шина без I2C.writevto: буферы объединяются
+        adapter._has_writevto = False
+        payload = bytearray(b"\x01\x02\x03")
+        adapter.write_many(0x70, (b"\x00", bytearray(b"\xAA"), memoryview(payload)[1:]))
+        self.assertEqual([(0x70, b"\x00\xAA\x02\x03")], i2c.log)
+
+
+class TestTransactionStats(unittest.TestCase):
+
+    def _check(self, adapter, device_addr):
+        stats = BusStats()
+        adapter.set_stats(stats)
+        with adapter.transaction(device_addr) as tr:
+            tr.write(b"\x01\x02")
+            tr.write_many((b"\x03", bytearray(b"\x04\x05")))
+            tr.latch()
+            tr.write(b"\x06")
+        adapter.write(device_addr, b"\x07")
+        transactions, n_bytes, _, histogram = stats.snapshot()[device_addr]
+        self.assertEqual(2, transactions)
+        self.assertEqual(7, n_bytes)
+        self.assertEqual(2, sum(histogram))
+
+    def test_spi_transaction_counted_once(self):
+        self._check(SpiAdapter(bus=SPI(1)), Pin(5, Pin.OUT))
+
+    def test_i2c_transaction_counted_once(self):
+        self._check(I2cAdapter(bus=I2C(0)), 0x70)
+
+    def test_stats_enabled_inside_transaction_ignored(self):
+        adapter = SpiAdapter(bus=SPI(1))
+        cs = Pin(5, Pin.OUT)
+        stats = BusStats()
+        with adapter.transaction(cs) as tr:
+            adapter.set_stats(stats)
+            tr.write(b"\x01")
+        self.assertEqual({}, stats.snapshot())
+
+    def test_adapter_methods_count_bytes(self):
+        adapter = I2cAdapter(bus=I2C(0))
+        stats = BusStats()
+        adapter.set_stats(stats)
+        adapter.write(0x70, b"\x01\x02")
+        adapter.write_many(0x70, (b"\x03", memoryview(b"\x04\x05")))
+        adapter.write_buf_to_memory(0x70, 0, b"\x06")
+        adapter.read_to_buf(0x70, bytearray(4))
+        self.assertEqual((4, 10), stats.snapshot()[0x70][:2])
+
+
+class TestWriteConst(unittest.TestCase):
+
+    def test_chunks(self):
+        spi = SPI(1)
+        adapter = SpiAdapter(spi)
+        cs = Pin(5)
+        adapter.write_const(cs, 0xA5, 150)
+        self.assertEqual([64, 64, 22], [len(buf) for buf in spi.log])
+        self.assertEqual(b"\xA5" * 150, b"".join(spi.log))
+        spi.reset()
+        adapter.write_const(cs, 0xA5, 0)
+        self.assertEqual([], spi.log)
+
+    def test_value_change_refills_pattern(self):
+        spi = SPI(1)
+        adapter = SpiAdapter(spi)
+        cs = Pin(5)
+        adapter.write_const(cs, 0x00, 10)
+        tail = adapter._fill_tail
+        adapter.write_const(cs, 0xFF, 10)
+        # срез последней части используется повторно
+        self.assertIs(tail, adapter._fill_tail)
+        adapter.write_const(cs, 0x11, 70)
+        self.assertEqual([b"\x00" * 10, b"\xFF" * 10, b"\x11" * 64, b"\x11" * 6], spi.log)
+
+    def test_i2c_and_range(self):
+        i2c = I2C(0)
+        adapter = I2cAdapter(bus=i2c)
+        adapter.write_const(0x70, 0x7E, 65)
+        self.assertEqual([(0x70, b"\x7E" * 64), (0x70, b"\x7E")], i2c.log)
+        with self.assertRaises(ValueError):
+            adapter.write_const(0x70, 0x100, 1)
+
+if __name__ == "__main__":
+    unittest.main()
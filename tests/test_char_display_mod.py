@@ -0,0 +1,276 @@
+"""Тесты символьного дисплея (char_display_mod.py) на примере MAX7219Display без B-кода.
+Запуск под CPython: python -m pytest tests"""
+
+# MIT license
+
+import unittest
+import host_compat
+
+host_compat.install(real_sleep=False)
+
+from machine import SPI, Pin
+from sensor_pack_2.bus_service import SpiAdapter, BusStats
+from lib_displays.max7219mod import MAX7219
+from lib_displays.max7219display import MAX7219Display
+
+
+def make(columns: int = 4):
+    """Возвращает дисплей, его контроллер и шину. Журнал шины пуст."""
+    spi = SPI(1)
+    controller = MAX7219(SpiAdapter(spi), Pin(5))
+    controller.init(columns=columns, rows=1)
+    display = MAX7219Display(controller, code_b=False)
+    display.init()
+    spi.reset()
+    return display, controller, spi
+
+
+def rendered(display, text: str) -> bytes:
+    """Возвращает кадр, который выводит show_by_pos(text), без изменения кадра дисплея."""
+    frame = bytearray(display._frame)
+    display.encode(text, frame, len(frame) - 1, -1, len(frame))
+    return bytes(frame)
+
+
+class TestGlyphTable(unittest.TestCase):
+
+    def test_compiled_codes(self):
+        display = make()[0]
+        for char, segments in display._seg_map_digits.items():
+            self.assertEqual(display.segments_to_raw(segments), display.get_char_code(char))
+            self.assertEqual(display.segments_to_raw(segments + 'p'), display.get_char_code(char, True))
+        self.assertEqual(0x30, display.get_char_code('1'))
+        self.assertEqual(0xB0, display.get_char_code('1', True))
+
+    def test_ascii_table_matches_glyphs(self):
+        display = make()[0]
+        codes = display._ascii_codes
+        for c in range(128):
+            char = chr(c)
+            self.assertEqual(display.get_char_code(char), codes[c])
+            self.assertEqual(display.get_char_code(char, True), codes[128 + c])
+
+    def test_non_printable(self):
+        display = make()[0]
+        np_code = display.segments_to_raw(display.get_non_printable())
+        self.assertEqual(np_code, display.get_char_code('\x01'))
+        self.assertEqual(np_code, display.get_char_code('€'))
+
+    def test_inverse_logic_recompiles(self):
+        display = make()[0]
+        self.assertEqual(0x30, display.get_char_code('1'))
+        display.set_inverse_logic(True)
+        self.assertEqual(0xFF & ~0x30, display.get_char_code('1'))
+        self.assertEqual(0xFF & ~0xB0, display.get_char_code('1', True))
+        self.assertEqual(0xFF & ~0x30, display._ascii_codes[ord('1')])
+
+    def test_decimal_point_joins_char(self):
+        display, controller, spi = make()
+        display.show_by_pos("1.2 3")
+        # обратный порядок индексов: знакоместо 3 - крайнее левое
+        frame = display._frame
+        self.assertEqual(display.get_char_code('1', True), frame[3])
+        self.assertEqual(display.get_char_code('2'), frame[2])
+        self.assertEqual(display.get_char_code(' '), frame[1])
+        self.assertEqual(display.get_char_code('3'), frame[0])
+        self.assertEqual(bytes(frame), rendered(display, b"1.2 3"))
+
+
+class TestShadowFlush(unittest.TestCase):
+
+    def test_unchanged_frame_sends_nothing(self):
+        display, controller, spi = make()
+        display.show_by_pos("1234")
+        spi.reset()
+        display.show_by_pos("1234")
+        self.assertEqual([], spi.log)
+        self.assertFalse(display.is_dirty())
+
+    def test_only_changed_char_sent(self):
+        display, controller, spi = make()
+        display.show_by_pos("1234")
+        spi.reset()
+        display.show_by_pos("1284")
+        # позиция 2 слева - знакоместо 1
+        self.assertEqual([bytes((MAX7219.cmd_digit_0 + 1, display.get_char_code('8')))], spi.log)
+
+    def test_changed_spans(self):
+        display, controller, spi = make(columns=8)
+        display.show_by_pos("12345678")
+        spi.reset()
+        display.show_by_pos("1AB456C8")
+        # участки: знакоместа 5..6 ("AB") и знакоместо 1 ("C")
+        self.assertEqual([
+            bytes((MAX7219.cmd_digit_0 + 1, display.get_char_code('C'))),
+            bytes((MAX7219.cmd_digit_0 + 5, display.get_char_code('B'))),
+            bytes((MAX7219.cmd_digit_0 + 6, display.get_char_code('A'))),
+        ], spi.log)
+
+    def test_span_is_one_transaction(self):
+        display, controller, spi = make()
+        display.show_by_pos("1234")
+        stats = BusStats()
+        controller._connector.adapter.set_stats(stats)
+        spi.reset()
+        display.show_by_pos("5674")
+        self.assertEqual(3, len(spi.log))
+        # один участок из трех знакомест - одна транзакция на шине
+        self.assertEqual((1, 6), stats.snapshot()[controller._cs][:2])
+
+    def test_invalidate_forces_full_rewrite(self):
+        display, controller, spi = make()
+        display.show_by_pos("1234")
+        spi.reset()
+        display.invalidate()
+        self.assertTrue(display.is_dirty())
+        display.flush()
+        self.assertEqual(4, len(spi.log))
+        self.assertEqual({MAX7219.cmd_digit_0 + i for i in range(4)}, {buf[0] for buf in spi.log})
+
+    def test_manual_flush(self):
+        display, controller, spi = make()
+        display.set_auto_flush(False)
+        display.show_by_pos("12")
+        display.show_by_pos("34", 2)
+        self.assertEqual([], spi.log)
+        self.assertTrue(display.is_dirty())
+        display.flush()
+        self.assertEqual(4, len(spi.log))
+        self.assertEqual(bytes(display._frame), rendered(display, "1234"))
+        spi.reset()
+        display.flush()
+        self.assertEqual([], spi.log)
+
+
+    def test_flush_size(self):
+        display, controller, spi = make(columns=8)
+        display.set_auto_flush(False)
+        self.assertEqual((1, 8), display.get_flush_size())
+        display.flush()
+        self.assertEqual((0, 0), display.get_flush_size())
+        display.show_by_pos("12 4 678")
+        size = display.get_flush_size()
+        spi.reset()
+        display.flush()
+        self.assertEqual((3, 6), size)
+        self.assertEqual(6, len(spi.log))
+        display.show_by_pos("AB")
+        display.set_span_update(False)
+        self.assertEqual((2, 2), display.get_flush_size())
+        display.set_partial_update(False)
+        self.assertEqual((1, 8), display.get_flush_size())
+
+class TestShowNumber(unittest.TestCase):
+
+    def _check(self, display, text: str):
+        self.assertEqual(rendered(display, text), bytes(display._frame))
+
+    def test_show_fixed(self):
+        display = make()[0]
+        self.assertTrue(display.show_fixed(125, 2))
+        self._check(display, " 1.25")
+        # ноль целой части не гасится
+        self.assertTrue(display.show_fixed(5, 2))
+        self._check(display, " 0.05")
+        self.assertTrue(display.show_fixed(-5, 1))
+        self._check(display, " -0.5")
+
+    def test_show_int_sign_and_leading_zero(self):
+        display = make()[0]
+        self.assertTrue(display.show_int(-12))
+        self._check(display, " -12")
+        self.assertTrue(display.show_int(0))
+        self._check(display, "   0")
+        self.assertTrue(display.show_int(42, leading_zero=True))
+        self._check(display, "0042")
+        self.assertTrue(display.show_int(-42, leading_zero=True))
+        self._check(display, "-042")
+
+    def test_overflow(self):
+        display = make()[0]
+        self.assertTrue(display.show_int(-999))
+        self._check(display, "-999")
+        self.assertFalse(display.show_int(-1000))
+        self._check(display, "----")
+        self.assertFalse(display.show_int(12345, overflow='E'))
+        self._check(display, "EEEE")
+        self.assertFalse(display.show_fixed(10000, 1))
+        self._check(display, "----")
+
+    def test_field(self):
+        display = make()[0]
+        display.show_by_pos("ABCD")
+        self.assertTrue(display.show_int(7, x=1, width=2))
+        self._check(display, "A 7D")
+        self.assertFalse(display.show_int(100, x=1, width=2))
+        self._check(display, "A--D")
+        with self.assertRaises(ValueError):
+            display.show_int(1, x=2, width=3)
+        with self.assertRaises(ValueError):
+            display.show_fixed(1, -1)
+
+    def test_show_float_rounding(self):
+        display = make()[0]
+        self.assertTrue(display.show_float(1.25, 2))
+        self._check(display, " 1.25")
+        self.assertTrue(display.show_float(3.14159, 3))
+        self._check(display, "3.142")
+        # половина округляется от нуля
+        self.assertTrue(display.show_float(-0.5, 0))
+        self._check(display, "  -1")
+        self.assertTrue(display.show_float(0.999, 2))
+        self._check(display, " 1.00")
+        # отрицательное число, округленное до нуля, выводится без знака
+        self.assertTrue(display.show_float(-0.004, 2))
+        self._check(display, " 0.00")
+
+    def test_show_float_overflow(self):
+        display = make()[0]
+        self.assertFalse(display.show_float(99.996, 2))
+        self._check(display, "----")
+        self.assertFalse(display.show_float(float("inf"), 1))
+        self._check(display, "----")
+        self.assertFalse(display.show_float(float("nan"), 1))
+
+    def test_show_float_decimals_range(self):
+        display = make(columns=8)[0]
+        self.assertFalse(display.show_float(0.5, 9))
+        self._check(display, "--------")
+        for decimals in (-1, 10):
+            with self.assertRaises(ValueError):
+                display.show_float(1.0, decimals)
+
+class TestFill(unittest.TestCase):
+
+    def test_fill_one_transaction(self):
+        display, controller, spi = make()
+        display.show_by_pos("1234")
+        stats = BusStats()
+        controller._connector.adapter.set_stats(stats)
+        spi.reset()
+        display.fill(0x7F)
+        self.assertEqual(b"\x7F" * 4, bytes(display._frame))
+        self.assertEqual({(MAX7219.cmd_digit_0 + i, 0x7F) for i in range(4)}, {tuple(buf) for buf in spi.log})
+        self.assertEqual(1, stats.snapshot()[controller._cs][0])
+        self.assertFalse(display.is_dirty())
+
+    def test_clear_blank_display_skips_bus(self):
+        display, controller, spi = make()
+        display.clear()
+        spi.reset()
+        display.clear()
+        self.assertEqual([], spi.log)
+        display.show_by_pos("   ")
+        self.assertEqual([], spi.log)
+
+    def test_fill_without_auto_flush(self):
+        display, controller, spi = make()
+        display.set_auto_flush(False)
+        display.fill(0x01)
+        self.assertEqual([], spi.log)
+        self.assertTrue(display.is_dirty())
+        display.flush()
+        self.assertEqual(4, len(spi.log))
+
+if __name__ == "__main__":
+    unittest.main()
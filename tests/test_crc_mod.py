@@ -0,0 +1,70 @@
+"""Тесты табличного вычисления CRC-8 (crc_mod.py). Запуск под CPython: python -m pytest tests"""
+
+# MIT license
+
+import unittest
+import host_compat
+
+host_compat.install(real_sleep=False)
+
+from sensor_pack_2.crc_mod import crc8, get_table, Crc8
+
+
+def crc8_bitwise(sequence, polynomial: int, init_value: int = 0, final_xor: int = 0) -> int:
+    """Эталонное побитовое вычисление CRC-8 (без таблицы)."""
+    crc = init_value & 0xFF
+    for item in sequence:
+        crc ^= item & 0xFF
+        for _ in range(8):
+            if crc & 0x80:
+                crc = 0xFF & ((crc << 1) ^ polynomial)
+            else:
+                crc = 0xFF & (crc << 1)
+    return crc ^ final_xor
+
+
+class TestCrc8(unittest.TestCase):
+
+    _data = bytes(range(0, 256, 7)) + b"\x00\xFF\x80\x01"
+
+    def test_docstring_examples(self):
+        self.assertEqual(0x87, crc8(b"\x01\x02\x03", 0x31, 0xFF))
+        self.assertEqual(0x52, crc8(bytes(range(10)), 0x31, 0xFF))
+
+    def test_table_matches_bitwise(self):
+        for polynomial in (0x07, 0x31, 0x1D, 0x9B, 0xD5):
+            for init_value in (0x00, 0xFF, 0x5A):
+                for final_xor in (0x00, 0xFF):
+                    with self.subTest(poly=polynomial, init=init_value, xor=final_xor):
+                        self.assertEqual(crc8_bitwise(self._data, polynomial, init_value, final_xor),
+                                         crc8(self._data, polynomial, init_value, final_xor))
+
+    def test_table_is_cached(self):
+        table = get_table(0x31)
+        self.assertEqual(256, len(table))
+        self.assertIs(table, get_table(0x31))
+        for value in range(256):
+            self.assertEqual(crc8_bitwise((value,), 0x31), table[value])
+
+    def test_sequence_types(self):
+        data = self._data
+        expected = crc8_bitwise(data, 0x31, 0xFF)
+        self.assertEqual(expected, crc8(bytearray(data), 0x31, 0xFF))
+        self.assertEqual(expected, crc8(memoryview(data), 0x31, 0xFF))
+        self.assertEqual(expected, crc8(list(data), 0x31, 0xFF))
+        self.assertEqual(0xFF, crc8(b"", 0x31, 0xFF))
+
+    def test_incremental_equals_whole(self):
+        data = self._data
+        crc = Crc8(0x31, 0xFF, 0x0F)
+        crc.update(data[:5])
+        crc.update(memoryview(data)[5:20])
+        crc.update(list(data[20:]))
+        self.assertEqual(crc8(data, 0x31, 0xFF, 0x0F), crc.get_value())
+        crc.reset()
+        crc.update(b"\x01\x02\x03")
+        self.assertEqual(0x87 ^ 0x0F, crc.get_value())
+
+
+if __name__ == "__main__":
+    unittest.main()
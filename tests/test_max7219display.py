@@ -0,0 +1,98 @@
+"""Тесты MAX7219Display с B-кодом (max7219display.py). Запуск под CPython: python -m pytest tests"""
+
+# MIT license
+
+import unittest
+import host_compat
+
+host_compat.install(real_sleep=False)
+
+from machine import SPI, Pin
+from sensor_pack_2.bus_service import SpiAdapter
+from lib_displays.max7219mod import MAX7219, MAX7219Chain
+from lib_displays.max7219display import MAX7219Display
+
+
+def chip_registers(log, count: int) -> list:
+    """Восстанавливает регистры микросхем каскада по журналу шины. Возвращает список bytearray(16) по микросхемам."""
+    regs = [bytearray(16) for _ in range(count)]
+    for buf in log:
+        buf = bytes(buf)
+        for chip in range(count):
+            offs = 2 * (count - 1 - chip)
+            command, value = buf[offs], buf[offs + 1]
+            if command:
+                regs[chip][command] = value
+    return regs
+
+
+def is_blank(regs: list, columns: int) -> bool:
+    """Возвращает Истина, если все знакоместа погашены (без учета десятичной точки)."""
+    for x in range(columns):
+        chip_regs = regs[x // 8]
+        digit = x % 8
+        value = chip_regs[MAX7219.cmd_digit_0 + digit]
+        if chip_regs[MAX7219.cmd_decode_mode] & (1 << digit):
+            if 0x0F != value & 0x0F:
+                return False
+        elif value & 0x7F:
+            return False
+    return True
+
+
+class TestMAX7219DisplayCodeB(unittest.TestCase):
+
+    def _make(self, chips: int = 1, columns: int = 8):
+        spi = SPI(1)
+        if 1 == chips:
+            controller = MAX7219(SpiAdapter(spi), Pin(5))
+        else:
+            controller = MAX7219Chain(SpiAdapter(spi), Pin(5), chips)
+        controller.init(columns=columns, rows=1)
+        display = MAX7219Display(controller)
+        display.init()
+        return display, controller, spi
+
+    def test_numeric_uses_code_b(self):
+        display, controller, spi = self._make()
+        display.show_by_pos("12.345678")
+        self.assertEqual(0xFF, controller.get_decode())
+        regs = chip_registers(spi.log, 1)[0]
+        # обратный порядок индексов: знакоместо 8 - крайнее левое
+        self.assertEqual(0x01, regs[8])
+        self.assertEqual(0x82, regs[7])
+
+    def test_inverse_logic_disables_code_b(self):
+        display, controller, spi = self._make()
+        display.set_inverse_logic(True)
+        display.show_by_pos("12AB")
+        self.assertEqual(0x00, controller.get_decode())
+        code = display.get_char_code('1')
+        # segments_to_raw учитывает инверсную логику
+        self.assertEqual(0xFF & ~0x30, code)
+        self.assertEqual(display.segments_to_raw("bc"), code)
+        self.assertFalse(code & 0x100)
+        regs = chip_registers(spi.log, 1)[0]
+        self.assertEqual(code, regs[8])
+
+    def test_chain_partial_last_chip_clear(self):
+        display, controller, spi = self._make(chips=2, columns=12)
+        display.show_by_pos("123456789012")
+        display.show_by_pos("A23456789012")
+        display.clear()
+        self.assertTrue(is_blank(chip_registers(spi.log, 2), 12))
+        display.show_by_pos("    ")
+        self.assertTrue(is_blank(chip_registers(spi.log, 2), 12))
+
+    def test_chain_shared_digit_falls_back_to_segments(self):
+        display, controller, spi = self._make(chips=2, columns=12)
+        display.show_by_pos("A23456789012")
+        regs = chip_registers(spi.log, 2)
+        # знакоместо 11 (микросхема 1, разряд 3) не B-код, поэтому разряд 3 микросхемы 0 ('9') передается сегментами
+        self.assertFalse(controller.get_decode() & (1 << 3))
+        self.assertEqual(display.segments_to_raw("abcdfg"), regs[0][MAX7219.cmd_digit_0 + 3])
+        self.assertTrue(controller.get_decode() & (1 << 4))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,77 @@
+"""Тесты контроллеров MAX7219 и MAX7219Chain (max7219mod.py). Запуск под CPython: python -m pytest tests"""
+
+# MIT license
+
+import unittest
+import host_compat
+
+host_compat.install(real_sleep=False)
+
+from machine import SPI, Pin
+from sensor_pack_2.bus_service import SpiAdapter, BusStats
+from lib_displays.max7219mod import MAX7219, MAX7219Chain
+from test_max7219display import chip_registers
+
+
+class TestMAX7219ChainFill(unittest.TestCase):
+
+    def test_fill_partial_last_chip(self):
+        spi = SPI(1)
+        chain = MAX7219Chain(SpiAdapter(spi), Pin(5), 2)
+        chain.init(columns=12, rows=1)
+        spi.reset()
+        chain.fill(0x7F)
+        self.assertEqual(8, len(spi.log))
+        first, last = chip_registers(spi.log, 2)
+        for digit in range(8):
+            self.assertEqual(0x7F, first[MAX7219.cmd_digit_0 + digit])
+        # знакоместа 12..15 не используются и не записываются
+        for digit in range(8):
+            self.assertEqual(0x7F if digit < 4 else 0, last[MAX7219.cmd_digit_0 + digit])
+
+    def test_fill_full_chain(self):
+        spi = SPI(1)
+        chain = MAX7219Chain(SpiAdapter(spi), Pin(5), 2)
+        chain.init()
+        spi.reset()
+        chain.fill(0x01)
+        for regs in chip_registers(spi.log, 2):
+            self.assertEqual(b"\x01" * 8, bytes(regs[MAX7219.cmd_digit_0:MAX7219.cmd_digit_0 + 8]))
+
+
+class TestMAX7219Frame(unittest.TestCase):
+
+    def _make(self, columns: int):
+        spi = SPI(1)
+        adapter = SpiAdapter(spi)
+        controller = MAX7219(adapter, Pin(5))
+        controller.init(columns=columns, rows=1)
+        stats = BusStats()
+        adapter.set_stats(stats)
+        spi.reset()
+        return controller, spi, stats
+
+    def test_set_frame_one_transaction(self):
+        controller, spi, stats = self._make(8)
+        codes = bytes((0x01, 0x12, 0x23, 0x34, 0x45, 0x56, 0x67, 0x78))
+        controller.set_frame(codes)
+        regs = chip_registers(spi.log, 1)[0]
+        self.assertEqual(codes, bytes(regs[MAX7219.cmd_digit_0:MAX7219.cmd_digit_0 + 8]))
+        self.assertEqual((1, 16), stats.snapshot()[controller._cs][:2])
+
+    def test_set_frame_masks_codes(self):
+        controller, spi, stats = self._make(3)
+        controller.set_frame((0x1FF, 0x100, 0x42))
+        self.assertEqual([b"\x01\xFF", b"\x02\x00", b"\x03\x42"], spi.log)
+        with self.assertRaises(ValueError):
+            controller.set_frame(b"\x00\x00")
+
+    def test_set_span(self):
+        controller, spi, stats = self._make(8)
+        controller.set_span(b"\x0A\x0B", 5)
+        self.assertEqual([b"\x06\x0A", b"\x07\x0B"], spi.log)
+        with self.assertRaises(ValueError):
+            controller.set_span(b"\x0A\x0B", 7)
+
+if __name__ == "__main__":
+    unittest.main()
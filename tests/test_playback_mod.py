@@ -0,0 +1,81 @@
+"""Тесты воспроизведения по шагам: Playback, Marquee, Animation. Запуск под CPython: python -m pytest tests"""
+
+# MIT license
+
+import unittest
+import host_compat
+
+host_compat.install(real_sleep=False)
+
+from machine import SPI, Pin
+from sensor_pack_2.bus_service import SpiAdapter
+from lib_displays.max7219mod import MAX7219
+from lib_displays.max7219display import MAX7219Display
+from lib_displays.playback_mod import Playback
+from lib_displays.marquee_mod import Marquee
+from lib_displays.animation_mod import Animation, ANIM_ONE_SHOT, ANIM_PING_PONG
+
+
+def make_display() -> MAX7219Display:
+    controller = MAX7219(SpiAdapter(SPI(1)), Pin(5))
+    controller.init(columns=4, rows=1)
+    display = MAX7219Display(controller, code_b=False)
+    display.init()
+    return display
+
+
+class TestPlayback(unittest.TestCase):
+
+    def setUp(self):
+        self.display = make_display()
+
+    def test_update_respects_period(self):
+        for player in (Marquee(self.display, "HELP", period_ms=60_000),
+                       Animation(self.display, ("1", "2"), period_ms=60_000)):
+            self.assertIsInstance(player, Playback)
+            self.assertEqual(60_000, player.get_period_ms())
+            self.assertTrue(player.update())
+            self.assertFalse(player.update())
+            # после reset шаг выполняется сразу
+            player.reset()
+            self.assertTrue(player.update())
+
+    def test_run_steps(self):
+        anim = Animation(self.display, ("1", "2", "3"), period_ms=0, mode=ANIM_PING_PONG)
+        anim.run(2)
+        self.assertEqual(0, anim.get_position())
+        anim = Animation(self.display, ("1", "2", "3"), period_ms=0, mode=ANIM_ONE_SHOT)
+        anim.run(5)
+        self.assertTrue(anim.is_done())
+        self.assertFalse(anim.update())
+        marquee = Marquee(self.display, "AB", period_ms=0)
+        marquee.run(1)
+        self.assertEqual(0, marquee.get_position())
+
+
+class TestMarquee(unittest.TestCase):
+
+    def setUp(self):
+        self.display = make_display()
+
+    def test_display_entry_point(self):
+        marquee = self.display.marquee("AB", step=2, period_ms=0, gap=4)
+        self.assertIsInstance(marquee, Marquee)
+        self.assertEqual(0, marquee.get_period_ms())
+        self.assertEqual(3, marquee.get_steps_per_pass())
+
+    def test_empty_strip_position_stays(self):
+        marquee = Marquee(self.display, "", period_ms=0, gap=0)
+        for _ in range(10):
+            self.assertTrue(marquee.step())
+        self.assertEqual(0, marquee.get_position())
+
+    def test_wrap_position_in_cycle(self):
+        # длина цикла 3 (1 пустое знакоместо + "AB"), шаг больше цикла
+        marquee = Marquee(self.display, "AB", step=5, period_ms=0, gap=1)
+        for _ in range(10):
+            self.assertTrue(marquee.step())
+            self.assertLess(marquee.get_position(), 3)
+
+if __name__ == "__main__":
+    unittest.main()
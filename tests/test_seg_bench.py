@@ -0,0 +1,55 @@
+"""Тесты seg_bench: счетные шины и сравнение результатов с базовыми. Запуск под CPython: python -m pytest tests"""
+
+# MIT license
+
+import unittest
+import host_compat
+
+host_compat.install(real_sleep=False)
+
+from machine import I2C
+import seg_bench
+
+
+class TestFindRegressions(unittest.TestCase):
+
+    base = {"d": {"us_per_frame": 10.0, "bytes_per_frame": 0.3, "transactions_per_frame": 1.0,
+                  "alloc_per_frame": None}}
+
+    def _current(self, **values):
+        current = dict(TestFindRegressions.base["d"])
+        current.update(values)
+        return current
+
+    def test_float_noise_is_not_regression(self):
+        current = self._current(bytes_per_frame=0.1 + 0.2, us_per_frame=10.5)
+        self.assertEqual([], seg_bench.find_regressions("d", current, TestFindRegressions.base))
+
+    def test_regressions(self):
+        current = self._current(transactions_per_frame=1.01, us_per_frame=11.5)
+        self.assertEqual(2, len(seg_bench.find_regressions("d", current, TestFindRegressions.base)))
+
+    def test_alloc_not_measured_on_cpython(self):
+        self.assertIsNone(seg_bench.bench_alloc(None, None, 1))
+
+
+class TestBenchBuses(unittest.TestCase):
+
+    def test_buses_count_without_log(self):
+        for name, display, bus, controller in seg_bench.make_benches():
+            with self.subTest(name=name):
+                res = seg_bench.bench_one(display, bus, controller, 20)
+                self.assertEqual([], bus.log)
+                self.assertGreater(res["bytes_per_frame"], 0)
+                self.assertGreater(res["transactions_per_frame"], 0)
+
+    def test_i2c_bytes_counted_alike(self):
+        # адрес памяти учитывается одинаково: в буфере writeto и параметром writeto_mem
+        i2c = I2C(0, record=False)
+        i2c.writeto(0x70, b"\x02\xAA\xBB")
+        i2c.writeto_mem(0x70, 0x02, b"\xAA\xBB")
+        i2c.writevto(0x70, (b"\x02", b"\xAA\xBB"))
+        self.assertEqual((3, 9), (i2c.transactions, i2c.bytes))
+
+if __name__ == "__main__":
+    unittest.main()
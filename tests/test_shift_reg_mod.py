@@ -0,0 +1,97 @@
+"""Тесты SPLReg8Mux (shift_reg_mod.py). Запуск под CPython: python -m pytest tests"""
+
+# MIT license
+
+import unittest
+import host_compat
+
+host_compat.install(real_sleep=False)
+
+from machine import SPI, Pin, Timer
+from sensor_pack_2.bus_service import SpiAdapter, BusStats
+from lib_displays.shift_reg_mod import SPLReg8Mux
+
+
+class TestSPLReg8MuxBrightness(unittest.TestCase):
+
+    def _make(self, digit_pins=None, duty_steps: int = 4):
+        spi = SPI(1)
+        mux = SPLReg8Mux(SpiAdapter(spi), Pin(5), digit_pins=digit_pins, duty_steps=duty_steps)
+        mux.init(columns=4, rows=1)
+        mux.set_all(b"\xff\xff\xff\xff")
+        return mux, spi
+
+    def test_zero_brightness_select_register(self):
+        mux, spi = self._make()
+        mux.set_brightness(0)
+        timer = Timer(0)
+        mux.start(timer)
+        spi.reset()
+        timer.fire(4 * 4 * 3)
+        # ни одно знакоместо не выбрано ни в одном переданном кадре
+        self.assertTrue(spi.log)
+        for frame in spi.log:
+            self.assertEqual(0x00, bytes(frame)[1])
+
+    def test_zero_brightness_digit_pins(self):
+        pins = tuple(Pin(10 + i) for i in range(4))
+        mux, spi = self._make(digit_pins=pins)
+        mux.set_brightness(0)
+        timer = Timer(0)
+        mux.start(timer)
+        for pin in pins:
+            pin.log.clear()
+        timer.fire(4 * 4 * 3)
+        for pin in pins:
+            self.assertNotIn(1, pin.log)
+
+    def test_full_brightness_lights_every_digit(self):
+        mux, spi = self._make()
+        timer = Timer(0)
+        mux.start(timer)
+        spi.reset()
+        timer.fire(4 * 4)
+        selected = {bytes(frame)[1] for frame in spi.log}
+        self.assertEqual({1, 2, 4, 8}, selected)
+
+
+class TestSPLReg8MuxScan(unittest.TestCase):
+
+    def test_isr_bypasses_stats(self):
+        spi = SPI(1)
+        adapter = SpiAdapter(spi)
+        stats = BusStats()
+        adapter.set_stats(stats)
+        latch = Pin(5)
+        mux = SPLReg8Mux(adapter, latch)
+        mux.init(columns=4, rows=1)
+        timer = Timer(0)
+        mux.start(timer)
+        latch.log.clear()
+        timer.fire(8)
+        self.assertEqual(8, len(spi.log))
+        self.assertEqual({}, stats.snapshot())
+        # импульс загрузки на каждый кадр
+        self.assertEqual([0, 1] * 8, list(latch.log))
+
+    def test_blank_from_custom_select_codes(self):
+        spi = SPI(1)
+        # активный уровень - единица, старший бит выхода регистра всегда в единице
+        mux = SPLReg8Mux(SpiAdapter(spi), Pin(5), digit_select_codes=b"\x81\x82\x84\x88", duty_steps=2)
+        mux.init(columns=4, rows=1)
+        mux.set_brightness(1)
+        timer = Timer(0)
+        mux.start(timer)
+        spi.reset()
+        timer.fire(2)
+        self.assertEqual(0x80, bytes(spi.log[1])[1])
+        mux = SPLReg8Mux(SpiAdapter(spi), Pin(5), digit_select_codes=b"\x0E\x0D\x0B\x07")
+        mux.init(columns=4, rows=1)
+        mux.start(timer)
+        spi.reset()
+        mux.stop()
+        self.assertEqual(0x0F, bytes(spi.log[0])[1])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,78 @@
+"""Тесты передачи команд TM1652 (TM1652mod.py). Запуск под CPython: python -m pytest tests"""
+
+# MIT license
+
+import unittest
+import host_compat
+
+host_compat.install(real_sleep=False)
+
+from machine import UART
+from lib_displays.TM1652mod import TM1652
+from lib_displays.tm1652display import WADigitalTube
+from lib_displays.async_display_mod import AsyncCharDisplay
+
+
+
+class TestTM1652Pacing(unittest.TestCase):
+
+    def _make(self, deferred: bool):
+        uart = UART(1)
+        controller = TM1652(uart, delay_ms=2, deferred=deferred)
+        controller.init(columns=4, rows=1)
+        uart.reset()
+        return controller, uart
+
+    def test_default_delivers_immediately(self):
+        controller, uart = self._make(deferred=False)
+        # команда сразу после init поступает во время паузы, но не откладывается
+        controller.set_all(b"\x01\x02\x03\x04")
+        self.assertEqual([b"\x08\x01\x02\x03\x04"], uart.log)
+        self.assertFalse(controller.poll())
+
+    def test_deferred_keeps_order_digits_first(self):
+        controller, uart = self._make(deferred=True)
+        controller.set_all(b"\x01\x02\x03\x04")
+        controller.set_brightness(7)
+        self.assertEqual([], uart.log)
+        controller.flush_pending()
+        self.assertEqual(0x08, uart.log[0][0])
+        self.assertEqual(0x18, uart.log[1][0])
+
+    def test_deferred_keeps_order_brightness_first(self):
+        controller, uart = self._make(deferred=True)
+        controller.set_brightness(7)
+        controller.set_all(b"\x01\x02\x03\x04")
+        controller.flush_pending()
+        self.assertEqual([0x18, 0x08], [buf[0] for buf in uart.log])
+
+    def test_deferred_cancelled_brightness_keeps_order(self):
+        controller, uart = self._make(deferred=True)
+        controller.set_brightness(7)
+        controller.set_all(b"\x01\x02\x03\x04")
+        # возврат к переданной ранее яркости отменяет отложенную команду
+        controller.set_brightness(3)
+        controller.set_brightness(6)
+        controller.flush_pending()
+        self.assertEqual([0x08, 0x18], [buf[0] for buf in uart.log])
+
+    def test_init_coalesces_brightness(self):
+        uart = UART(1)
+        controller = TM1652(uart, delay_ms=2)
+        # конструктор ничего не передает: сброс передается один раз, в init
+        self.assertEqual([], uart.log)
+        controller.init(columns=4, rows=1)
+        # сброс и одна команда яркости/включения
+        self.assertEqual([0x01, 0x18], [buf[0] for buf in uart.log])
+        self.assertFalse(controller.is_deferred())
+
+    def test_async_wrapper_enables_deferred(self):
+        controller, uart = self._make(deferred=False)
+        tube = WADigitalTube(controller)
+        tube.init()
+        AsyncCharDisplay(tube)
+        self.assertTrue(controller.is_deferred())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,72 @@
+"""Тесты менеджера дисплеев VK16K33 на одной шине (vk16k33bus_mod.py). Запуск под CPython: python -m pytest tests"""
+
+# MIT license
+
+import unittest
+import host_compat
+
+host_compat.install(real_sleep=False)
+
+from machine import I2C
+from sensor_pack_2.bus_service import I2cAdapter
+from lib_displays.vk16k33bus_mod import VK16K33Bus
+
+
+class TestVK16K33Bus(unittest.TestCase):
+
+    def _make(self, budget_us: int = None):
+        i2c = I2C(0)
+        bus = VK16K33Bus(I2cAdapter(bus=i2c), budget_us=budget_us, bus_freq=100_000)
+        first = bus.add(0x70, "en")
+        second = bus.add(0x71, "en")
+        first.show_by_pos("ABCD")
+        second.show_by_pos("ABCD")
+        bus.flush(budget_us=10_000)
+        i2c.reset()
+        return bus, first, second, i2c
+
+    def test_output_is_deferred(self):
+        bus, first, second, i2c = self._make()
+        first.show_by_pos("ABCE")
+        self.assertEqual([], i2c.log)
+        self.assertTrue(bus.is_dirty())
+        self.assertEqual(1, bus.flush())
+        self.assertFalse(bus.is_dirty())
+
+    def test_only_changed_span_sent(self):
+        bus, first, second, i2c = self._make()
+        self.assertTrue(first.is_partial_update())
+        first.show_by_pos("AXYD")
+        bus.flush()
+        # адрес памяти знакоместа 1 и два 16-ти битных кода
+        self.assertEqual(1, len(i2c.log))
+        addr, data = i2c.log[0]
+        self.assertEqual((0x70, 5, 2), (addr, len(data), data[0]))
+
+    def test_estimate_counts_span_bytes(self):
+        bus, first, second, i2c = self._make()
+        self.assertEqual(0, bus.estimate_us(first))
+        first.show_by_pos("AXCD")
+        # 4 байта: адрес устройства, адрес памяти, код знакоместа; 9 тактов на байт при 100 кГц
+        self.assertEqual(360, bus.estimate_us(first))
+        first.show_by_pos("XXCX")
+        self.assertEqual(90 * (2 * 2 + 2 * 3), bus.estimate_us(first))
+        first.invalidate()
+        self.assertEqual(90 * (2 + 2 * 4), bus.estimate_us(first))
+
+    def test_budget_fits_small_changes(self):
+        bus, first, second, i2c = self._make(budget_us=800)
+        first.show_by_pos("XBCD")
+        second.show_by_pos("XBCD")
+        # по 360 мкс на дисплей: оба кадра укладываются в бюджет
+        self.assertEqual(2, bus.flush())
+        first.show_by_pos("WXYZ")
+        second.show_by_pos("WXYZ")
+        # по 900 мкс на дисплей: второй кадр передается следующим вызовом
+        self.assertEqual(1, bus.flush())
+        self.assertEqual(1, bus.flush())
+        self.assertFalse(bus.is_dirty())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,67 @@
+"""Тесты таблиц кодов символов VK16K33Display (vk16k33display.py). Запуск под CPython: python -m pytest tests"""
+
+# MIT license
+
+import unittest
+import host_compat
+
+host_compat.install(real_sleep=False)
+
+from machine import I2C
+from sensor_pack_2.bus_service import I2cAdapter
+from lib_displays.vk16k33mod import VK16K33
+from lib_displays.vk16k33display import VK16K33Display
+from lib_displays.alphabet_mod import get_alphabet
+
+
+class TestLetterSourcesOrder(unittest.TestCase):
+
+    # 'A' есть и в алфавите 'en', и в словаре; 'y' - только в словаре
+    letters = {'A': "abc", 'y': "ad"}
+
+    def _make(self, alpha_letters) -> VK16K33Display:
+        controller = VK16K33(adapter=I2cAdapter(bus=I2C(0)), address=0x70)
+        controller.init(columns=4, rows=1)
+        display = VK16K33Display(controller, alpha_letters)
+        display.init()
+        return display
+
+    def test_dict_first(self):
+        display = self._make((TestLetterSourcesOrder.letters, "en"))
+        expected = display.segments_to_raw("abc")
+        self.assertEqual(expected, display.get_char_code('A'))
+        self.assertEqual(display.segments_to_raw("abcp"), display.get_char_code('A', True))
+        self.assertEqual(expected, display._ascii_codes[ord('A')])
+
+    def test_alphabet_first(self):
+        display = self._make(("en", TestLetterSourcesOrder.letters))
+        expected = get_alphabet("en").get_code('A')
+        self.assertEqual(expected, display.get_char_code('A'))
+        self.assertEqual(expected, display._ascii_codes[ord('A')])
+        # буква, которой нет в алфавите, берется из словаря
+        self.assertEqual(display.segments_to_raw("ad"), display.get_char_code('y'))
+
+    def test_segments_of_symbol_follow_sources_order(self):
+        for alpha_letters in ((TestLetterSourcesOrder.letters, "en"), ("en", TestLetterSourcesOrder.letters)):
+            display = self._make(alpha_letters)
+            for char in "Ayb":
+                self.assertEqual(display.get_char_code(char),
+                                 display.segments_to_raw(display.get_segments_of_symbol(char)))
+            self.assertEqual(display.get_non_printable(), display.get_segments_of_symbol('Ж'))
+
+
+class TestControllerSpan(unittest.TestCase):
+
+    def test_set_span_one_packet(self):
+        i2c = I2C(0)
+        controller = VK16K33(adapter=I2cAdapter(bus=i2c), address=0x70, big_byte_order=True)
+        controller.init(columns=4, rows=1)
+        i2c.reset()
+        controller.set_span((0x1234, 0x5678), 1)
+        controller.set_span((0x0A0B,), 3)
+        self.assertEqual([(0x70, b"\x02\x12\x34\x56\x78"), (0x70, b"\x06\x0A\x0B")], i2c.log)
+        with self.assertRaises(ValueError):
+            controller.set_span((0, 0), 3)
+
+if __name__ == "__main__":
+    unittest.main()
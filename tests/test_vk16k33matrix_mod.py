@@ -0,0 +1,59 @@
+"""Тесты светодиодной матрицы VK16K33Matrix (vk16k33matrix_mod.py). Запуск под CPython: python -m pytest tests"""
+
+# MIT license
+
+import unittest
+import host_compat
+
+host_compat.install(real_sleep=False)
+
+from machine import I2C
+from sensor_pack_2.bus_service import I2cAdapter
+from lib_displays.vk16k33matrix_mod import VK16K33Matrix
+
+
+def display_ram(log) -> bytearray:
+    """Моделирует память дисплея по журналу шины: записи, начинающиеся с адреса 0..15."""
+    ram = bytearray(16)
+    for _, data in log:
+        first = data[0]
+        if first < 16 and len(data) > 1:
+            ram[first:first + len(data) - 1] = data[1:]
+    return ram
+
+
+class TestVK16K33MatrixCharMethods(unittest.TestCase):
+
+    def setUp(self):
+        self.i2c = I2C(0)
+        self.matrix = VK16K33Matrix(I2cAdapter(bus=self.i2c), width=16, height=8)
+        self.matrix.init()
+
+    def test_columns_is_ram_words(self):
+        self.assertEqual(8, self.matrix.get_columns())
+
+    def test_set_span_full_width(self):
+        self.matrix.set_span([0x1234] * 8, 0)
+        ram = display_ram(self.i2c.log)
+        self.assertEqual(bytes(self.matrix._ram), bytes(ram))
+        self.assertEqual(bytes((0x34, 0x12)) * 8, bytes(ram))
+        with self.assertRaises(ValueError):
+            self.matrix.set_span([0] * 9, 0)
+
+    def test_char_methods_keep_shadow(self):
+        self.matrix.set_char(0xFFFF, 2)
+        self.assertFalse(self.matrix.is_dirty())
+        self.assertEqual(1, self.matrix.get_framebuf().pixel(15, 2))
+        # точка на другой строке: передается только строка 0
+        self.i2c.reset()
+        self.matrix.get_framebuf().pixel(0, 0, 1)
+        self.assertTrue(self.matrix.show())
+        self.assertEqual([(0x70, b"\x00\x01\x00")], self.i2c.log)
+        self.matrix.fill(0)
+        self.assertFalse(self.matrix.is_dirty())
+        self.assertEqual(bytes(16), bytes(display_ram(self.i2c.log)))
+        self.assertEqual(0, self.matrix.get_framebuf().pixel(0, 2))
+
+
+if __name__ == "__main__":
+    unittest.main()
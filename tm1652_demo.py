@@ -28,19 +28,26 @@ def four_seg_to_str(source: four_seg_t, leading_zero: bool = True) -> str:
     _seg_0 = ' ' if 0 == source.seg_0 and not leading_zero else source.seg_0
     return f"{_seg_0}{source.seg_1}{dp}{source.seg_2}{source.seg_3}"
 
+def idle_ms(controller: TM1652, ms: int):
+    """Пауза ms мс, во время которой передаются отложенные команды контроллера (режим deferred)."""
+    deadline = time.ticks_add(time.ticks_ms(), ms)
+    while time.ticks_diff(deadline, time.ticks_ms()) > 0:
+        controller.poll()
+        time.sleep_ms(1)
+
 if __name__ == "__main__":
     # не забывайте про параметр конструктора tx!!!
     # вывод платы tx вы должны подключить к ВХоду дисплея RX!!!
     # и питание +5 V, GND! Преобразователь уровня не нужен!
     uart = UART(0, baudrate=19200, bits=8, parity=1, stop=1, tx=Pin(16))
-    controller = TM1652(uart=uart, delay_ms=7)
+    controller = TM1652(uart=uart, delay_ms=7, deferred=True)
     controller.init(columns=4, rows=1)
     tube = WADigitalTube(controller)
     tube.init()
     tube.show_by_pos('Erro')
-    time.sleep_ms(3_000)
+    idle_ms(controller, 3_000)
     tube.clear()
-    time.sleep_ms(2_000)
+    idle_ms(controller, 2_000)
     # отображение местного времени на дисплее
     for _ in range(100):
         t = time.localtime()
@@ -48,7 +55,7 @@ if __name__ == "__main__":
         dd = get_display_digits(l3, 0)
         fs = four_seg_to_str(dd, False)
         tube.show_by_pos(fs)
-        time.sleep_ms(1000)
+        idle_ms(controller, 1000)
 
 
 